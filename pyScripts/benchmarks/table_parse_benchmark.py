@@ -0,0 +1,55 @@
+"""
+Table Parse Benchmark
+
+This script times parsing of `lsblk`-style text into a `Table`,
+comparing the whitespace-profile parser with the per-cell boundary
+search it falls back on.
+
+Usage:
+    python benchmarks/table_parse_benchmark.py [--lines N] [--repeat N]
+"""
+# Standard library imports
+from argparse import ArgumentParser
+from timeit import repeat
+
+# Local module import
+from modules import Table
+
+
+class CellTable(Table):
+    """A `Table` that always finds the boundaries of each cell."""
+    def _fnd_col_spns(self, lines, keys, pos_lst):
+        return None
+
+
+def make_table_string(line_count: int) -> str:
+    """Return `lsblk`-style text with the given number of data lines."""
+    row = "{:<11} {:>7} {:>2} {:>5} {:>2} {:<4} {}"
+    lines = [row.format("NAME", "MAJ:MIN", "RM", "SIZE", "RO", "TYPE", 
+                        "MOUNTPOINTS")]
+    for i in range(line_count):
+        lines.append(row.format(f"{'└─' if i % 4 else ''}sd{i}", 
+                                f"8:{i % 256}", i % 2, f"{i % 999 + 1}G", 0, 
+                                "part" if i % 4 else "disk", 
+                                f"/media/Disk {i}" if i % 3 else ""))
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    table_string = make_table_string(args.lines)
+    assert (Table(table_string=table_string)._cols ==
+            CellTable(table_string=table_string)._cols)
+
+    for name, cls in [("profile", Table), ("per-cell", CellTable)]:
+        best = min(repeat(lambda: cls(table_string=table_string),
+                          number=1, repeat=args.repeat))
+        print(f"{name:>8}: {best:.3f} s for {args.lines:,} lines")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Table Render Benchmark
+
+This script times rendering a `Table` to a headless console output, 
+with and without ANSI styling, so no terminal is written to.
+
+Usage:
+    python benchmarks/table_render_benchmark.py [--records N] [--repeat N]
+"""
+# Standard library imports
+from argparse import ArgumentParser
+from timeit import repeat
+
+# Local module import
+from modules import Table
+
+
+def make_table(record_count: int) -> Table:
+    """Return a table of disk-like records of the given count."""
+    return Table(table_data=[{"NAME": f"sd{i}", "VENDOR": f"Vendor {i % 7}", 
+                              "SIZE": f"{i % 999 + 1}G"} 
+                             for i in range(record_count)], 
+                 title="devices", rjust_columns="SIZE")
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    table = make_table(args.records)
+    for name, styled in [("plain", False), ("styled", True)]:
+        best = min(repeat(lambda: table.render(styled=styled), 
+                          number=1, repeat=args.repeat))
+        print(f"{name:>6}: {best:.3f} s for {args.records:,} records")
+
+
+if __name__ == "__main__":
+    main()
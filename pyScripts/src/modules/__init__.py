@@ -11,6 +11,7 @@ Modules:
 
 Classes:
     - Console: Handles console-related operations.
+    - ConsoleOutput: Directs console output to a terminal or buffer.
     - ConsolePrompt: Facilitates console-based user prompts.
     - ConsoleTable: Manages console-based table rendering.
     - Menu: Supports interactive menu creation and management.
@@ -23,12 +24,12 @@ __all__:
 from . import commands, constants, pd_utils, utilities
 
 # Importing classes
-from .console import Console, ConsolePrompt, ConsoleTable
+from .console import Console, ConsoleOutput, ConsolePrompt, ConsoleTable
 from .menu import Menu
 from .table import Table
 
 # Explicitly defining public API
 __all__ = ["commands", "constants", "pd_utils", "utilities", 
-           "Console", "ConsolePrompt", "ConsoleTable", 
+           "Console", "ConsoleOutput", "ConsolePrompt", "ConsoleTable", 
            "Menu", 
            "Table"]
@@ -13,7 +13,7 @@ Imports:
 
 Functions:
     list_block_devices: Generate and execute the `lsblk` command to list 
-        block devices with optional filters.
+        block devices with optional filters, as text or JSON.
     run_badblocks: Execute the `badblocks` command to check a disk for 
         bad sectors, with options for destructive and non-destructive 
         modes.
@@ -29,7 +29,8 @@ from modules.table import Table
 
 
 def list_block_devices(disk: str | None = None, columns: list[str] = list(), 
-                       show_dependents: bool = True) -> str:
+                       show_dependents: bool = True, as_json: bool = False
+                       ) -> str:
     """
     Generate and run the 'lsblk' command with optional filters.
 
@@ -39,17 +40,21 @@ def list_block_devices(disk: str | None = None, columns: list[str] = list(),
         columns: A list of columns to include in the output.
         show_dependents: If True, include dependent devices (e.g., 
             partitions). If False, append '--nodeps' to exclude them.
+        as_json: If True, append '--json --bytes' to output the devices 
+            as JSON, with dependents nested as 'children' and sizes in 
+            bytes, for `Table.from_json`.
 
     Returns:
         str: The output of the 'lsblk' command.
     """
     # Construct the command based on the parameters
     deps = "" if show_dependents else " --nodeps"
+    fmt = " --json --bytes" if as_json else ""
     output = "" if not columns else f" --output {','.join(columns)}"
     path = "" if disk is None else f" /dev/{disk}"
     
     # Run the constructed 'lsblk' command and return its output.
-    return run_command("lsblk" + deps + output + path)
+    return run_command("lsblk" + deps + fmt + output + path)
 
 
 def run_badblocks(disk: str, non_destructive: bool = True, 
@@ -128,11 +133,13 @@ def unmount_disk(disk: str) -> None:
         disk: The disk identifier (e.g., 'sda1').
     """
     # Get the list of mount points for the given disk using 'lsblk'
-    output = run_command(f"lsblk --output PATH,MOUNTPOINT /dev/{disk}")
+    output = list_block_devices(disk, columns=["PATH", "MOUNTPOINT"], 
+                                as_json=True)
     
     # Create a table from the output and filter to keep only non-empty 
     # mount points
-    disk_paths = Table(table_string=output)
+    disk_paths = Table.from_json(output, key="blockdevices", flatten=True, 
+                                 validate="none")
     disk_paths.filter_nonempty("MOUNTPOINT")
     
     # Unmount each disk path in the table
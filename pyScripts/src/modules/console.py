@@ -9,16 +9,35 @@ Imports:
         from __future__ import annotations: Postpones the evaluation of 
             type annotations, allowing forward references without string 
             literals.
+        from asyncio import sleep, TimeoutError, wait_for: Let 
+            prompts await keys, and time out, without blocking other 
+            tasks.
+        from contextlib import nullcontext: Stands in for the hidden 
+            cursor context of prompts that show it.
+        from io import BufferedIOBase, BytesIO, RawIOBase, StringIO: 
+            Provide the buffers output may be rendered to, and the 
+            binary stream types whose output is encoded.
+        from itertools import chain: Joins the ranges of records a 
+            search wraps around.
         from re import fullmatch: Provides support for regular 
             expressions, enabling pattern matching and text 
             manipulation.
-        from sys import stdout: Provides access to the standard output 
-            stream, used for printing to the terminal.
-        from textwrap import fill: Provides text wrapping functionality 
-            for formatting text, especially for console output.
-        from typing import Any, TYPE_CHECKING:
+        from signal import getsignal, Signals, signal: Provide the 
+            handling of terminal resizes (`SIGWINCH`).
+        from textwrap import fill, wrap: Provides text wrapping 
+            functionality for formatting text, especially for console 
+            output.
+        from threading import current_thread, main_thread: Identify 
+            the thread signal handlers may be set from.
+        from time import monotonic: Provides the clock live tables 
+            are refreshed by.
+        from typing import Any, BinaryIO, Iterable, TextIO, 
+                TYPE_CHECKING:
             Any: Represents any valid Python object type in type 
                 annotations.
+            BinaryIO: Represents a binary stream output is written to.
+            Iterable: Represents the rows streamed to a table.
+            TextIO: Represents a text stream output is written to.
             TYPE_CHECKING: Used for conditional imports to prevent 
                 circular dependencies during runtime, primarily for type 
                 checking.
@@ -26,6 +45,8 @@ Imports:
     Third-party:
         from blessed import Terminal: Manages terminal output, including 
             color handling, cursor movement, and screen clearing.
+        from blessed.keyboard import Keystroke: Represents a key read 
+            from the terminal.
     
     Local modules:
         from utilities import snake_to_camel, truncate_string
@@ -38,8 +59,10 @@ Imports:
                 type checking to avoid circular imports at runtime.
 
 Classes:
+    ConsoleOutput: The output backend rendered to, either the terminal 
+        or a text or bytes buffer.
     ConsoleBase: The base class that initiates an instance of the 
-        Terminal class.
+        Terminal class from its output backend.
     Console: A subclass of ConsoleBase, providing static methods for 
         console-related operations.
     ConsolePrompt: A subclass of ConsoleBase, responsible for handling 
@@ -51,16 +74,29 @@ Constants:
     BORDERS (dict): Defines the border characters for table layout.
     FORMATTING_ALLOCATION (dict): Defines the length of formatting
         sequences for different styles.
+    PAGER_HELP (str): The keys listed on the status line of the pager.
+    PAGER_KEYS (dict): Maps keys to the actions of the pager.
+    PROMPT_POLL (float): The seconds between polls for a key by an 
+        asynchronous prompt.
+    RENDER_CHUNK (int): The number of lines rendered before a long 
+        table is written out.
 """
 # Standard library imports
 from __future__ import annotations
+from asyncio import sleep, TimeoutError, wait_for
+from contextlib import nullcontext
+from io import BufferedIOBase, BytesIO, RawIOBase, StringIO
+from itertools import chain
 from re import fullmatch
-from sys import stdout
-from textwrap import fill
-from typing import Any, TYPE_CHECKING
+from signal import getsignal, Signals, signal
+from textwrap import fill, wrap
+from threading import current_thread, main_thread
+from time import monotonic
+from typing import Any, BinaryIO, Iterable, TextIO, TYPE_CHECKING
 
 # Third-party import
 from blessed import Terminal
+from blessed.keyboard import Keystroke
 
 # Local imports
 from .utilities import snake_to_camel, truncate_string
@@ -80,6 +116,186 @@ FORMATTING_ALLOCATION = {"blink": len("[blink][/blink]"),
                         "reverse": len("[reverse][/reverse]"), 
                         "yellow": len("[yellow][/yellow]")}
 
+PAGER_HELP = "↑↓ PgUp PgDn Home End  :row  /search  n next  q quit"
+
+PAGER_KEYS = {"KEY_DOWN": "down", "j": "down", 
+              "KEY_UP": "up", "k": "up", 
+              "KEY_PGDOWN": "page_down", " ": "page_down", 
+              "KEY_PGUP": "page_up", "b": "page_up", 
+              "KEY_HOME": "home", "g": "home", 
+              "KEY_END": "end", "G": "end", 
+              ":": "jump", "/": "search", "n": "next", 
+              "q": "quit", "KEY_ESCAPE": "quit"}
+
+PROMPT_POLL = 0.05
+
+RENDER_CHUNK = 1000
+
+
+class ConsoleOutput:
+    """
+    An output backend to which console classes render.
+
+    By default, output is written to the terminal on standard output.
+    A text or bytes buffer may be given instead, with or without ANSI
+    styling and at a fixed size, so rendered tables and prompts can be
+    captured for comparison, logged, or timed without a terminal.
+
+    Console classes share one session output for the terminal, so its 
+    capabilities are looked up once per process. The terminal size is 
+    cached, and refreshed after the terminal is resized (`SIGWINCH`).
+
+    Args:
+        stream: A text or binary stream to write to, or None for
+            standard output.
+        width: The width to render at, or None for the terminal's.
+        height: The height to render at, or None for the terminal's.
+        styled: If True, always style output; if False, never; if
+            None, style only when the stream is a terminal.
+
+    Attributes:
+        _ht: The height override.
+        _ssn: The output shared by console classes, once created.
+        _strm: The stream written to.
+        _sz: The cached height and width of the terminal, or None 
+            until next measured.
+        _trm: The Terminal object styling the output.
+        _wd: The width override.
+
+    Methods:
+        get_height: Return the height rendered to.
+        get_terminal: Return the Terminal styling the output.
+        get_value: Return the contents of a buffer written to.
+        get_width: Return the width rendered to.
+        headless: Create an output rendering to a string buffer.
+        refresh_size: Measure the terminal again on next use.
+        session: Return the output shared by console classes.
+        write: Write text to the stream.
+        _get_sz: Return the cached terminal size, measuring it if due.
+        _hndl_rsz: Refresh the size when the terminal is resized.
+    """
+    _ssn: ConsoleOutput | None = None
+
+    def __init__(self, stream: TextIO | BinaryIO | None = None,
+                 width: int | None = None, height: int | None = None,
+                 styled: bool | None = None) -> None:
+        # Type validation
+        for name, size in [("width", width), ("height", height)]:
+            if size is not None and (not isinstance(size, int)
+                                     or isinstance(size, bool)):
+                raise TypeError(f"Expected `int` or `None` for '{name}'")
+            if size is not None and size < 1:
+                raise ValueError(f"The '{name}' must be positive")
+        if styled is not None and not isinstance(styled, bool):
+            raise TypeError("Expected `bool` or `None` for 'styled'")
+
+        # Attribute assignment; blessed never styles when forced `None`
+        self._strm = stream
+        self._wd = width
+        self._ht = height
+        self._sz = None
+        self._trm = Terminal(stream=stream,
+                             force_styling={None: False, True: True,
+                                            False: None}[styled])
+
+    # Public Methods
+    def get_height(self) -> int:
+        """Return the height override, or else the terminal's."""
+        return self._ht or self._get_sz()[0]
+
+    def get_terminal(self) -> Terminal:
+        """Return the Terminal styling the output."""
+        return self._trm
+
+    def get_value(self) -> str | bytes:
+        """
+        Return the contents of a buffer written to.
+
+        Raises:
+            TypeError: If the stream is not a `StringIO` or `BytesIO`.
+        """
+        if not isinstance(self._strm, (StringIO, BytesIO)):
+            raise TypeError("Expected `StringIO` or `BytesIO` stream")
+        return self._strm.getvalue()
+
+    def get_width(self) -> int:
+        """Return the width override, or else the terminal's."""
+        return self._wd or self._get_sz()[1]
+
+    @classmethod
+    def headless(cls, width: int = 79, height: int = 24,
+                 styled: bool = False) -> ConsoleOutput:
+        """
+        Create an output rendering to a string buffer.
+
+        Args:
+            width: The width to render at.
+            height: The height to render at.
+            styled: If True, include ANSI styling.
+
+        Returns:
+            A ConsoleOutput whose rendering `get_value` returns.
+        """
+        return cls(StringIO(), width=width, height=height, styled=styled)
+
+    def refresh_size(self) -> None:
+        """Measure the terminal size again when next used."""
+        self._sz = None
+
+    @classmethod
+    def session(cls) -> ConsoleOutput:
+        """
+        Return the output shared by console classes.
+
+        The session is created on first use, writing to standard output 
+        and refreshing its size whenever the terminal is resized.
+
+        Returns:
+            The ConsoleOutput for the terminal.
+        """
+        if cls._ssn is None:
+            cls._ssn = cls()
+            cls._ssn._hndl_rsz()
+        return cls._ssn
+
+    def write(self, text: str, flush: bool = False) -> None:
+        """
+        Write text to the stream, encoded if the stream is binary.
+
+        Args:
+            text: The text to write.
+            flush: If True, flush the stream after writing.
+        """
+        if isinstance(self._strm, (BufferedIOBase, RawIOBase)):
+            self._strm.write(text.encode("utf-8"))
+            if flush: self._strm.flush()
+        else:
+            print(text, end="", file=self._strm, flush=flush)
+
+    # Private Methods
+    def _get_sz(self) -> tuple[int, int]:
+        """Return the terminal height and width, measured if due."""
+        if self._sz is None: self._sz = (self._trm.height, self._trm.width)
+        return self._sz
+
+    def _hndl_rsz(self) -> None:
+        """
+        Refresh the size when the terminal is resized.
+
+        The `SIGWINCH` handler only marks the size for measuring, then 
+        calls any handler it replaced. Signals are handled in the main 
+        thread only, and not on platforms without `SIGWINCH`.
+        """
+        sig = getattr(Signals, "SIGWINCH", None)
+        if sig is None or current_thread() is not main_thread(): return
+        prev = getsignal(sig)
+
+        def handler(signum: int, frame: Any) -> None:
+            self.refresh_size()
+            if callable(prev): prev(signum, frame)
+
+        signal(sig, handler)
+
 
 class ConsoleBase:
     """
@@ -90,11 +306,32 @@ class ConsoleBase:
     functionality for handling prompts, user input, and output 
     formatting.
 
+    Args:
+        output: The backend rendered to, or None for the terminal 
+            session shared by console classes.
+
     Attributes:
+        _out: The ConsoleOutput rendered to.
         _trm: The Terminal object used for interacting with the console.
+
+    Methods:
+        _get_ht: Return the height rendered to.
+        _get_wd: Return the width rendered to.
     """
-    def __init__(self):
-        self._trm = Terminal()
+    def __init__(self, output: ConsoleOutput | None = None):
+        if output is not None and not isinstance(output, ConsoleOutput):
+            raise TypeError("Expected `ConsoleOutput` or `None` for 'output'")
+        self._out = output or ConsoleOutput.session()
+        self._trm = self._out.get_terminal()
+
+    # Private Methods
+    def _get_ht(self) -> int:
+        """Return the height of the output."""
+        return self._out.get_height()
+
+    def _get_wd(self) -> int:
+        """Return the width of the output."""
+        return self._out.get_width()
 
 
 class Console(ConsoleBase):
@@ -125,9 +362,10 @@ class Console(ConsoleBase):
             script_name: The name of the script to be displayed in the 
                 banner.
         """
-        term = ConsoleBase()._trm
+        base = ConsoleBase()
+        term, width = base._trm, base._get_wd()
         script_name = snake_to_camel(script_name)
-        print(term.reverse(f"Running {script_name}...".ljust(term.width)))
+        print(term.reverse(f"Running {script_name}...".ljust(width)))
 
 
 class ConsolePrompt(ConsoleBase):
@@ -147,13 +385,19 @@ class ConsolePrompt(ConsoleBase):
         validate_integer: If True, validate the input as an integer.
         integer_validation: Defines integer validation criteria. Can be 
             an upper limit (int) or a range (tuple of two ints).
+        output: The backend the prompt is written to, or None for the 
+            terminal.
 
     Attributes:
         _cue: The message to display to the user.
         _e_ct: A tally of various errors until validation.
         _exp_kst: Flag indicating if a keystroke is expected.
         _int_vld: Validation criteria for integers.
+        _msk_ct: The number of keys read that are not characters.
+        _out: ConsoleOutput inherited from ConsoleBase.
+        _resp_chrs: The characters of a string response typed so far.
         _trm: blessed.Terminal inherited from ConsoleBase.
+        _user_resp: The user's response, before validation.
         _val_bool: Flag indicating if boolean validation is 
             enabled.
         _val_int: Flag indicating if integer validation is 
@@ -161,23 +405,30 @@ class ConsolePrompt(ConsoleBase):
         _vld_resp: The user's validated response.
 
     Methods:
+        acall: Prompt the user and await the validated response, or a 
+            default after a timeout.
         call: Prompt the user and return the validated response.
+        _aget_resp: Get the user's response, awaiting each key.
+        _aget_vld: Await the user's responses until one is valid.
+        _ainkey: Await a key without blocking the event loop.
         _back_n_lines: Delete and move cursor up 'n' lines.
         _chk_bool_vld: Validate the user's boolean response.
         _chk_int_vld: Validate the user's integer response.
         _get_resp: Get the user's response based on expected input type.
-        _print_msg: Print formatted message to stdout.
+        _print_msg: Write formatted message to the output.
         _put_alrt: Display an alert message.
         _put_prmt: Display the cue message.
         _read_kst: Capture a single keystroke from the user.
         _read_str: Capture a string input from the user.
+        _tk_kst: Take a key read for a keystroke response.
+        _tk_str: Take a key read for a string response.
         _val_resp: Validate the user's input based on the specified 
             criteria.
     """
     def __init__(self, cue: str, expect_keystroke: bool = False, 
                  validate_bool: bool = False, validate_integer: bool = False, 
-                 integer_validation: int | tuple[int, int] | None = None
-                 ) -> None:
+                 integer_validation: int | tuple[int, int] | None = None, 
+                 output: ConsoleOutput | None = None) -> None:
 
         # Type validation
         if not isinstance(cue, str):
@@ -217,7 +468,7 @@ class ConsolePrompt(ConsoleBase):
                                      "be less than the first")
 
         # Initialize base and assign validated attributes
-        super().__init__()
+        super().__init__(output)
         self._cue = cue
         self._exp_kst = expect_keystroke
         self._val_bool = validate_bool
@@ -225,7 +476,33 @@ class ConsolePrompt(ConsoleBase):
         self._int_vld = integer_validation
         self._e_ct = {"yes/no": 0, "NaN": 0, "OOR": 0, "OOL": 0}
 
-    # Public Method
+    # Public Methods
+    async def acall(self, timeout: float | None = None, default: Any = None
+                    ) -> Any:
+        """
+        Get, validate, and return user input without blocking the loop.
+
+        Keys are polled every `PROMPT_POLL` seconds, so other tasks on 
+        the event loop, such as refreshing a list of devices, run while 
+        the prompt is open. Cancelling the task closes the prompt.
+
+        Args:
+            timeout: The seconds to wait for a valid response, or None 
+                to wait indefinitely.
+            default: The response returned if the timeout passes.
+        
+        Returns:
+            The validated response, as returned by `call`, or `default` 
+            if the timeout passes first.
+        """
+        try:
+            return await wait_for(self._aget_vld(), timeout)
+        except TimeoutError:
+            self._out.write("\n", flush=True)
+            return default
+        finally:
+            self._e_ct = {error: 0 for error in self._e_ct}
+
     def call(self) -> Any:
         """
         Get, validate, and return user input.
@@ -246,22 +523,44 @@ class ConsolePrompt(ConsoleBase):
         return self._vld_resp
 
     # Private Methods
+    async def _aget_resp(self) -> None:
+        """Prompt the user and capture input, awaiting each key."""
+        self._put_prmt(kp_cur_inline=not self._exp_kst)
+        self._user_resp, self._msk_ct, self._resp_chrs = "", -1, []
+        take = self._tk_kst if self._exp_kst else self._tk_str
+        with (self._trm.cbreak(), 
+              self._trm.hidden_cursor() if self._exp_kst else nullcontext()):
+            while not take(await self._ainkey()): pass
+
+    async def _aget_vld(self) -> Any:
+        """Await responses until one is valid, and return it."""
+        valid = False
+        while not valid:
+            await self._aget_resp()
+            valid = self._val_resp()
+        return self._vld_resp
+
+    async def _ainkey(self) -> Keystroke:
+        """Await a key, letting other tasks run until one is read."""
+        key = self._trm.inkey(timeout=0)
+        while not key:
+            await sleep(PROMPT_POLL)
+            key = self._trm.inkey(timeout=0)
+        return key
+
     def _back_n_lines(self, n: int) -> None:
         """
         Move cursor back `n` lines and clear each line.
 
         This method uses ANSI escape codes to move the cursor up 
         (`\033[F`) and to clear the contents of each line (`\033[K`). 
-        The changes are flushed to the terminal to ensure immediate 
+        The changes are flushed to the output to ensure immediate 
         application.
         
         Args:
             n: The number of lines to move back and clear.
         """
-        for _ in range(n):
-            stdout.write("\033[F")
-            stdout.write("\033[K")
-        stdout.flush()
+        self._out.write("\033[F\033[K" * n, flush=True)
 
     def _chk_bool_vld(self) -> bool:
         """
@@ -356,14 +655,16 @@ class ConsolePrompt(ConsoleBase):
                 moves to the next line after printing.
         """
         # Set width to display message and padding to center width
-        display_width = min(self._trm.width, 79)
-        padding = " " * ((self._trm.width - display_width) // 2)
+        width = self._get_wd()
+        display_width = min(width, 79)
+        padding = " " * ((width - display_width) // 2)
 
-        # Print textwrapped, padded message and deposit cursor
-        print(fill(msg, width=(display_width + fmt_alloc + len(padding)), 
-                   initial_indent=padding, subsequent_indent=padding), 
-              end=" " if kp_cur_inline else "\n",
-              flush=True)
+        # Write textwrapped, padded message and deposit cursor
+        self._out.write(fill(msg, 
+                             width=(display_width + fmt_alloc + len(padding)), 
+                             initial_indent=padding, 
+                             subsequent_indent=padding) + 
+                        (" " if kp_cur_inline else "\n"), flush=True)
 
     def _put_alrt(self, alert: str, err_ct: int) -> None:
         """
@@ -427,24 +728,9 @@ class ConsolePrompt(ConsoleBase):
         Side effect:
             _user_resp: Set user response.
         """
-        # Initialize values
-        key = None
-        miskey_ct = -1
-        self._user_resp = ""
-
-        # While loop within contexts filtering for printable characters
+        self._user_resp, self._msk_ct = "", -1
         with self._trm.cbreak(), self._trm.hidden_cursor():
-            while key is None or not (32 <= code <= 126 or code == 10):
-                key = self._trm.inkey()
-                try:
-                    code = ord(key)
-                except:
-                    key = None
-                    miskey_ct += 1
-                    self._put_alrt("Input not printable", miskey_ct)
-        
-        # Set user response
-        self._user_resp = str(key if code != 10 else "")
+            while not self._tk_kst(self._trm.inkey()): pass
 
     def _read_str(self) -> None:
         """
@@ -459,42 +745,72 @@ class ConsolePrompt(ConsoleBase):
         Side effect:
             _user_resp: Set user response.
         """
-        # Initialize values
-        key = None
-        response = []
-
+        self._resp_chrs = []
         with self._trm.cbreak():
-            # Wait Enter key
-            while key is None or code != 10:
-                key = self._trm.inkey()
+            while not self._tk_str(self._trm.inkey()): pass
 
-                # Get ASCII decimal code
-                try:
-                    code = ord(key)
-                
-                # Reset key if code unavailable
-                except:
-                    key = None
-                
-                else:
-                    # Simulate backspace on existing string
-                    if response and (code == 8 or code == 127):
-                        response.pop()
-                        backspace_ct = 1 + FORMATTING_ALLOCATION["green"]
-                        sequence = "\b \b" * backspace_ct
-                        print(sequence, end="", flush=True)
-                    
-                    # Put printable character in green
-                    elif 32 <= key.code <= 126:
-                        response.append(str(key))
-                        formatted_char = self._trm.green(str(key))
-                        print(formatted_char, end="", flush=True)
-            
-            # Print new line upon Enter
-            print()
+    def _tk_kst(self, key: Keystroke) -> bool:
+        """
+        Take a key read for a keystroke response.
+
+        Args:
+            key: The key read.
+        
+        Side effect:
+            _user_resp: Set user response once a key is accepted.
+        
+        Returns:
+            True if the key was accepted, else False.
+        """
+        # Alert on keys that are not characters
+        try:
+            code = ord(key)
+        except:
+            self._msk_ct += 1
+            self._put_alrt("Input not printable", self._msk_ct)
+            return False
+        
+        # Accept printable characters, or Enter as an empty response
+        if not (32 <= code <= 126 or code == 10): return False
+        self._user_resp = str(key if code != 10 else "")
+        return True
+
+    def _tk_str(self, key: Keystroke) -> bool:
+        """
+        Take a key read for a string response.
+
+        Args:
+            key: The key read.
+        
+        Side effect:
+            _user_resp: Set user response once Enter is pressed.
+        
+        Returns:
+            True if Enter was pressed, else False.
+        """
+        # Ignore keys that are not characters
+        try:
+            code = ord(key)
+        except:
+            return False
         
-        # Set user response
-        self._user_resp = "".join(response)
+        # Print new line and set user response upon Enter
+        if code == 10:
+            self._out.write("\n", flush=True)
+            self._user_resp = "".join(self._resp_chrs)
+            return True
+
+        # Simulate backspace on existing string
+        if self._resp_chrs and (code == 8 or code == 127):
+            self._resp_chrs.pop()
+            backspace_ct = 1 + FORMATTING_ALLOCATION["green"]
+            self._out.write("\b \b" * backspace_ct, flush=True)
+        
+        # Put printable character in green
+        elif 32 <= code <= 126:
+            self._resp_chrs.append(str(key))
+            self._out.write(self._trm.green(str(key)), flush=True)
+        return False
 
     def _val_resp(self) -> bool:
         """
@@ -523,78 +839,323 @@ class ConsoleTable(ConsoleBase):
     of rows and columns, and supports styled output such as underlined 
     headings and color-coded borders.
 
+    A table may also be streamed: the header is drawn once and each 
+    row as it arrives, and the whole table redrawn over the rows drawn 
+    once their final widths are known.
+
+    Rows are rendered into a buffer, with the margin, styled borders, 
+    and a format template for each column prepared once per display, 
+    and the buffer is written to the terminal at once, or every 
+    `RENDER_CHUNK` lines for a long table.
+
+    A long table may instead be paged: only the records fitting the 
+    screen are fetched and drawn, and redrawn as the keys of 
+    `PAGER_KEYS` scroll, jump to a record, or search the table.
+
+    A table may also be shown live, redrawn in place from a series of 
+    tables at a fixed rate; only the lines that changed since the last 
+    frame are rewritten, addressed by the cursor.
+
+    Records may be numbered, as for a menu, in a right-justified first 
+    column, '#', computed from the position of each record as it is 
+    drawn, so the table itself is left as it was.
+
     Args:
         table: An instance of Table to be rendered.
+        output: The backend the table is rendered to, or None for the 
+            terminal.
+        numbered: If True, number the records from 1.
     
     Attributes:
+        _buf: The lines rendered but not yet written.
         _col_wds: A map of columns to their widths.
         _data: The table data as a Table object.
         _disp_wd: The width for display in console.
+        _ends: The styled ends and padding of each row type.
+        _fills: The styled fill of each border row.
+        _mrg: The margin centering the table in console.
         _mrg_sz: The size of margin required to center the table in 
             console.
+        _num: Whether records are numbered in a virtual first column.
+        _out: ConsoleOutput inherited from ConsoleBase.
         _tbl_wd: The width required for table columns and padding.
+        _tmpls: The format template justifying the cells of each 
+            column.
         _trm: blessed.Terminal inherited from ConsoleBase.
+        _wrp: Whether record cells are wrapped.
 
     Methods:
         display: Public method to render the table to the console.
-        _drw_rw: Render a specific type of table row.
+        live: Redraw the table in place from each of a series of tables.
+        page: Page through the table a screen at a time.
+        redisplay: Redraw the table over the lines last drawn.
+        stream: Render the table's header, then rows as they arrive.
+        _drw_dlt: Rewrite the lines of a frame that changed.
+        _drw_pg: Render the screen of records from a given record.
+        _drw_rw: Render a specific type of table row into the buffer, 
+            highlighting records styled by the table.
         _drw_tb: Render the table by sequentially drawing each row.
+        _flsh: Write the buffered lines to the console at once.
+        _fnd_rec: Find the next record containing a search term.
+        _get_key: Read a key, by name if it has one.
         _get_rw_cntnt: Retrieve content for a specific row type.
         _get_rw_ends: Retrieve the left and right borders, and the 
             padding for a row, depending on its type.
+        _pg_ht: Return the number of lines for records on a page.
         _proc_rw_cntnt: Style the row content based on its type and 
             justify base on column.
+        _read_pg_ln: Read a line of input on the pager's status line.
+        _rndr_frm: Render the table into the lines of a frame.
         _set_dims: Calculate table dimensions and adjust column widths 
             to fit within the terminal display.
+        _set_tmpls: Prepare the margin, styled borders, and column 
+            templates for the dimensions.
+        _wrp_rw: Split record content into lines fitting the columns.
     """
-    def __init__(self, table: Table) -> None:
+    def __init__(self, table: Table, output: ConsoleOutput | None = None, 
+                 numbered: bool = False) -> None:
         # Lazy import avoids circular import at runtime type validation
         from modules.table import Table
         if not isinstance(table, Table):
             raise TypeError("Expected `Table` for 'table'")
         
         # Base initialization and attribute assignment
-        super().__init__()
+        super().__init__(output)
         self._data = table
+        self._num = numbered
+        self._buf = []
 
-    # Public Method
+    # Public Methods
     def display(self) -> None:
         """Display the table on the console."""
         self._set_dims()
+        self._set_tmpls()
         self._drw_tbl(self._data.count_records())
 
+    def live(self, tables: Iterable[Table], interval: float = 1.0) -> int:
+        """
+        Redraw the table in place from each of a series of tables.
+
+        A frame is drawn every `interval` seconds from the next table, 
+        until the tables are exhausted or `q` or Escape is pressed. 
+        Each frame is compared with the last by line, and only the 
+        lines that changed are rewritten, so an update of a few rows 
+        costs those rows rather than the whole table.
+
+        Args:
+            tables: The tables to display, one per frame.
+            interval: The seconds between frames.
+        
+        Returns:
+            The number of frames drawn.
+        """
+        frm_ct, prev, due = 0, [], monotonic()
+        self._buf.append(self._trm.home + self._trm.clear)
+
+        with (self._trm.fullscreen(), self._trm.cbreak(), 
+              self._trm.hidden_cursor()):
+            for table in tables:
+                self._data = table
+                lines = self._rndr_frm()
+                self._drw_dlt(prev, lines)
+                prev, frm_ct = lines, frm_ct + 1
+
+                # Wait for the next frame, or skip one missed
+                due = max(due + interval, monotonic())
+                key = self._trm.inkey(timeout=max(due - monotonic(), 0))
+                if PAGER_KEYS.get(key.name or str(key)) == "quit": break
+        
+        return frm_ct
+
+    def page(self) -> None:
+        """
+        Page through the table a screen at a time until quit.
+
+        Only the records on the screen are fetched from the table and 
+        drawn, so each key costs the height of the screen rather than 
+        the size of the table. Keys are mapped to actions by 
+        `PAGER_KEYS`: scroll by line or page, jump to the first or last 
+        records or to a record number (`:`), search incrementally 
+        (`/`), and find the next match (`n`).
+        """
+        self._set_dims()
+        self._set_tmpls()
+        rec_ct = self._data.count_records()
+        top, query = 0, ""
+
+        with (self._trm.fullscreen(), self._trm.cbreak(), 
+              self._trm.hidden_cursor()):
+            while True:
+                shown = self._drw_pg(top)
+                action = PAGER_KEYS.get(self._get_key())
+                if action == "quit": break
+
+                # Read a record number, or a search term
+                if action == "jump":
+                    entry, _ = self._read_pg_ln(top, ":")
+                    if entry and entry.isdigit(): top = int(entry) - 1
+                elif action == "search":
+                    entry, top = self._read_pg_ln(top, "/", srch=True)
+                    if entry: query = entry
+                elif action == "next" and query:
+                    match = self._fnd_rec(query, top + 1)
+                    if match is not None: top = match
+                
+                # Scroll
+                else:
+                    top += {"down": 1, "up": -1, 
+                            "page_down": max(shown, 1), 
+                            "page_up": -self._pg_ht(), 
+                            "home": -top, 
+                            "end": rec_ct - self._pg_ht() - top
+                            }.get(action, 0)
+                top = max(min(top, rec_ct - 1), 0)
+
+    def redisplay(self, ln_ct: int) -> bool:
+        """
+        Redraw the table over the lines last drawn.
+
+        Args:
+            ln_ct: The number of lines last drawn.
+        
+        Returns:
+            True if the table was redrawn, or False if the lines have 
+            scrolled off the screen.
+        """
+        if ln_ct >= self._get_ht(): return False
+        self._out.write(self._trm.move_up(ln_ct) + self._trm.clear_eos)
+        self.display()
+        return True
+
+    def stream(self, rows: Iterable[dict[str, str]]) -> int:
+        """
+        Render the table's header, then each row as it arrives.
+
+        Column widths are set once, before the first row; rows are 
+        written as they are read, and the bottom border once all are.
+
+        Args:
+            rows: An iterable of record content mapped to the columns.
+        
+        Returns:
+            The number of lines drawn.
+        """
+        self._set_dims()
+        self._set_tmpls()
+        ln_ct = 0
+        for row_type in ["top", "title", "inner", "headings"]:
+            ln_ct += self._drw_rw(row_type)
+        self._flsh()
+        for row in rows:
+            ln_ct += self._drw_rw("record", cont=row)
+            self._flsh()
+        ln_ct += self._drw_rw("bottom")
+        self._flsh()
+        return ln_ct
+
     # Private Methods
-    def _drw_rw(self, rw_tp: str, idx: int | None = None) -> None:
+    def _drw_dlt(self, prev: list[str], lines: list[str]) -> None:
+        """
+        Rewrite the lines of a frame that changed, and write them.
+
+        Args:
+            prev: The lines of the frame on the screen.
+            lines: The lines of the frame to draw.
+        """
+        for i, line in enumerate(lines):
+            if i >= len(prev) or line != prev[i]:
+                self._buf.append(self._trm.move_yx(i, 0) + line + 
+                                 self._trm.clear_eol)
+        
+        # Clear lines left by a longer frame
+        if len(lines) < len(prev):
+            self._buf.append(self._trm.move_yx(len(lines), 0) + 
+                             self._trm.clear_eos)
+        self._flsh()
+
+    def _drw_pg(self, top: int, status: str | None = None) -> int:
         """
-        Render a specific row type with styling.
+        Render the screen of records from a given record, and write it.
+
+        Records are drawn from `top` until the screen is full, with a 
+        status line below the table; a record too tall for the lines 
+        left is left for the next page.
+
+        Args:
+            top: The index of the first record on the screen.
+            status: The text of the status line, or None for the 
+                records shown and the keys of the pager.
+        
+        Returns:
+            The number of records drawn.
+        """
+        self._buf.append(self._trm.home + self._trm.clear)
+        for row_type in ["top", "title", "inner", "headings"]:
+            self._drw_rw(row_type)
+
+        # Records fitting the screen
+        rec_ct, room, shown = self._data.count_records(), self._pg_ht(), 0
+        for i in range(top, rec_ct):
+            mark = len(self._buf)
+            room -= self._drw_rw("record", i)
+            if room < 0 and shown:
+                del self._buf[mark:]
+                break
+            shown += 1
+            if room <= 0: break
+        self._drw_rw("bottom")
+
+        # Status line
+        if status is None:
+            status = (f"{top + 1 if shown else 0}-{top + shown} of "
+                      f"{rec_ct}  {PAGER_HELP}")
+        status = truncate_string(status, self._disp_wd)
+        self._buf.append(self._mrg + 
+                         self._trm.reverse(status.ljust(self._disp_wd)))
+        self._flsh()
+        return shown
+
+    def _drw_rw(self, rw_tp: str, idx: int | None = None, 
+                cont: dict[str, str] | None = None) -> int:
+        """
+        Render a specific row type with styling into the buffer.
 
         Args:
             rw_tp: The type of row to draw.
             idx: The index of the record row if applicable.
+            cont: The content of a record row not held by the table, 
+                drawn instead of the record at `idx`.
+        
+        Returns:
+            The number of lines drawn.
         """
-        # Define row type categories
-        is_line_type = rw_tp in {"top", "inner", "bottom"}
-        is_text_type = rw_tp in {"title", "headings", "record"}
+        left, right, gap = self._ends[rw_tp]
 
-        # Determine justification for record rows
-        rjust_cols = (self._data.get_rjust_columns() 
-                     if rw_tp == "record" else {})
-        
-        # Get components for rendering the row
-        margin = " " * self._mrg_sz
-        left, right, gap = self._get_rw_ends(rw_tp, is_line_type)
+        # Border rows from their prepared fill
+        if rw_tp in {"top", "inner", "bottom"}:
+            self._buf.append(f"{self._mrg}{left}{self._fills[rw_tp]}{right}\n")
+            return 1
 
-        # Retrieve row content based on type
-        content = (self._get_rw_cntnt(rw_tp, idx) 
-                   if is_text_type else BORDERS[rw_tp]["fill"])
+        # Retrieve row content and style based on type
+        content = cont if cont is not None else self._get_rw_cntnt(rw_tp, idx)
+        style = (self._data.get_row_style(idx) 
+                 if rw_tp == "record" and cont is None else None)
         
-        # Process content into styled cells or line fillers
-        cells = (self._proc_rw_cntnt(rw_tp, content, rjust_cols) 
-                 if is_text_type 
-                 else [self._trm.blue(content * (self._tbl_wd + 2))])
+        # Split record content into lines if the table wraps cells
+        lines = (self._wrp_rw(content) 
+                 if rw_tp == "record" and self._wrp else [content])
+
+        for content in lines:
+            
+            # Process content into styled cells
+            cells = self._proc_rw_cntnt(rw_tp, content)
+            if style: cells = [getattr(self._trm, style)(c) for c in cells]
+            
+            # Construct and buffer the row
+            self._buf.append(
+                f"{self._mrg}{left}{gap}{'  '.join(cells)}{gap}{right}\n")
         
-        # Construct and print the row
-        print(f"{margin}{left}{gap}{'  '.join(cells)}{gap}{right}")
+        return len(lines)
     
     def _drw_tbl(self, rec_ct: int) -> None:
         """
@@ -607,12 +1168,52 @@ class ConsoleTable(ConsoleBase):
         header_sequence = ["top", "title", "inner", "headings"]
         for row_type in header_sequence: self._drw_rw(row_type)
         
-        # Record rows
-        for i in range(rec_ct): self._drw_rw("record", i)
+        # Record rows, written by chunks
+        for i in range(rec_ct):
+            self._drw_rw("record", i)
+            if len(self._buf) >= RENDER_CHUNK: self._flsh()
         
         # Bottom row
         self._drw_rw("bottom")
+        self._flsh()
     
+    def _flsh(self) -> None:
+        """
+        Write the buffered lines to the console in one write and flush.
+
+        Side effects:
+            _buf: Clear.
+        """
+        self._out.write("".join(self._buf), flush=True)
+        self._buf.clear()
+
+    def _fnd_rec(self, query: str, start: int) -> int | None:
+        """
+        Find the next record containing a search term in any cell.
+
+        The search is case-insensitive, fetches records one at a time, 
+        and wraps around to the first record.
+
+        Args:
+            query: The search term.
+            start: The index of the first record searched.
+        
+        Returns:
+            The index of the matching record, or None if none match.
+        """
+        query, rec_ct = query.lower(), self._data.count_records()
+        start = min(max(start, 0), rec_ct)
+        for i in chain(range(start, rec_ct), range(start)):
+            if any(query in str(value).lower() 
+                   for value in self._data.get_record(i).values()):
+                return i
+        return None
+
+    def _get_key(self) -> str:
+        """Read a key, returning its name if it has one."""
+        key = self._trm.inkey()
+        return key.name or str(key)
+
     def _get_rw_cntnt(self, rw_tp: str, idx: int | None = None
                       ) -> str | dict[str, str]:
         """
@@ -625,12 +1226,17 @@ class ConsoleTable(ConsoleBase):
         
         Returns:
             Row content, either a string for the "title" row, or a 
-            dictionary for "headings" and "record".
+            dictionary for "headings" and "record", led by the number 
+            column if records are numbered.
         """
         match rw_tp:
             case "title": return self._data.get_title()
-            case "headings": return self._data.get_headings()
-            case "record": return self._data.get_record(idx)
+            case "headings": 
+                headings = self._data.get_headings()
+                return {"#": "#", **headings} if self._num else headings
+            case "record": 
+                record = self._data.get_record(idx)
+                return {"#": idx + 1, **record} if self._num else record
 
     def _get_rw_ends(self, rw_tp: str, is_ln_tp: bool
                      ) -> tuple[str, str, str]:
@@ -660,52 +1266,88 @@ class ConsoleTable(ConsoleBase):
         
         return left_end, right_end, padding
 
-    def _proc_rw_cntnt(self, rw_tp: str, cont: str | dict[str, str], 
-                       rjust_cols: set) -> list[str]:
+    def _pg_ht(self) -> int:
+        """Return the lines of a page left for records."""
+        return max(self._get_ht() - 6, 1)  # Header, bottom, and status
+
+    def _proc_rw_cntnt(self, rw_tp: str, cont: str | dict[str, str]
+                       ) -> list[str]:
         """Process the content of a table row into formatted text cells.
 
         Args:
             rw_tp: The type of row to process, either "title", 
                 "headings", "record".
             cont: Either a string (for title row) or a dictionary with 
-                content mapped to column names.
-            rjust_cols: A set of keys representing columns to be right-
-                justified.
+                content mapped to column names; a record lacking a 
+                column has an empty cell.
 
         Returns:
             A list of formatted strings, each representing a cell in the 
             row.
         """
-        # Initialize list
-        cells = []
-
         # Title content
         if rw_tp == "title":
             cont = truncate_string(cont, self._tbl_wd)
-            cell = f"{self._trm.reverse(cont.center(self._tbl_wd))}"
-            cells.append(cell)
+            return [f"{self._trm.reverse(cont.center(self._tbl_wd))}"]
         
-        else:
-            # Iterate headings and record content
-            for key, value in cont.items():
-                width = self._col_wds[key]
-                value = truncate_string(value, width)
-
-                # Cell content for headings
-                cell = (f"{self._trm.underline(str(value).center(width))}" 
-                        if rw_tp == "headings" 
-
-                        # Right-justified cell content for records
-                        else (f"{str(value).rjust(width)}" 
-                              if key in rjust_cols 
-                              
-                              # Left-justified cell content for records
-                              else f"{str(value).ljust(width)}"))
-                
-                # Build headings and record content
-                cells.append(cell)
+        # Cell content for headings
+        if rw_tp == "headings":
+            return [self._trm.underline(
+                        truncate_string(str(value), 
+                                        self._col_wds[key]
+                                        ).center(self._col_wds[key])) 
+                    for key, value in cont.items()]
+
+        # Cell content for records, justified by column template, with 
+        # empty cells for columns a record lacks
+        return [self._tmpls[key].format(
+                    truncate_string(str(cont.get(key, "")), width)) 
+                for key, width in self._col_wds.items()]
+
+    def _read_pg_ln(self, top: int, cue: str, srch: bool = False
+                    ) -> tuple[str | None, int]:
+        """
+        Read a line of input on the status line of the pager.
+
+        Args:
+            top: The index of the first record on the screen.
+            cue: The text preceding the input on the status line.
+            srch: If True, move to the first record from `top` 
+                matching the input as it is typed.
         
-        return cells
+        Returns:
+            The input, or None if cancelled with Escape, and the index 
+            of the first record to show.
+        """
+        text, pos = "", top
+        while True:
+            self._drw_pg(pos, cue + text)
+            key = self._get_key()
+            if key == "KEY_ENTER": return text, pos
+            if key == "KEY_ESCAPE": return None, top
+            if key in {"KEY_BACKSPACE", "KEY_DELETE"}: text = text[:-1]
+            elif len(key) == 1 and key.isprintable(): text += key
+            if srch:
+                match = self._fnd_rec(text, top) if text else None
+                pos = top if match is None else match
+
+    def _rndr_frm(self) -> list[str]:
+        """
+        Render the table into the lines of a frame fitting the screen.
+
+        Returns:
+            The rendered lines, without line breaks.
+        """
+        self._set_dims()
+        self._set_tmpls()
+        start = len(self._buf)
+        for row_type in ["top", "title", "inner", "headings"]:
+            self._drw_rw(row_type)
+        for i in range(self._data.count_records()): self._drw_rw("record", i)
+        self._drw_rw("bottom")
+        lines = "".join(self._buf[start:]).splitlines()
+        del self._buf[start:]
+        return lines[:self._get_ht()]
 
     def _set_dims(self) -> None:
         """
@@ -717,18 +1359,71 @@ class ConsoleTable(ConsoleBase):
             _mrg_sz: Sets margin required to center the table.
             _tbl_wd: Sets width required for table columns and inner 
                 padding.
-            _col_wds: Sets width of each column.
+            _col_wds: Sets width of each column, with the number column 
+                first if records are numbered.
         """
+        # Widths of the number column and its padding
+        num_wds = ({"#": len(str(self._data.count_records()))} 
+                   if self._num else {})
+        extra = sum(width + 2 for width in num_wds.values())
+
         # Set display and table dimensions
-        self._disp_wd = min(self._trm.width, 79)
-        self._mrg_sz = (self._trm.width - self._disp_wd) // 2
-        self._tbl_wd = self._data.get_table_width()
+        width = self._get_wd()
+        self._disp_wd = min(width, 79)
+        self._mrg_sz = (width - self._disp_wd) // 2
+        self._tbl_wd = self._data.get_table_width() + extra
 
         # Adjust table dimensions
         table_space = self._disp_wd - 4  # For borders and padding
         if self._tbl_wd > table_space:
-            self._data.resize_columns(table_space)
-            self._tbl_wd = self._data.get_table_width()
+            self._data.resize_columns(table_space - extra)
+            self._tbl_wd = self._data.get_table_width() + extra
         
-        # Set column dimensions
+        # Set column dimensions, the number column first
         self._col_wds = self._data.get_column_widths()
+        if self._num: self._col_wds = {**num_wds, **self._col_wds}
+
+    def _set_tmpls(self) -> None:
+        """
+        Prepare the margin, styled borders, and column templates for the 
+            dimensions of the table.
+
+        Side effects:
+            _ends: Set styled ends and padding of each row type.
+            _fills: Set styled fill of each border row.
+            _mrg: Set margin.
+            _tmpls: Set format template of each column, right-justified 
+                or left-justified to its width.
+            _wrp: Set whether record cells are wrapped.
+        """
+        line_types = ["top", "inner", "bottom"]
+        self._mrg = " " * self._mrg_sz
+        self._ends = {rw_tp: self._get_rw_ends(rw_tp, rw_tp in line_types) 
+                      for rw_tp in [*line_types, "title", "headings", 
+                                    "record"]}
+        self._fills = {rw_tp: self._trm.blue(BORDERS[rw_tp]["fill"] * 
+                                             (self._tbl_wd + 2)) 
+                       for rw_tp in line_types}
+        rjust_cols = self._data.get_rjust_columns() | (
+            {"#"} if self._num else set())
+        self._tmpls = {key: f"{{:{'>' if key in rjust_cols else '<'}{width}}}" 
+                       for key, width in self._col_wds.items()}
+        self._wrp = self._data.get_wrap()
+
+    def _wrp_rw(self, cont: dict[str, str]) -> list[dict[str, str]]:
+        """
+        Split record content into lines of cells fitting the columns.
+
+        Args:
+            cont: A dictionary with content mapped to column names.
+        
+        Returns:
+            A list of dictionaries, one for each line of the record, 
+            with cells too wide for their columns wrapped onto the 
+            following lines.
+        """
+        chunks = {key: wrap(str(cont.get(key, "")), width) or [""] 
+                  for key, width in self._col_wds.items()}
+        height = max((len(chunk) for chunk in chunks.values()), default=1)
+        return [{key: chunk[i] if i < len(chunk) else "" 
+                 for key, chunk in chunks.items()} for i in range(height)]
@@ -5,16 +5,203 @@ This module provides utility functions for data processing and
 transformation with pandas.
 """
 # Standard library imports
-from io import StringIO
+from concurrent.futures import ProcessPoolExecutor
+from io import RawIOBase, StringIO
+from mmap import mmap, ACCESS_READ
+from os import PathLike, cpu_count, fspath, path
+from re import compile
 from pandas import DataFrame, Timestamp
+from pandas.io.parsers import TextFileReader
 from pandas.tseries.offsets import DateOffset, BDay
-from typing import Any, Union
+from typing import IO, Any, Callable, Iterator, Union
+import bz2
+import gzip
+import lzma
+import numpy as np
 import pandas as pd
 
 # Local module imports
 from .constants import DATE_FORMATS
 
 
+# Byte patterns for locating sections separated by blank lines
+BLANK_LINES_REGEX = compile(rb'\n(?:[ \t\r\f\v]*\n)+')
+LEADING_BLANK_LINES_REGEX = compile(rb'(?:[ \t\r\f\v]*\n)*')
+NON_BLANK_REGEX = compile(rb'\S')
+
+# Compression detection and streamed decompression
+CHUNK_SIZE = 1 << 16
+COMPRESSION_EXTENSIONS = {".bz2": "bz2", ".gz": "gzip", ".xz": "xz", 
+                          ".zst": "zstd"}
+COMPRESSION_MAGIC = {b"BZh": "bz2", b"\x1f\x8b": "gzip", 
+                     b"\xfd7zXZ\x00": "xz", b"\x28\xb5\x2f\xfd": "zstd"}
+MAGIC_LENGTH = max(len(signature) for signature in COMPRESSION_MAGIC)
+
+# Thresholds for dtype recommendations
+CATEGORY_RATIO = 0.5
+INTEGER_DTYPES = ["int8", "int16", "int32", "int64"]
+UNSIGNED_DTYPES = ["uint8", "uint16", "uint32", "uint64"]
+
+# Parallel apply defaults and the task shared with each worker process
+PARALLEL_CHUNK_ROWS = 1000
+_worker_task = None
+
+
+class _BufferReader(RawIOBase):
+    """
+    Read-only binary stream over a byte range of a buffer.
+
+    The range is exposed through a `memoryview`, so the parser reads 
+    directly from the underlying buffer (e.g., a memory map) without an 
+    intermediate copy of the section.
+
+    Args:
+        buffer: Any object supporting the buffer protocol.
+        start (int): Offset of the first byte of the range.
+        end (int): Offset one past the last byte of the range.
+    """
+    def __init__(self, buffer: Any, start: int, end: int) -> None:
+        self._view = memoryview(buffer)[start:end]
+        self._pos = 0
+
+    def close(self) -> None:
+        """Release the view on the buffer and close the stream."""
+        self._view.release()
+        super().close()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        count = min(len(b), len(self._view) - self._pos)
+        b[:count] = self._view[self._pos:self._pos + count]
+        self._pos += count
+        return count
+
+
+class _SectionStream(RawIOBase):
+    """
+    Read-only binary stream over the current section of a 
+    `_StreamSections` splitter.
+
+    Args:
+        sections: The splitter providing the section's bytes.
+    """
+    def __init__(self, sections: "_StreamSections") -> None:
+        self._sections = sections
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        data = self._sections.read_section(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+
+class _StreamSections:
+    """
+    Splits a binary stream into blank-line separated sections.
+
+    Only a chunk of the stream, plus any line spanning chunks, is 
+    buffered at a time. Iterating yields a `_SectionStream` for each 
+    section; a section must be read before the next one is requested, 
+    and any unread remainder is discarded.
+
+    Args:
+        stream: A readable binary stream.
+        chunk_size (int, optional): Number of bytes read from the stream 
+            at a time.
+
+    Attributes:
+        _buf: Bytes read from the stream but not yet consumed.
+        _end: Bytes left in the current section, once its boundary is 
+            located.
+        _eof: Whether the stream is exhausted.
+        _size: Number of bytes read from the stream at a time.
+        _skip: Bytes left through the end of the current boundary, once 
+            it is located.
+        _src: The stream being split.
+    """
+    def __init__(self, stream: IO[bytes], chunk_size: int = CHUNK_SIZE
+                 ) -> None:
+        self._src = stream
+        self._size = chunk_size
+        self._buf = bytearray()
+        self._eof = False
+        self._end = self._skip = None
+
+    def __iter__(self) -> Iterator[_SectionStream]:
+        while self._skip_blank_lines():
+            yield _SectionStream(self)
+            while self.read_section(self._size): pass
+
+    def read_section(self, size: int) -> bytes:
+        """
+        Read up to `size` bytes of the current section.
+
+        Args:
+            size: The maximum number of bytes to read.
+
+        Returns:
+            The bytes read, or an empty bytes object at the end of the 
+            section.
+        """
+        while True:
+            # Emit up to the located boundary, then discard the boundary
+            if self._end is not None:
+                count = min(size, self._end)
+                data = bytes(self._buf[:count])
+                del self._buf[:count]
+                self._end -= count
+                self._skip -= count
+                if self._end == 0:
+                    del self._buf[:self._skip]
+                    self._skip = 0
+                return data
+
+            # Locate a boundary that more data cannot extend
+            match = BLANK_LINES_REGEX.search(self._buf)
+            if match and (match.end() < len(self._buf) or self._eof):
+                self._end, self._skip = match.start() + 1, match.end()
+            elif self._eof:
+                self._end = self._skip = len(self._buf)
+
+            # Emit complete lines, holding back the last newline so that 
+            # a following blank line can still be matched
+            else:
+                safe = match.start() if match else self._buf.rfind(b"\n")
+                if safe > 0:
+                    data = bytes(self._buf[:min(size, safe)])
+                    del self._buf[:len(data)]
+                    return data
+                self._fill()
+
+    def _fill(self) -> None:
+        """Read a chunk of the stream into the buffer."""
+        data = self._src.read(self._size)
+        if data: self._buf += data
+        else: self._eof = True
+
+    def _skip_blank_lines(self) -> bool:
+        """
+        Discard blank lines before the next section.
+
+        Returns:
+            True if another section follows, False at the end of the 
+            stream.
+        """
+        self._end = self._skip = None
+        while True:
+            del self._buf[:LEADING_BLANK_LINES_REGEX.match(self._buf).end()]
+            if NON_BLANK_REGEX.search(self._buf):
+                return True
+            if self._eof:
+                self._buf.clear()
+                return False
+            self._fill()
+
+
 def cast_as_string(df: DataFrame, raw_columns: list[str]) -> DataFrame:
     """
     Casts specified columns in a DataFrame to the pandas 'string' dtype,
@@ -43,6 +230,25 @@ def cast_as_string(df: DataFrame, raw_columns: list[str]) -> DataFrame:
     return df.assign(**formatted_columns)
 
 
+def compact_frame(df: DataFrame, profile: DataFrame | None = None
+                  ) -> DataFrame:
+    """
+    Casts the columns of a DataFrame to the smaller dtypes recommended 
+    by `profile_frame`.
+
+    Args:
+        df (DataFrame): The input pandas DataFrame.
+        profile (DataFrame, optional): A profile of `df` from 
+            `profile_frame`. Computed if not provided.
+
+    Returns:
+        DataFrame: A new DataFrame with the recommended columns cast.
+    """
+    profile = profile_frame(df) if profile is None else profile
+    recommended = profile["recommended"].dropna()
+    return df.astype(recommended.to_dict()) if len(recommended) else df.copy()
+
+
 def convert_to_number(df: DataFrame, cols: list[str]) -> DataFrame:
     """
     Converts specified columns in a DataFrame to numeric dtype, coercing 
@@ -94,6 +300,57 @@ def format_dates(df: DataFrame, cols: list[str], date_frmt: str = ""
     })
 
 
+def iter_csv_sections(file_path: Union[str, PathLike], sep: str = ",", 
+                      header: int = 0, chunksize: int | None = None
+                      ) -> Iterator[Union[DataFrame, TextFileReader]]:
+    """
+    Yields every blank-line separated section of a CSV file, in file 
+    order, as its own DataFrame.
+
+    Uncompressed files are memory-mapped and the section boundaries are 
+    located with a bytes search, so each section's byte range is handed 
+    to the CSV parser without copying it. Compressed files (bzip2, gzip, 
+    xz, or zstd, detected by extension or magic bytes) are decompressed 
+    as a stream and split on the fly, so no temporary file is written. 
+    Sections that cannot be parsed as a table (e.g., disclaimers) are 
+    returned as a single "text" column of their lines.
+
+    Args:
+        file_path (Union[str, PathLike]): The path to the CSV file.
+        sep (str, optional): Delimiter to use. Defaults to ",".
+        header (int, optional): Row number, within each section, to use 
+            as the column names. Defaults to 0.
+        chunksize (int, optional): If given, each section is yielded as 
+            a `TextFileReader` of DataFrames with this many rows, and 
+            the file is always read as a stream. Each reader must be 
+            consumed before advancing to the next section.
+
+    Yields:
+        Union[DataFrame, TextFileReader]: Each section of the file.
+    """
+    compression = _detect_compression(file_path)
+
+    # Memory-mapped sections of an uncompressed file
+    if compression is None and chunksize is None:
+        if path.getsize(file_path) == 0:
+            return
+        with open(file_path, "rb") as file, \
+             mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+            for start, end in _find_sections(buffer):
+                yield _parse_section(buffer, start, end, sep, header)
+        return
+
+    # Streamed sections of a compressed or chunked file
+    with _open_binary(file_path, compression) as stream:
+        for section in _StreamSections(stream):
+            if chunksize is None:
+                data = section.read()
+                yield _parse_section(data, 0, len(data), sep, header)
+            else:
+                yield read_csv(section, sep=sep, header=header, 
+                               chunksize=chunksize)
+
+
 def offset_date(ref_date: Timestamp, yrs: int = 0, mos: int = 0, dys: int = 0, 
                 biz_dys: int = 0) -> Timestamp:
     """
@@ -120,49 +377,174 @@ def offset_date(ref_date: Timestamp, yrs: int = 0, mos: int = 0, dys: int = 0,
     return ref_date + offset
 
 
-def read_csv(file_path: str, sep: str = ",", header: int = 0) -> DataFrame:
+def parallel_apply(df: DataFrame, func: Callable, axis: int | None = 1, 
+                   workers: int | None = None, 
+                   chunk_rows: int = PARALLEL_CHUNK_ROWS, args: tuple = (), 
+                   **kwargs: Any) -> Union[DataFrame, pd.Series]:
+    """
+    Applies a function to a DataFrame in row chunks on a process pool.
+
+    The DataFrame is partitioned into chunks of consecutive rows, which 
+    are processed in parallel and concatenated in their original order. 
+    The function and its shared arguments are sent to each worker once, 
+    so they must be picklable. Frames no larger than one chunk, or runs 
+    with a single worker, are processed in-process.
+
+    Args:
+        df (DataFrame): The input pandas DataFrame.
+        func (Callable): The function to apply.
+        axis (int | None, optional): 1 to apply `func` to each row, as 
+            with `DataFrame.apply`, or None to apply it to each chunk 
+            as a whole. Defaults to 1.
+        workers (int | None, optional): Number of worker processes. 
+            Defaults to the number of CPUs.
+        chunk_rows (int, optional): Number of rows in each chunk. 
+            Defaults to `PARALLEL_CHUNK_ROWS`.
+        args (tuple, optional): Positional arguments passed to `func` 
+            after the row or chunk.
+        **kwargs: Keyword arguments passed to `func`.
+
+    Returns:
+        Union[DataFrame, pd.Series]: The concatenated results, indexed 
+        like `df`.
+
+    Raises:
+        ValueError: If `axis` is not 1 or None, or if `chunk_rows` is not 
+            positive.
+    """
+    if axis not in (1, None):
+        raise ValueError("Expected 1 or None for 'axis'")
+    if chunk_rows < 1:
+        raise ValueError("'chunk_rows' must be positive")
+    task = (func, axis, args, kwargs)
+    workers = workers or cpu_count() or 1
+
+    # Small frames skip the cost of starting the pool
+    if workers == 1 or len(df) <= chunk_rows:
+        return _apply_chunk(task, df)
+
+    chunks = [df.iloc[i:i + chunk_rows] for i in range(0, len(df), chunk_rows)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), 
+                             initializer=_set_worker_task, 
+                             initargs=(task,)) as pool:
+        return pd.concat(pool.map(_apply_worker_task, chunks))
+
+
+def profile_frame(df: DataFrame) -> DataFrame:
+    """
+    Profiles the memory use and dtypes of the columns of a DataFrame.
+
+    For each column, the profile reports its dtype, deep memory usage in 
+    bytes, fraction of missing values, number of distinct values, and a 
+    smaller dtype that holds the same values, if any: object columns 
+    with repeated values become categorical, integers (and floats that 
+    hold only integers) are downcast to the smallest integer dtype that 
+    fits their range, and floats that survive a round trip through 
+    float32 become float32. `compact_frame` applies the recommendations.
+
+    Args:
+        df (DataFrame): The input pandas DataFrame.
+
+    Returns:
+        DataFrame: One row per column of `df`, indexed by column name, 
+        with "dtype", "memory", "null_fraction", "cardinality", and 
+        "recommended" columns.
+    """
+    memory = df.memory_usage(deep=True, index=False)
+    return DataFrame(
+        [{"dtype": str(df[col].dtype), 
+          "memory": int(memory[col]), 
+          "null_fraction": float(df[col].isna().mean()) if len(df) else 0., 
+          "cardinality": _count_distinct(df[col]), 
+          "recommended": _recommend_dtype(df[col])} 
+         for col in df.columns], 
+        index=df.columns, 
+        columns=["dtype", "memory", "null_fraction", "cardinality", 
+                 "recommended"]).astype({"cardinality": "Int64"})
+
+
+def read_csv(file_path: Union[str, PathLike, IO], sep: str = ",", 
+             header: int = 0, chunksize: int | None = None
+             ) -> Union[DataFrame, TextFileReader]:
     """
     Reads a CSV file into a pandas DataFrame with common NA value 
     handling.
 
+    Compressed files (bzip2, gzip, xz, or zstd) are detected by 
+    extension or magic bytes and decompressed as they are parsed.
+
     Args:
-        file_path (str): Path to the CSV file.
+        file_path (Union[str, PathLike, IO]): Path to the CSV file, or a 
+            file-like object.
         sep (str, optional): Delimiter to use. Defaults to ",".
         header (int, optional): Row number to use as the column names. 
             Defaults to 0.
+        chunksize (int, optional): If given, return a `TextFileReader` 
+            of DataFrames with this many rows instead of a DataFrame.
 
     Returns:
-        DataFrame: A pandas DataFrame containing the data from the CSV 
-        file, with specified NA values parsed as missing.
+        Union[DataFrame, TextFileReader]: A pandas DataFrame containing 
+        the data from the CSV file, with specified NA values parsed as 
+        missing, or a reader of such DataFrames if `chunksize` is given.
     """
+    compression = (_detect_compression(file_path) 
+                   if isinstance(file_path, (str, PathLike)) else "infer")
     return pd.read_csv(file_path, sep=sep, header=header, 
                        na_values=["", " ", "NA", "N/A", "null", "None", "--"],
-                       keep_default_na=True, encoding='utf-8')
+                       keep_default_na=True, encoding='utf-8', 
+                       compression=compression, chunksize=chunksize)
 
 
-def read_csv_until_blank_line(file_path: str) -> DataFrame:
+def read_csv_sections(file_path: Union[str, PathLike], 
+                      names: list[str] | None = None, 
+                      sep: str = ",", header: int = 0
+                      ) -> dict[Union[int, str], DataFrame]:
+    """
+    Reads every blank-line separated section of a CSV file into its own 
+    DataFrame.
+
+    Args:
+        file_path (Union[str, PathLike]): The path to the CSV file, 
+            which may be compressed.
+        names (list[str], optional): Names for the sections in file 
+            order. Sections without a name are keyed by their index.
+        sep (str, optional): Delimiter to use. Defaults to ",".
+        header (int, optional): Row number, within each section, to use 
+            as the column names. Defaults to 0.
+
+    Returns:
+        dict[Union[int, str], DataFrame]: The sections, in file order, 
+        mapped from their names or indexes.
+    """
+    names = names or []
+    return {names[i] if i < len(names) else i: df 
+            for i, df in enumerate(iter_csv_sections(file_path, sep, header))}
+
+
+def read_csv_until_blank_line(file_path: Union[str, PathLike]
+                              ) -> DataFrame:
     """
     Reads a CSV file up to the first blank line and returns the content 
     as a DataFrame.
 
-    This function reads a CSV file line by line and stops reading once 
-    it encounters a completely blank line. The data before that line is 
-    then parsed into a pandas DataFrame.
+    The data before the first completely blank line is parsed into a 
+    pandas DataFrame. A compressed file is only decompressed as far as 
+    that line.
 
     Args:
-        file_path (str): The path to the CSV file.
+        file_path (Union[str, PathLike]): The path to the CSV file, 
+            which may be compressed.
 
     Returns:
         DataFrame: A pandas DataFrame containing the data up to the 
         first blank line.
     """
-    with open(file_path, 'r', encoding='utf-8') as file:
-        buffer = []
-        for line in file:
-            if line.strip() == "":
-                break
-            buffer.append(line)
-    return read_csv(StringIO(''.join(buffer)))
+    sections = iter_csv_sections(file_path)
+    try:
+        df = next(sections, None)
+    finally:
+        sections.close()
+    return read_csv(StringIO("")) if df is None else df
 
 
 def split_columns(df: DataFrame, src_col: str, dest_cols: tuple[str, ...], 
@@ -202,4 +584,206 @@ def split_columns(df: DataFrame, src_col: str, dest_cols: tuple[str, ...],
 
 
 def stack_dataframes():
-    pd.concat()
\ No newline at end of file
+    pd.concat()
+
+
+def _apply_chunk(task: tuple, chunk: DataFrame) -> Union[DataFrame, pd.Series]:
+    """
+    Applies a parallel task's function to a chunk of rows.
+
+    Args:
+        task (tuple): The function, axis, positional arguments, and 
+            keyword arguments of the task.
+        chunk (DataFrame): The rows to process.
+
+    Returns:
+        Union[DataFrame, pd.Series]: The result for the chunk.
+    """
+    func, axis, args, kwargs = task
+    if axis is None:
+        return func(chunk, *args, **kwargs)
+    return chunk.apply(func, axis=axis, args=args, **kwargs)
+
+
+def _apply_worker_task(chunk: DataFrame) -> Union[DataFrame, pd.Series]:
+    """Applies the worker's shared task to a chunk of rows."""
+    return _apply_chunk(_worker_task, chunk)
+
+
+def _count_distinct(series: pd.Series) -> int | None:
+    """
+    Counts the distinct non-missing values of a Series.
+
+    Args:
+        series (pd.Series): The Series to count.
+
+    Returns:
+        int | None: The number of distinct values, or None if the 
+        values are not hashable.
+    """
+    try:
+        return int(series.nunique(dropna=True))
+    except TypeError:
+        return None
+
+
+def _detect_compression(file_path: Union[str, PathLike]) -> str | None:
+    """
+    Detects the compression of a file by its extension or magic bytes.
+
+    Args:
+        file_path (Union[str, PathLike]): The path to the file.
+
+    Returns:
+        str | None: The pandas name of the compression, or None if the 
+        file is not compressed.
+    """
+    name = fspath(file_path).lower()
+    for extension, compression in COMPRESSION_EXTENSIONS.items():
+        if name.endswith(extension):
+            return compression
+    with open(file_path, "rb") as file:
+        magic = file.read(MAGIC_LENGTH)
+    return next((compression 
+                 for signature, compression in COMPRESSION_MAGIC.items() 
+                 if magic.startswith(signature)), None)
+
+
+def _find_sections(buffer: Any):
+    """
+    Yields the byte ranges of the non-blank sections of a buffer.
+
+    Args:
+        buffer: Any object supporting the buffer protocol.
+
+    Yields:
+        tuple[int, int]: The start and end offsets of each section, 
+        including the newline that ends its last line.
+    """
+    start = 0
+    for match in BLANK_LINES_REGEX.finditer(buffer):
+        if NON_BLANK_REGEX.search(buffer, start, match.start()):
+            yield start, match.start() + 1
+        start = match.end()
+    if NON_BLANK_REGEX.search(buffer, start, len(buffer)):
+        yield start, len(buffer)
+
+
+def _open_binary(file_path: Union[str, PathLike], compression: str | None
+                 ) -> IO[bytes]:
+    """
+    Opens a file for streamed, decompressed binary reading.
+
+    Args:
+        file_path (Union[str, PathLike]): The path to the file.
+        compression (str | None): The pandas name of the compression, or 
+            None if the file is not compressed.
+
+    Returns:
+        IO[bytes]: A readable binary stream of the decompressed file.
+
+    Raises:
+        ImportError: If the file is zstd-compressed and the `zstandard` 
+            package is not installed.
+    """
+    match compression:
+        case "bz2": return bz2.open(file_path, "rb")
+        case "gzip": return gzip.open(file_path, "rb")
+        case "xz": return lzma.open(file_path, "rb")
+        case "zstd":
+            try:
+                import zstandard
+            except ImportError as error:
+                raise ImportError("Reading zstd-compressed files requires " + 
+                                  "the 'zstandard' package") from error
+            return zstandard.open(file_path, "rb")
+        case None: return open(file_path, "rb")
+
+
+def _parse_section(buffer: Any, start: int, end: int, sep: str, 
+                   header: int) -> DataFrame:
+    """
+    Parses a byte range of a buffer as a CSV table.
+
+    Args:
+        buffer: Any object supporting the buffer protocol.
+        start (int): Offset of the first byte of the section.
+        end (int): Offset one past the last byte of the section.
+        sep (str): Delimiter to use.
+        header (int): Row number to use as the column names.
+
+    Returns:
+        DataFrame: The parsed section, or its lines in a single "text" 
+        column if the section is not tabular.
+    """
+    reader = _BufferReader(buffer, start, end)
+    try:
+        return read_csv(reader, sep=sep, header=header)
+    except pd.errors.ParserError:
+        text = bytes(buffer[start:end]).decode("utf-8")
+        return DataFrame({"text": text.splitlines()})
+    finally:
+        reader.close()
+
+
+def _recommend_dtype(series: pd.Series) -> str | None:
+    """
+    Recommends a smaller dtype that holds the values of a Series.
+
+    Args:
+        series (pd.Series): The Series to examine.
+
+    Returns:
+        str | None: The recommended dtype, or None if the Series cannot 
+        shrink.
+    """
+    dtype = series.dtype
+    values = series.dropna()
+
+    # Repeated strings and other objects become categories
+    if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(
+            dtype):
+        distinct = _count_distinct(values)
+        return ("category" 
+                if distinct is not None and len(values) 
+                and distinct <= CATEGORY_RATIO * len(values) else None)
+
+    # Integers, and floats holding only integers, fit the smallest range; 
+    # floats beyond every integer range fall through to the float check
+    if pd.api.types.is_bool_dtype(dtype) or not len(values):
+        return None
+    is_float = pd.api.types.is_float_dtype(dtype)
+    is_integral = (pd.api.types.is_integer_dtype(dtype) or 
+                   (is_float and bool((values % 1 == 0).all())))
+    fit = None
+    if is_integral:
+        low, high = values.min(), values.max()
+        candidates = UNSIGNED_DTYPES if (
+            pd.api.types.is_unsigned_integer_dtype(dtype)) else INTEGER_DTYPES
+        fit = next((name for name in candidates 
+                    if (np.iinfo(name).min <= low and 
+                        high <= np.iinfo(name).max)), None)
+    if fit is not None:
+        nullable = (is_float and len(values) < len(series)) or isinstance(
+            dtype, pd.api.extensions.ExtensionDtype)
+        if nullable:
+            fit = "UInt" + fit[4:] if fit.startswith("u") else fit.capitalize()
+        return None if fit.lower() == str(dtype).lower() else fit
+
+    # Floats that survive a round trip through float32
+    if is_float and dtype.itemsize > 4:
+        narrowed = values.astype("float32").astype(dtype)
+        return "float32" if bool((narrowed == values).all()) else None
+    return None
+
+
+def _set_worker_task(task: tuple) -> None:
+    """
+    Stores a parallel task in a worker process as it starts.
+
+    Args:
+        task (tuple): The function, axis, positional arguments, and 
+            keyword arguments of the task.
+    """
+    global _worker_task
+    _worker_task = task
@@ -5,17 +5,171 @@ This module defines a `Table` class that allows for the creation and
 manipulation of data in a table.
 
 Imports:
-    Local module:
-        from console import ConsoleTable: A class for handling display 
-            of the table.
+    Standard library:
+        from collections.abc import Callable, Iterable, Mapping, 
+            Sequence: Abstract base classes for predicate types and 
+            streamed records, and for giving record views the read-only 
+            dictionary interface and text columns the read-only list 
+            interface.
+        from copy import copy: Function to make shallow copies, used to 
+            create table views sharing column storage.
+        from csv import writer: Function to create writers of CSV rows.
+        from datetime import datetime: Class of datetime cell values.
+        from itertools import chain, count: Functions to put back the 
+            first record of a stream once its keys are read, and to 
+            count the frames of a live table without end.
+        from io import StringIO: Class of the in-memory buffer rows 
+            are exported through.
+        from json import dumps, loads: Functions to serialize and 
+            parse JSON documents.
+        from os import PathLike: Class of file system paths.
+        from re import compile: Function to compile regular 
+            expressions.
+        from typing import Any, Iterator, TextIO: Types for 
+            annotations.
 
-Class:
+    Third-party:
+        numpy, pandas: Imported on use by `from_dataframe` and 
+            `to_dataframe` only, so other tables need neither.
+
+    Local modules:
+        from console import ConsoleOutput, ConsoleTable: Classes for 
+            handling display of the table, to a terminal or a buffer.
+        from utilities import parse_size: Function to convert human-
+            readable sizes to bytes.
+
+Classes:
+    Record: A read-only, dictionary-like view of one record of a table.
+    TextColumn: A read-only, list-like column of cell text formatted 
+        from an array of values on access.
     Table: A class representing a table of data, with methods to create 
         and report on the table.
 
+Functions:
+    between: Create a predicate for records with a value within bounds.
+    nonempty: Create a predicate for records with a non-empty value.
+    startswith: Create a predicate for records with a value beginning 
+        with a prefix.
+
+Constants:
+    AGGREGATES: Names of the aggregate functions of a table.
+    COLUMN_TYPES: Parsers of cell text for each column type.
+    DIFF_STYLES: Terminal styles highlighting each kind of change 
+        found by `Table.diff`.
+    EXPORT_CHUNK: Number of records buffered before being written out 
+        by `Table.write`.
+    EXPORT_FORMATS: Formats `Table.write` exports records in.
+    MISSING: Marker stored in a column for a record lacking its key.
+    OCCUPIED_REGEX: Pattern matching runs of occupied character 
+        positions in a whitespace profile.
+    VALIDATION_MODES: Modes of validating table data.
+    VALIDATION_SAMPLE: Number of records checked in sample validation.
+    WHITESPACE_MASK: Translation table mapping whitespace bytes to 0 
+        and all other bytes to 1.
 """
-# Local module import
-from .console import ConsoleTable
+# Standard library imports
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from copy import copy
+from csv import writer
+from datetime import datetime
+from io import StringIO
+from itertools import chain, count
+from json import dumps, loads
+from os import PathLike
+from re import compile
+from typing import Any, Iterator, TextIO
+
+# Local module imports
+from .console import ConsoleOutput, ConsoleTable
+from .utilities import parse_size
+
+
+# Constants
+AGGREGATES = {"count", "max", "min", "sum"}
+COLUMN_TYPES = {"bytes": parse_size, "datetime": datetime.fromisoformat, 
+                "float": float, "int": int}
+DIFF_STYLES = {"added": "green", "changed": "yellow", "removed": "red"}
+EXPORT_CHUNK = 1000
+EXPORT_FORMATS = {"csv", "jsonl", "markdown"}
+MISSING = object()
+OCCUPIED_REGEX = compile(rb"[^\x00]+")
+VALIDATION_MODES = {"full", "none", "sample"}
+VALIDATION_SAMPLE = 100
+WHITESPACE_MASK = bytes(0 if chr(i).isspace() else 1 for i in range(256))
+
+# Types
+Cell = str | int | float | datetime
+Predicate = Callable[["Table"], Callable[[int], bool]]
+
+
+class Record(Mapping):
+    """
+    A read-only, dictionary-like view of one record of a `Table`.
+
+    A record holds no values of its own; it reads each cell from the 
+    table's column storage on access, so looking up a record neither 
+    copies its values nor repeats its keys.
+
+    Args:
+        table: The table holding the record.
+        row: The index of the record in the table's column storage.
+
+    Attributes:
+        _row: The index of the record in the table's column storage.
+        _tbl: The table holding the record.
+    """
+    __slots__ = ("_row", "_tbl")
+
+    def __init__(self, table: "Table", row: int) -> None:
+        self._tbl = table
+        self._row = row
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._tbl._cols[key][self._row]
+        if value is MISSING: raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key, column in self._tbl._cols.items() 
+                if column[self._row] is not MISSING)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class TextColumn(Sequence):
+    """
+    A read-only, list-like column of cell text formatted from an array 
+    of values on access.
+
+    A table built from a DataFrame keeps the DataFrame's arrays and 
+    formats a cell only when it is displayed or filtered, so a preview 
+    of a few records formats only those records.
+
+    Args:
+        values: The array of cell values.
+        fmt: The function formatting a non-missing value as text.
+
+    Attributes:
+        _fmt: The function formatting a non-missing value as text.
+        _vals: The array of cell values.
+    """
+    __slots__ = ("_fmt", "_vals")
+
+    def __init__(self, values: Sequence, fmt: Callable[[Any], str] = str
+                 ) -> None:
+        self._vals = values
+        self._fmt = fmt
+
+    def __getitem__(self, row: int) -> str:
+        value = self._vals[row]
+        return "" if Table._is_msng(value) else self._fmt(value)
+
+    def __len__(self) -> int:
+        return len(self._vals)
 
 
 class Table:
@@ -28,21 +182,84 @@ class Table:
     provides various methods for filtering, formatting, and retrieving 
     table data.
 
+    The data is stored by column: each column label is kept once, with 
+    a list of its cell values, and records are retrieved as `Record` 
+    views over those lists. Filters select records by their indexes in 
+    the column storage instead of copying them.
+
+    `where` returns a view of the table sharing its column storage. The 
+    predicates of chained `where` calls are evaluated together, in one 
+    pass, when the view's records are first needed, and the table 
+    viewed is left unchanged. `sort_by` also returns a view, and 
+    `group_by` a new table of aggregates; both compare cells as numbers 
+    in columns where every value is a number, parsing each column once.
+
+    Columns may be given a type ('int', 'float', 'bytes' for sizes such 
+    as '931.5G', or 'datetime' for ISO 8601 text), and records may hold 
+    int, float, or datetime values. Such columns keep native values, 
+    parsed once at load, for sorting, filtering, and aggregates, beside 
+    the text displayed.
+
+    A table built by `from_dataframe` shares the DataFrame's arrays as 
+    its native values, with `TextColumn` text formatted on access, and 
+    `to_dataframe` shares them back where the records are unchanged.
+
+    Records may be added one at a time by `append` and `extend`, and 
+    `put_stream` displays records as a producer yields them, drawing 
+    each row as it arrives rather than once all are read.
+
+    `diff` compares two snapshots of a listing by a key column, and 
+    returns the records added, removed, and changed, with rows styled 
+    to highlight the changes when displayed.
+
+    Besides the terminal, `write` exports records as CSV, JSON Lines, 
+    or Markdown to a file or stream.
+
     Args:
         table_data: A list of dictionaries representing the table data. 
             Each dictionary corresponds to a row, with keys as column 
-            labels and values as the corresponding cell data.
+            labels and values as the corresponding cell data, either 
+            text or int, float, or datetime values.
         table_string: A string representation of the table.
         title: The title of the table, which will be converted to 
             uppercase.
         rjust_columns: A string, list, or set of strings representing 
             the columns to be right-justified.
+        column_types: A map of column labels to the types their text is 
+            parsed as, one of 'int', 'float', 'bytes', or 'datetime'.
+        validate: How many records of `table_data` have their keys and 
+            values type-checked: 'full' (all, the default for external 
+            input), 'sample' (about `VALIDATION_SAMPLE` records evenly 
+            spaced), or 'none' (for trusted producers).
     
     Attributes:
-        _ds: The table dataset as a list of dictionaries.
+        _cols: The table dataset as a map of column labels to lists of 
+            cell values, in column order.
+        _max_wds: The widest cell value of each column among the 
+            records in the table, kept between displays.
+        _min_wds: The minimum width of each column when resizing.
+        _nt_cols: A set of columns never truncated when resizing.
+        _preds: The predicates of a view not yet evaluated.
+        _prio: The resizing priority of each column; lower priorities 
+            are narrowed first.
         _rec_ct: The number of records (rows) in the table.
         _rj_cols: A set of right-justified columns.
+        _rw_stys: The terminal style of records, by their index in 
+            column storage, highlighted when displayed.
+        _shrd: Whether the column storage is shared with the table a 
+            view was made from, to be copied before it is first changed.
+        _rows: The indexes, in column storage, of the records in the 
+            table.
+        _src_rows: The indexes of the records a view's predicates are 
+            evaluated over.
+        _stl_cols: The columns whose `_max_wds` entry must be recounted 
+            before the next display.
         _ttl: The title of the table, stored in uppercase.
+        _typs: The type of each typed column.
+        _typ_cols: Native cell values of typed columns, and of columns 
+            parsed for comparison, shared by views of the table.
+        _wrp: Whether cells wider than their columns are wrapped 
+            rather than truncated.
 
     
         _column_widths (dict[str, int]): The width of each column in the 
@@ -51,43 +268,99 @@ class Table:
             column separators.
 
     Methods:
+        aggregate: Return the count, sum, minimum, or maximum of the 
+            values of a column.
+        append: Add a record to the end of the table.
         count_records: Return the number of records in the dataset.
+        diff: Return the records added, removed, or changed since 
+            another table.
+        extend: Add records to the end of the table.
         filter_nonempty: Filter records for non-empty values of 
             specified key.
         filter_startswith: Filter records for values with a specified 
             key and prefix.
+        from_dataframe: Create a table sharing the arrays of a pandas 
+            DataFrame.
+        from_json: Create a table from a JSON array of objects.
+        from_records: Create a table from a list of dictionaries with 
+            values of any type.
+        get_column: Return the native values of a column.
         get_column_widths: Return the widths of each column.
         get_headings: Return a dictionary of column headings.
         get_record: Retrieve a specific record by its index.
         get_rjust_columns: Return the set of right-justified columns.
+        get_row_style: Return the terminal style of a record.
         get_table_width: Return the total width of the table.
         get_title: Return the title of the table.
+        get_wrap: Return whether cells are wrapped.
+        group_by: Return a table of aggregates of records grouped by 
+            the value of a column.
+        head: Return a view of the first records.
+        put_live: Display the table, then refresh it in place from a 
+            source of tables.
+        put_stream: Display records as they arrive, adding them to the 
+            table.
         put_table: Format and display the table using a terminal.
+        render: Return the table as displayed, without a terminal.
         resize_columns: Resize column widths to fit within a specified 
             width limit.
+        set_width_policy: Set the minimums, priorities, and truncation 
+            of columns when resizing.
+        sort_by: Return a view of the records sorted by columns.
+        to_dataframe: Return the records as a pandas DataFrame.
+        where: Return a view of the records satisfying a predicate.
+        write: Write the records to a file or stream as CSV, JSON 
+            Lines, or Markdown.
+        _add_cols: Add empty columns for labels not in the table.
         _add_rj_col_lbl: Add one or more labels to the set of right-
             justified columns.
+        _agg: Aggregate the values of a column for a list of records.
         _cap_keys: Capitalize dataset keys.
+        _fill_wds: Narrow columns evenly to a total width.
+        _flt_recs: Flatten nested records into a list of records.
+        _fmt_val: Format a record value as cell text.
         _fnd_bnds: Find the start and end positions of record columns.
         _fnd_col_pos: Find the starting positions headings.
+        _fnd_col_spns: Find column spans from the whitespace profile.
+        _get_max_wd: Count the widest cell value of a column.
         _get_slc: Extract a slice of column from a line.
-        _num_recs: Assign number to each record.
+        _get_typ_col: Return the cell values of a column parsed for 
+            comparison.
+        _is_msng: Return whether a native value is missing.
+        _json_val: Convert a native value to one JSON can hold.
+        _lv_tbls: Yield the tables of the frames of a live display.
+        _mk_vw: Make a view of the table sharing its column storage.
         _rd_tbl: Parse a table from a string input and set as dataset.    
+        _set_typs: Set native values of typed columns.
+        _set_rows: Set the records in the table after a filter.
         _set_wds: Set column and table widths.
+        _strm_recs: Yield the cells of records as they arrive.
 """
-    def __init__(self, table_data: list[dict[str, str]] | None = None, 
+    def __init__(self, table_data: list[dict[str, Cell]] | None = None, 
                  table_string: str | None = None, title: str | None = None, 
-                 rjust_columns: str | list[str] | set[str] | None = None
-                 ) -> None:
+                 rjust_columns: str | list[str] | set[str] | None = None, 
+                 column_types: dict[str, str] | None = None, 
+                 validate: str = "full") -> None:
+        # Validation mode
+        if validate not in VALIDATION_MODES:
+            raise ValueError(f"expected one of {sorted(VALIDATION_MODES)} " + 
+                             f"for `validate`, not {validate!r}")
+        checked = (table_data if validate == "full" or 
+                   not isinstance(table_data, list) else 
+                   table_data[::max(len(table_data) // VALIDATION_SAMPLE, 1)] 
+                   if validate == "sample" else [])
+
         # Type validation
         if not (table_data is None or 
                 (isinstance(table_data, list) and 
                  all(isinstance(d, dict) and 
-                     all(isinstance(k, str) and isinstance(v, str) 
+                     all(isinstance(k, str) and 
+                         isinstance(v, (str, int, float, datetime)) 
                          for k, v in d.items()) 
-                     for d in table_data))):
-            raise TypeError("expected 'list[dict[str, str]]' or 'None' for " + 
-                            f"`table_data`, not {type(table_data).__name__}")
+                     for d in checked))):
+            raise TypeError("expected 'list[dict[str, str | int | float | " + 
+                            "datetime]]' or 'None' for `table_data`, not " + 
+                            f"{type(table_data).__name__}")
         if not (table_string is None or isinstance(table_string, str)):
             raise TypeError("expected 'str' or 'None' for `table_string`")
         if not (title is None or isinstance(title, str)):
@@ -98,26 +371,261 @@ class Table:
                  and all(isinstance(i, str) for i in rjust_columns))):
             raise TypeError("expected 'str', 'list[str]', 'set[str]', or " + 
                             "'None' for `rjust_columns`")
+        if not (column_types is None or 
+                (isinstance(column_types, dict) and 
+                 all(isinstance(k, str) and isinstance(v, str) 
+                     for k, v in column_types.items()))):
+            raise TypeError("expected 'dict[str, str]' or 'None' for " + 
+                            "`column_types`")
 
         # Value validation
         if (table_data is None) == (table_string is None):
             raise ValueError("Provide exactly one of 'table_data' or " +
                              "'table_string'.")
+        if not set((column_types or {}).values()) <= set(COLUMN_TYPES):
+            raise ValueError("expected column types of " + 
+                             f"{sorted(COLUMN_TYPES)}")
         
         # Get table     
-        if table_data: self._cap_keys(table_data)
+        if table_data is not None: self._cap_keys(table_data)
         else: self._rd_tbl(table_string)
+        self._set_typs(column_types or {}, table_data is not None)
         
         # Set attributes
         self._ttl = title.upper() if title else None
         self._rj_cols = set()
         if rjust_columns: self._add_rj_col_lbl(rjust_columns)
+        self._min_wds, self._prio, self._nt_cols = {}, {}, set()
+        self._wrp = False
+        self._rw_stys = {}
+        self._shrd = False
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Evaluate the predicates of a view when its records are first 
+            needed.
+
+        Args:
+            name: The name of the attribute not found.
+        
+        Returns:
+            The value of `_rows` or `_rec_ct` once evaluated.
+        
+        Raises:
+            AttributeError: If the attribute is not a pending one.
+        
+        Side effects:
+            _rows: Set indexes of records satisfying all predicates.
+            _rec_ct: Set record count.
+            _preds, _src_rows: Remove.
+        """
+        if name in {"_rows", "_rec_ct"} and "_preds" in vars(self):
+            tests = [pred(self) for pred in self._preds]
+            self._rows = [row for row in self._src_rows 
+                          if all(test(row) for test in tests)]
+            self._rec_ct = len(self._rows)
+            del self._preds, self._src_rows
+            return getattr(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no " + 
+                             f"attribute '{name}'")
 
     # Public Methods
+    def aggregate(self, key: str, func: str) -> Any:
+        """
+        Return an aggregate of the values of a column.
+
+        Args:
+            key: The key of the column.
+            func: The aggregate function, one of 'count' (of non-empty 
+                values), 'sum', 'min', or 'max'.
+        
+        Returns:
+            The aggregate of the values, or None for the minimum or 
+            maximum of no values.
+        
+        Raises:
+            KeyError: If the table has no column for the key.
+            TypeError: If the sum of a non-numeric column is requested.
+            ValueError: If the aggregate function is not supported.
+        """
+        return self._agg(self._rows, key.upper(), func)
+
+    def append(self, record: dict[str, Cell]) -> None:
+        """
+        Add a record to the end of the table.
+
+        Keys not in the table add columns, empty for the records 
+        before. Values other than text are kept as native values and 
+        displayed as text, as in the constructor, and the widest values 
+        of the columns are updated without a rescan.
+
+        Args:
+            record: A dictionary of column labels to cell values, either 
+                text or int, float, or datetime values.
+        
+        Raises:
+            TypeError: If the record is not a dictionary of strings to 
+                text, int, float, or datetime values.
+            ValueError: If a value of a typed column cannot be parsed.
+        
+        Side effects:
+            _cols: Add the cells of the record, and columns for its new 
+                keys.
+            _rows: Add the index of the record.
+            _rec_ct: Increment record count.
+            _max_wds: Widen columns to the cells of the record.
+            _typ_cols: Add the native values of the record, or drop 
+                columns to be parsed again.
+            _shrd: Clear after copying storage shared with another 
+                table.
+        """
+        # Type validation
+        if not (isinstance(record, dict) and 
+                all(isinstance(k, str) and 
+                    isinstance(v, (str, int, float, datetime)) 
+                    for k, v in record.items())):
+            raise TypeError("expected 'dict[str, str | int | float | " + 
+                            "datetime]' for `record`, not " + 
+                            f"{type(record).__name__}")
+        cells = {key.upper(): value for key, value in record.items()}
+
+        # Parse values of typed columns before changing the table
+        natives = {}
+        for key, value in cells.items():
+            parse = COLUMN_TYPES.get(self._typs.get(key))
+            if not isinstance(value, str): natives[key] = value
+            elif parse:
+                try:
+                    natives[key] = (None if value == "" 
+                                    else parse(value.strip()))
+                except ValueError as err:
+                    raise ValueError(f"cannot parse column '{key}' as " + 
+                                     f"'{self._typs[key]}': {err}") from None
+
+        # Copy storage shared with another table before changing it
+        if self._shrd:
+            self._cols = {key: column[:] if isinstance(column, list) 
+                          else column for key, column in self._cols.items()}
+            self._typ_cols = {key: values[:] if isinstance(values, list) 
+                              else values 
+                              for key, values in self._typ_cols.items()}
+            self._shrd = False
+
+        # Add the cells of the record, widening columns as needed
+        row = len(next(iter(self._cols.values()), self._rows))
+        self._add_cols(cells)
+        for key, column in self._cols.items():
+            value = cells.get(key, MISSING)
+            if not (value is MISSING or isinstance(value, str)):
+                value = self._fmt_val(value)
+            if not isinstance(column, list):
+                column = self._cols[key] = list(column)
+            column.append(value)
+            if value is not MISSING and key not in self._stl_cols:
+                self._max_wds[key] = max(self._max_wds[key], len(value))
+
+        # Add native values, dropping text columns to be parsed again
+        for key in list(self._typ_cols):
+            if key in natives or cells.get(key, "") == "":
+                values = self._typ_cols[key]
+                if not isinstance(values, list):
+                    values = self._typ_cols[key] = list(values)
+                values.append(natives.get(key))
+            else: del self._typ_cols[key]
+        for key in natives.keys() - self._typ_cols.keys():
+            self._typ_cols[key] = [None if value is MISSING or value == "" 
+                                   else value 
+                                   for value in self._cols[key][:-1]]
+            self._typ_cols[key].append(natives[key])
+
+        # Index and count the record
+        if isinstance(self._rows, list): self._rows.append(row)
+        elif self._rows == range(row): self._rows = range(row + 1)
+        else: self._rows = [*self._rows, row]
+        self._rec_ct += 1
+
     def count_records(self) -> int:
         """Return the number of records in the dataset."""
         return self._rec_ct
 
+    def diff(self, other: "Table", key: str = "NAME", 
+             unchanged: bool = False) -> "Table":
+        """
+        Return the records added, removed, or changed since another 
+            table.
+
+        Records are matched by their value for a key column through a 
+        hash index of the other table, so each table is read once. The 
+        records of this table come first, in order, then those removed 
+        from the other table. A first column, 'CHANGE', holds 'added', 
+        'removed', or 'changed', and each record is styled as in 
+        `DIFF_STYLES` when displayed.
+
+        Args:
+            other: The earlier table.
+            key: The key of the column identifying records, expected to 
+                be unique.
+            unchanged: If True, also include unchanged records, with an 
+                empty 'CHANGE', to display the whole table with its 
+                changes highlighted.
+        
+        Returns:
+            A table of the records, with the title and right-justified 
+            columns of this table.
+        
+        Raises:
+            TypeError: If `other` is not a table.
+            KeyError: If either table has no column for the key.
+        """
+        if not isinstance(other, Table):
+            raise TypeError("expected 'Table' for `other`")
+        key = key.upper()
+        new_ids, old_ids = self._cols[key], other._cols[key]
+
+        # Index the records of the other table by key
+        index = {old_ids[row]: row for row in other._rows}
+
+        # Read cells of both tables across the columns of either
+        keys = list(dict.fromkeys([*self._cols, *other._cols]))
+        cells = lambda tbl, row: {
+            k: tbl._cols[k][row] for k in keys 
+            if k in tbl._cols and tbl._cols[k][row] is not MISSING}
+
+        # Match records of this table, removing them from the index
+        records = []
+        for row in self._rows:
+            record = cells(self, row)
+            old_row = index.pop(new_ids[row], None)
+            change = ("added" if old_row is None else 
+                      "changed" if record != cells(other, old_row) else "")
+            if change or unchanged:
+                records.append({"CHANGE": change, **record})
+
+        # Add the records left in the index as removed
+        records.extend({"CHANGE": "removed", **cells(other, row)} 
+                       for row in index.values())
+
+        # Build table with rows styled by change
+        table = type(self)(table_data=records, title=self._ttl, 
+                           rjust_columns=self._rj_cols, validate="none")
+        table._rw_stys = {row: DIFF_STYLES[record["CHANGE"]] 
+                          for row, record in enumerate(records) 
+                          if record["CHANGE"]}
+        return table
+
+    def extend(self, records: Iterable[dict[str, Any]]) -> None:
+        """
+        Add records to the end of the table.
+
+        Args:
+            records: An iterable of records, as for `append`.
+        
+        Raises:
+            TypeError: If a record is not of the expected type.
+            ValueError: If a value of a typed column cannot be parsed.
+        """
+        for record in records: self.append(record)
+
     def filter_nonempty(self, key: str) -> None:
         """
         Filter records for non-empty values of the specified key.
@@ -126,13 +634,11 @@ class Table:
             key: The key for the filtered values.
         
         Side effects:
-            _ds: Replace with filtered dataset.
+            _rows: Replace with indexes of filtered records.
             _rec_ct: Update records count.
+            _stl_cols: Add columns whose widest value was filtered out.
         """
-        self._ds = [record for record in self._ds 
-                    if (key.upper() not in record 
-                        or record.get(key.upper(), '').strip())]
-        self._rec_ct = len(self._ds)
+        self._set_rows(self.where(nonempty(key))._rows)
 
     def filter_startswith(self, key: str, pfx: str) -> None:
         """
@@ -144,13 +650,131 @@ class Table:
             pfx: The prefix to match values.
         
         Side effects:
-            _ds: Replace with filtered dataset.
+            _rows: Replace with indexes of filtered records.
             _rec_ct: Update records count.
+            _stl_cols: Add columns whose widest value was filtered out.
+        """
+        self._set_rows(self.where(startswith(key, pfx))._rows)
+
+    @classmethod
+    def from_dataframe(cls, df: Any, index: bool = False, **kwargs: Any
+                       ) -> "Table":
+        """
+        Create a table sharing the arrays of a pandas DataFrame.
+
+        Columns of NumPy dtypes are shared without copying as the 
+        native values of the table; others are converted to object 
+        arrays with None for missing values. Cell text is formatted 
+        only when a cell is displayed or filtered, with missing values 
+        as empty text.
+
+        Args:
+            df: The DataFrame.
+            index: If True, include the index as the first columns.
+            **kwargs: Keyword arguments (`title`, `rjust_columns`) 
+                passed to the constructor; numeric columns are right-
+                justified unless `rjust_columns` is given.
+        
+        Returns:
+            A table of the rows of the DataFrame.
+        """
+        # Lazy import keeps pandas optional for other tables
+        import pandas as pd
+        from numpy import dtype as np_dtype
+        from pandas.api.types import is_numeric_dtype
+
+        if index: df = df.reset_index()
+        if kwargs.get("rjust_columns") is None:
+            kwargs["rjust_columns"] = [str(name) for name, dtype 
+                                       in df.dtypes.items() 
+                                       if is_numeric_dtype(dtype)]
+        table = cls(table_data=[], **kwargs)
+
+        # Share or convert each column's array of values
+        table._cols, table._typ_cols = {}, {}
+        for name, series in df.items():
+            if isinstance(series.dtype, np_dtype):
+                values = series.to_numpy(copy=False)
+            else:
+                values = series.to_numpy(dtype=object, na_value=None)
+            fmt = ((lambda value: str(pd.Timestamp(value))) 
+                   if series.dtype.kind == "M" else str)
+            table._cols[str(name).upper()] = TextColumn(values, fmt)
+            table._typ_cols[str(name).upper()] = values
+        
+        # Index and count the records
+        table._rows, table._rec_ct = range(len(df)), len(df)
+        table._max_wds, table._stl_cols = {}, set(table._cols)
+        return table
+
+    @classmethod
+    def from_json(cls, json_str: str, key: str | None = None, **kwargs: Any
+                  ) -> "Table":
+        """
+        Create a table from a JSON array of objects.
+
+        Args:
+            json_str: A JSON document holding the array of records.
+            key: The key of the array in the top-level object of the 
+                document, if the document is not the array itself 
+                (e.g., 'blockdevices' for `lsblk --json`).
+            **kwargs: Keyword arguments passed to `from_records`.
+        
+        Returns:
+            A table of the records in the array.
+        """
+        data = loads(json_str)
+        return cls.from_records(data if key is None else data[key], **kwargs)
+
+    @classmethod
+    def from_records(cls, records: list[dict[str, Any]], 
+                     flatten: bool = False, children_key: str = "children", 
+                     **kwargs: Any) -> "Table":
+        """
+        Create a table from a list of dictionaries with values of any 
+            type.
+
+        Values are formatted as cell text: `None` as an empty string, 
+        booleans as '1' or '0', and lists as their non-null items 
+        separated by commas.
+
+        Args:
+            records: The list of records.
+            flatten: If True, list each record's nested child records, 
+                depth first, after it; if False, omit child records.
+            children_key: The key of each record's child records.
+            **kwargs: Keyword arguments (`title`, `rjust_columns`, 
+                `column_types`, `validate`) passed to the constructor.
+        
+        Returns:
+            A table of the records.
         """
-        self._ds = [record for record in self._ds 
-                    if (key.upper() in record and 
-                        record.get(key.upper(), '').startswith(pfx))]
-        self._rec_ct = len(self._ds)
+        records = cls._flt_recs(records, children_key, flatten)
+        return cls(table_data=[{key: (value 
+                                      if isinstance(value, (int, float)) and 
+                                      not isinstance(value, bool) 
+                                      else cls._fmt_val(value)) 
+                                for key, value in record.items()} 
+                               for record in records], **kwargs)
+
+    def get_column(self, key: str) -> list[Any]:
+        """
+        Return the native values of a column for the records in the 
+            table.
+
+        Args:
+            key: The key of the column.
+        
+        Returns:
+            The values of the column, parsed for typed columns and as in 
+            `sort_by` otherwise, with None for empty or missing values.
+        
+        Raises:
+            KeyError: If the table has no column for the key.
+        """
+        values = self._get_typ_col(key.upper())
+        return [None if self._is_msng(values[row]) else values[row] 
+                for row in self._rows]
 
     def get_column_widths(self) -> dict[str, int]:
         """Return a dictionary of the column widths."""
@@ -158,9 +782,9 @@ class Table:
 
     def get_headings(self) -> dict[str, str]:
         """Return a dictionary of the column headings"""
-        return {key: key for key in self._ds[0].keys()}
+        return {key: key for key in self._cols}
 
-    def get_record(self, idx: int) -> dict[str, str]:
+    def get_record(self, idx: int) -> Record:
         """
         Retrieve a specific record from the dataset.
 
@@ -168,19 +792,33 @@ class Table:
             idx: The index of the record to retrieve.
         
         Returns:
-            The record at the specified index as a dictionary.
+            The record at the specified index as a read-only, 
+            dictionary-like `Record` view.
     
         Raises:
             IndexError: If the index is out of range of the dataset.
         """
-        if idx < 0 or idx >= len(self._ds):
+        if idx < 0 or idx >= self._rec_ct:
             raise IndexError("Index out of range.")
-        return self._ds[idx]
+        return Record(self, self._rows[idx])
 
     def get_rjust_columns(self) -> set[str]:
         """Return a set of right-justified columns."""
         return self._rj_cols
 
+    def get_row_style(self, idx: int) -> str | None:
+        """
+        Return the terminal style of a record.
+
+        Args:
+            idx: The index of the record.
+        
+        Returns:
+            The name of the style (e.g., 'green'), or None if the record 
+            is not styled.
+        """
+        return self._rw_stys.get(self._rows[idx])
+
     def get_table_width(self) -> int:
         """Return the width of the table."""
         return self._tbl_wd
@@ -189,25 +827,186 @@ class Table:
         """Return the title of the table."""
         return self._ttl
 
-    def put_table(self, is_mnu: bool = False) -> None:
+    def get_wrap(self) -> bool:
+        """Return whether cells wider than their columns are wrapped."""
+        return self._wrp
+
+    def group_by(self, key: str, **aggs: tuple[str, str]) -> "Table":
+        """
+        Return a table of aggregates of records grouped by the value of 
+            a column.
+
+        Groups are listed in order of their first record; records 
+        lacking the key are grouped under an empty value.
+
+        Args:
+            key: The key of the column to group by.
+            **aggs: The aggregate columns of the new table, each named 
+                by its keyword and given as a tuple of the key of the 
+                column to aggregate and the aggregate function (e.g., 
+                `TOTAL=("SIZE", "sum")`).
+        
+        Returns:
+            A table with a record for each group, holding the value of 
+            the column grouped by and the aggregates, right-justified.
+        
+        Raises:
+            KeyError: If the table has no column for a key.
+            TypeError: If the sum of a non-numeric column is requested.
+            ValueError: If an aggregate function is not supported.
+        """
+        # Group the records by value
+        column = self._cols[key.upper()]
+        groups = {}
+        for row in self._rows:
+            value = "" if column[row] is MISSING else column[row]
+            groups.setdefault(value, []).append(row)
+        
+        # Aggregate each group
+        records = [{key: value, 
+                    **{name: self._agg(rows, agg_key.upper(), func) 
+                       for name, (agg_key, func) in aggs.items()}} 
+                   for value, rows in groups.items()]
+        return type(self).from_records(records, title=self._ttl, 
+                                       rjust_columns=list(aggs), 
+                                       validate="none")
+
+    def head(self, count: int = 10) -> "Table":
+        """
+        Return a view of the first records of the table.
+
+        Args:
+            count: The number of records.
+        
+        Returns:
+            A table view of up to `count` records.
+        """
+        # Evaluate a view's records before copying its pending state
+        rows = self._rows[:max(count, 0)]
+        view = self._mk_vw()
+        view._rows, view._rec_ct = rows, len(rows)
+        return view
+
+    def put_live(self, source: Callable[[], "Table"], 
+                 interval: float = 1.0, frames: int | None = None, 
+                 output: ConsoleOutput | None = None) -> None:
+        """
+        Display the table, then refresh it in place from a source.
+
+        A new table is taken from `source` every `interval` seconds, 
+        and only the lines of the display that changed are rewritten, 
+        until `q` or Escape is pressed or the frames are drawn.
+
+        Args:
+            source: A function returning the table of the next frame, 
+                such as one listing devices.
+            interval: The seconds between frames.
+            frames: The number of frames to draw, or None to refresh 
+                until quit.
+            output: The backend to render to, or None for the terminal.
+        """
+        table = ConsoleTable(self, output)
+        table.live(self._lv_tbls(source, frames), interval)
+
+    def put_stream(self, records: Iterable[dict[str, Any]], 
+                   keep: bool = True, output: ConsoleOutput | None = None
+                   ) -> None:
+        """
+        Display records as they arrive, drawing the header once.
+
+        Columns are sized before the first record arrives, from the 
+        records already in the table, the headings, and the minimum 
+        widths (see `set_width_policy`); wider cells are truncated, or 
+        wrapped. A table without columns takes those of its first 
+        record. Once the records are exhausted, a kept table is redrawn 
+        at its final widths if a column widened and the rows drawn are 
+        still on the screen.
+
+        Args:
+            records: An iterable of records, as for `append`.
+            keep: If True, add the records to the table; if False, drop 
+                each record once drawn, so memory use stays bounded.
+            output: The backend to render to, or None for the terminal.
+        
+        Raises:
+            TypeError: If a kept record is not of the expected type.
+            ValueError: If a value of a typed column cannot be parsed.
+        """
+        records = iter(records)
+
+        # Take the columns of the first record if the table has none
+        if not self._cols:
+            first = next(records, None)
+            if first is None: return
+            self._add_cols(key.upper() for key in first)
+            records = chain([first], records)
+
+        # Size columns provisionally
+        self._set_wds()
+        self._col_wds = {key: max(width, self._min_wds.get(key, 0)) 
+                         for key, width in self._col_wds.items()}
+        self._tbl_wd = (sum(self._col_wds.values()) + 
+                        2 * (len(self._col_wds) - 1))
+        provisional = dict(self._col_wds)
+
+        # Draw each record as it arrives
+        table = ConsoleTable(self, output)
+        ln_ct = table.stream(self._strm_recs(records, keep))
+
+        # Redraw at the final widths
+        if keep:
+            self._set_wds()
+            if any(width > provisional.get(key, 0) 
+                   for key, width in self._col_wds.items()):
+                table.redisplay(ln_ct)
+
+    def put_table(self, is_menu: bool = False, 
+                  output: ConsoleOutput | None = None, page: bool = False
+                  ) -> None:
         """
         Pass table to `ConsoleTable` object for display.
 
         Args:
-            is_mnu: Whether the table to display is for a menu.
+            is_menu: Whether the table to display is for a menu, its 
+                records numbered as they are displayed.
+            output: The backend to render to, or None for the terminal.
+            page: If True, page through the table a screen at a time 
+                instead of displaying every record.
         """
         # Prepare table
-        if is_mnu: self._num_recs()
         self._set_wds()
 
         # Pass table to `ConsoleTable` object for display.
-        table = ConsoleTable(self)
-        table.display()
+        table = ConsoleTable(self, output, numbered=is_menu)
+        if page: table.page()
+        else: table.display()
+
+    def render(self, width: int = 79, styled: bool = False, 
+               is_menu: bool = False) -> str:
+        """
+        Return the table as it would be displayed, without a terminal.
+
+        Args:
+            width: The width of the console to render for.
+            styled: If True, include the ANSI styling of the terminal.
+            is_menu: Whether the table to render is for a menu.
+        
+        Returns:
+            The rendered lines of the table.
+        """
+        output = ConsoleOutput.headless(width, styled=styled)
+        self.put_table(is_menu, output=output)
+        return output.get_value()
 
     def resize_columns(self, wd_lim: int) -> None:
         """
         Resize column widths to fit within the specified width limit.
 
+        Columns are narrowed by priority, lowest first, and within a 
+        priority the widest columns are narrowed evenly down to their 
+        minimums (see `set_width_policy`). If the minimums do not fit, 
+        the table is left wider than the limit.
+
         Args:
             wd_lim: The maximum allowable width for the table.
         
@@ -217,19 +1016,250 @@ class Table:
         """
         # Calculate the total width to trim
         trim_length = self._tbl_wd - wd_lim
+        if trim_length <= 0: return
+
+        # Find the narrowest width of each column
+        floors = {key: (width if key in self._nt_cols 
+                        else min(width, self._min_wds.get(key, 1))) 
+                  for key, width in self._col_wds.items()}
+
+        # Trim columns by priority, lowest first
+        for prio in sorted({self._prio.get(key, 0) for key in floors}):
+            keys = [key for key in floors if self._prio.get(key, 0) == prio]
+            width = sum(self._col_wds[key] for key in keys)
+            trim = min(trim_length, width - sum(floors[key] for key in keys))
+            if trim > 0: self._fill_wds(keys, floors, width - trim)
+            trim_length -= trim
+            if trim_length == 0: break
 
-        # Trim columns in loop to satisfy width limit
-        while trim_length > 0:
+        # Update table width
+        self._tbl_wd = (sum(self._col_wds.values()) + 
+                        2 * (len(self._col_wds) - 1))
+
+    def set_width_policy(
+            self, minimums: dict[str, int] | None = None, 
+            priorities: dict[str, int] | None = None, 
+            no_truncate: str | list[str] | set[str] | None = None, 
+            heading_minimums: bool = False, wrap: bool = False) -> None:
+        """
+        Set how columns are narrowed to fit the display.
+
+        Args:
+            minimums: The minimum width of columns; other columns may be 
+                narrowed to a width of 1.
+            priorities: The priority of columns, 0 by default; columns 
+                of lower priority are narrowed first.
+            no_truncate: A string, list, or set of columns never 
+                narrowed (e.g., 'NAME').
+            heading_minimums: If True, no column is narrowed below the 
+                width of its heading.
+            wrap: If True, cells wider than their columns are wrapped 
+                onto more lines rather than truncated.
+        
+        Raises:
+            TypeError: If an argument is not of the expected type.
+        
+        Side effects:
+            _min_wds: Set minimum widths.
+            _prio: Set priorities.
+            _nt_cols: Set columns never truncated.
+            _wrp: Set whether cells are wrapped.
+        """
+        # Type validation
+        for name, arg in [("minimums", minimums), ("priorities", priorities)]:
+            if not (arg is None or 
+                    (isinstance(arg, dict) and 
+                     all(isinstance(k, str) and isinstance(v, int) 
+                         for k, v in arg.items()))):
+                raise TypeError("expected 'dict[str, int]' or 'None' for " + 
+                                f"`{name}`")
+        if not (no_truncate is None or isinstance(no_truncate, str) or 
+                (isinstance(no_truncate, (list, set)) and 
+                 all(isinstance(i, str) for i in no_truncate))):
+            raise TypeError("expected 'str', 'list[str]', 'set[str]', or " + 
+                            "'None' for `no_truncate`")
+
+        # Set attributes
+        self._min_wds = {key.upper(): width 
+                         for key, width in (minimums or {}).items()}
+        if heading_minimums:
+            self._min_wds = {key: max(len(key), self._min_wds.get(key, 0)) 
+                             for key in {*self._cols, *self._min_wds}}
+        self._prio = {key.upper(): prio 
+                      for key, prio in (priorities or {}).items()}
+        self._nt_cols = ({no_truncate.upper()} 
+                         if isinstance(no_truncate, str) 
+                         else {key.upper() for key in no_truncate or []})
+        self._wrp = wrap
+
+    def sort_by(self, *keys: str, reverse: bool = False) -> "Table":
+        """
+        Return a view of the records sorted by the values of columns.
+
+        Columns where every value is a number are sorted numerically, 
+        others as text; records lacking a value are sorted last.
+
+        Args:
+            *keys: The keys of the columns to sort by, in order of 
+                precedence.
+            reverse: If True, sort in descending order.
+        
+        Returns:
+            A table view of the records in sorted order.
+        
+        Raises:
+            KeyError: If the table has no column for a key.
+        """
+        cols = [self._get_typ_col(key.upper()) for key in keys]
+        rows = sorted(self._rows, reverse=reverse, 
+                      key=lambda row: tuple((self._is_msng(col[row]) 
+                                             != reverse, 
+                                             0 if self._is_msng(col[row]) 
+                                             else col[row]) 
+                                            for col in cols))
+        view = self._mk_vw()
+        view._rows, view._rec_ct = rows, len(rows)
+        return view
+
+    def to_dataframe(self) -> Any:
+        """
+        Return the records of the table as a pandas DataFrame.
+
+        Columns with native values, such as typed columns and columns 
+        from `from_dataframe`, keep them, sharing the arrays of a table 
+        from a DataFrame if none of its records were filtered or 
+        reordered; other columns hold their text, with None for missing 
+        values.
+
+        Returns:
+            A DataFrame with a column for each column of the table.
+        """
+        # Lazy import keeps pandas optional for other tables
+        import pandas as pd
+
+        rows = self._rows
+        is_all = isinstance(rows, range) and rows == range(len(rows))
+        data = {}
+        for key, column in self._cols.items():
+            values = self._typ_cols.get(key)
+            if values is None:
+                values = [None if column[row] is MISSING else column[row] 
+                          for row in rows]
+            elif not (is_all and len(values) == len(rows)):
+                values = (values[list(rows)] if hasattr(values, "dtype") 
+                          else [values[row] for row in rows])
+            data[key] = values
+        return pd.DataFrame(data, copy=False)
+
+    def where(self, pred: Predicate) -> "Table":
+        """
+        Return a view of the records satisfying a predicate.
+
+        The view shares the column storage of the table, and its 
+        records are selected, together with those of any `where` calls 
+        chained on it, when first needed. The table is unchanged.
+
+        Args:
+            pred: A predicate, such as `nonempty("MOUNTPOINT")` or 
+                `startswith("NAME", "sd")`.
+        
+        Returns:
+            A table view of the records satisfying the predicate.
+        """
+        view = self._mk_vw()
+
+        # Chain the predicate onto those not yet evaluated
+        if "_preds" in vars(self): view._preds = [*self._preds, pred]
+        else: view._src_rows, view._preds = self._rows, [pred]
+        vars(view).pop("_rows", None)
+        vars(view).pop("_rec_ct", None)
+        return view
+
+    def write(self, target: str | PathLike | TextIO, format: str = "csv"
+              ) -> None:
+        """
+        Write the records to a file or stream as CSV, JSON Lines, or 
+            Markdown.
+
+        Records are formatted one at a time into a buffer that is 
+        emptied into the target every `EXPORT_CHUNK` records and reused, 
+        so no copy of the whole table is built. CSV and Markdown begin 
+        with the headings, and Markdown aligns right-justified columns 
+        right; JSON Lines writes an object of the native values each 
+        record holds, as returned by `get_column`, with null for empty 
+        and missing values.
+
+        Args:
+            target: A path of a file to write, replaced if it exists, or 
+                a text stream (e.g., `sys.stdout`).
+            format: The format, one of 'csv', 'jsonl', or 'markdown'.
+        
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"expected one of {sorted(EXPORT_FORMATS)} " + 
+                             f"for `format`, not {format!r}")
+        if isinstance(target, (str, PathLike)):
+            with open(target, "w", encoding="utf-8", newline="") as stream:
+                self.write(stream, format)
+            return
+
+        # Prepare buffer and formatters
+        buffer = StringIO()
+        rows = writer(buffer, lineterminator="\n")
+        keys = list(self.get_headings())
+        natives = ({key: self._get_typ_col(key) for key in keys} 
+                   if format == "jsonl" else {})
+        cells = lambda rec: [str(rec.get(key, "")) for key in keys]
+        md_row = lambda texts: " | ".join(text.replace("|", "\\|") 
+                                          for text in texts)
 
-            # Find the column with the maximum width
-            widest_column = max(self._col_wds, key=self._col_wds.get)
+        # Write headings
+        match format:
+            case "csv": rows.writerow(keys)
+            case "markdown":
+                aligns = ["---:" if key in self._rj_cols else "---" 
+                          for key in keys]
+                buffer.write(f"| {md_row(keys)} |\n| {md_row(aligns)} |\n")
 
-            # Reduce and update widths
-            self._col_wds[widest_column] -= 1
-            trim_length -= 1
-            self._tbl_wd -= 1
+        # Write records, emptying the buffer into the target by chunks
+        for idx in range(self._rec_ct):
+            record = self.get_record(idx)
+            match format:
+                case "csv": rows.writerow(cells(record))
+                case "jsonl":
+                    row = self._rows[idx]
+                    values = {key: self._json_val(natives[key][row]) 
+                              for key in record}
+                    buffer.write(dumps(values, ensure_ascii=False) + "\n")
+                case "markdown": buffer.write(f"| {md_row(cells(record))} |\n")
+            if (idx + 1) % EXPORT_CHUNK == 0:
+                target.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+        target.write(buffer.getvalue())
 
     # Private Methods
+    def _add_cols(self, keys: Iterable[str]) -> None:
+        """
+        Add empty columns for labels not in the table.
+
+        The column map is replaced rather than changed, so views of the 
+        table do not gain the columns.
+
+        Args:
+            keys: The labels of the columns.
+        
+        Side effects:
+            _cols: Add columns holding `MISSING` for every record.
+            _max_wds: Set widest values of the new columns.
+        """
+        size = len(next(iter(self._cols.values()), self._rows))
+        new = {key: [MISSING] * size for key in keys if key not in self._cols}
+        self._cols = {**self._cols, **new}
+        self._max_wds.update(dict.fromkeys(new, 0))
+
     def _add_rj_col_lbl(self, lbl: str | list[str] | set[str]) -> None:
         """
         Add one or more labels to the set of right-justified columns.
@@ -245,20 +1275,147 @@ class Table:
         else:
             self._rj_cols.add(lbl.upper())
 
+    def _agg(self, rows: list[int], key: str, func: str) -> Any:
+        """
+        Aggregate the values of a column for a list of records.
+
+        Args:
+            rows: The indexes, in column storage, of the records.
+            key: The key of the column.
+            func: The aggregate function.
+        
+        Returns:
+            The aggregate of the non-empty values.
+        
+        Raises:
+            TypeError: If the sum of a non-numeric column is requested.
+            ValueError: If the aggregate function is not supported.
+        """
+        if func not in AGGREGATES:
+            raise ValueError(f"expected one of {sorted(AGGREGATES)} for " + 
+                             f"the aggregate function, not '{func}'")
+        column = self._get_typ_col(key)
+        values = [column[row] for row in rows 
+                  if not self._is_msng(column[row])]
+        match func:
+            case "count": return len(values)
+            case "max": return max(values, default=None)
+            case "min": return min(values, default=None)
+            case "sum":
+                if any(isinstance(value, str) for value in values):
+                    raise TypeError(f"cannot sum non-numeric column '{key}'")
+                return sum(values)
+
     def _cap_keys(self, tbl: list[dict[str, str]]) -> None:
         """
-        Capitalize table keys, set as dataset, count records.
+        Capitalize table keys, set columns as dataset, count records.
+
+        Records lacking a key hold `MISSING` in that key's column.
 
         Args:
             tbl: The list of dictionaries to process.
         
         Side effects:
-            _ds: Set table as dataset.
+            _cols: Set table columns as dataset.
+            _rows: Set indexes of all records.
             _rec_ct: Set record count.
+            _max_wds: Clear widest values.
+            _stl_cols: Set all columns to be counted.
+        """
+        self._cols = {}
+        for key in dict.fromkeys(key for datum in tbl for key in datum):
+            column = [datum.get(key, MISSING) for datum in tbl]
+
+            # Keys differing only in case share a column
+            if key.upper() in self._cols:
+                column = [old if new is MISSING else new 
+                          for old, new in zip(self._cols[key.upper()], 
+                                              column)]
+            self._cols[key.upper()] = column
+        self._rows = range(len(tbl))
+        self._rec_ct = len(tbl)
+        self._max_wds, self._stl_cols = {}, set(self._cols)
+        self._typ_cols = {}
+
+    def _fill_wds(self, keys: list[str], floors: dict[str, int], 
+                  total: int) -> None:
+        """
+        Narrow columns evenly to a total width.
+
+        The widest columns are cut down to a common level, and no column 
+        below its floor; any width left over goes to the rightmost 
+        columns at that level.
+
+        Args:
+            keys: The columns to narrow, in display order.
+            floors: The narrowest width of each column.
+            total: The total width of the columns once narrowed.
+        
+        Side effects:
+            _col_wds: Update widths of the columns.
+        """
+        widths = [self._col_wds[key] for key in keys]
+        mins = [floors[key] for key in keys]
+        fill = lambda lvl: sum(max(m, min(w, lvl)) 
+                               for w, m in zip(widths, mins))
+
+        # Find the highest level at which the columns fit
+        low, high = 0, max(widths)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if fill(mid) <= total: low = mid
+            else: high = mid - 1
+
+        # Set widths, giving any width left over to the rightmost columns
+        extra = total - fill(low)
+        for i in reversed(range(len(keys))):
+            width = max(mins[i], min(widths[i], low))
+            if extra and width == low and widths[i] > low:
+                width += 1
+                extra -= 1
+            self._col_wds[keys[i]] = width
+
+    @staticmethod
+    def _flt_recs(recs: list[dict[str, Any]], chld_key: str, flatten: bool
+                  ) -> list[dict[str, Any]]:
+        """
+        Flatten nested records into a list of records.
+
+        Args:
+            recs: The list of records, each possibly holding a list of 
+                child records.
+            chld_key: The key of each record's child records.
+            flatten: If True, list each record's child records, depth 
+                first, after it; if False, omit child records.
+        
+        Returns:
+            The list of records without their child records.
+        """
+        flat = []
+        for rec in recs:
+            flat.append({key: value for key, value in rec.items() 
+                         if key != chld_key})
+            if flatten and rec.get(chld_key):
+                flat.extend(Table._flt_recs(rec[chld_key], chld_key, True))
+        return flat
+
+    @staticmethod
+    def _fmt_val(value: Any) -> str:
         """
-        self._ds = [{key.upper(): value for key, value in datum.items()} 
-                    for datum in tbl]
-        self._rec_ct = len(self._ds)
+        Format a record value as cell text.
+
+        Args:
+            value: The value to format.
+        
+        Returns:
+            The text of the value.
+        """
+        if value is None: return ""
+        if isinstance(value, bool): return "1" if value else "0"
+        if isinstance(value, list):
+            return ",".join(Table._fmt_val(item) 
+                            for item in value if item is not None)
+        return str(value)
 
     def _fnd_bnds(self, col_idx: int, pos_lst: list[int], ln: str
                   ) -> tuple[int, int]:
@@ -308,10 +1465,77 @@ class Table:
                 line.
         """
         positions = []
+        start = 0
         for key in keys:
-            positions.append(hdr_ln.index(key))
+            positions.append(hdr_ln.index(key, start))
+            start = positions[-1] + len(key)
         return positions
 
+    def _fnd_col_spns(self, lines: list[str], keys: list[str], 
+                      pos_lst: list[int]
+                      ) -> list[tuple[int, int | None]] | None:
+        """
+        Find the span of each column from the whitespace profile of all 
+            lines.
+
+        A character position is occupied if any line has a non-
+        whitespace character there. Runs of occupied positions are 
+        matched to the headings they overlap, and runs beyond the start 
+        of the last heading belong to the last, ragged column.
+
+        Args:
+            lines: The lines of the table, including the header line.
+            keys: The list of column names in the header line.
+            pos_lst: A list of starting positions for each column.
+        
+        Returns:
+            A list of start and end positions for each column, with no 
+                end for the last column, or None if the runs cannot be 
+                matched one-to-one to the headings.
+        """
+        if not keys: return []
+
+        # Overlay the occupied positions of every line
+        profile = 0
+        for line in lines:
+            mask = line.encode("latin-1", "replace").translate(WHITESPACE_MASK)
+            profile |= int.from_bytes(mask, "little")
+        profile = profile.to_bytes((profile.bit_length() + 7) // 8, "little")
+
+        # Assign each run of occupied positions to a column
+        spans = [None] * len(keys)
+        for run in OCCUPIED_REGEX.finditer(profile):
+            start, end = run.span()
+            if start >= pos_lst[-1]: 
+                cols = [len(keys) - 1]
+            else: 
+                cols = [i for i, (pos, key) in enumerate(zip(pos_lst, keys)) 
+                        if pos < end and pos + len(key) > start]
+            if len(cols) != 1: return None
+            col = cols[0]
+            if spans[col]: start = spans[col][0]
+            spans[col] = (start, end)
+
+        # Leave the last column open for ragged lines
+        spans[-1] = (spans[-1][0], None)
+        return spans
+
+    def _get_max_wd(self, key: str) -> int:
+        """
+        Count the widest cell value of a column among the records in 
+            the table.
+
+        Args:
+            key: The label of the column.
+        
+        Returns:
+            The length of the widest value, or 0 if there is none.
+        """
+        column = self._cols[key]
+        values = (column[row] for row in self._rows)
+        return max((len(str(value)) for value in values 
+                    if value is not MISSING), default=0)
+
     def _get_slc(self, col_idx: int, pos_lst: list[int], ln: str) -> str:
         """
         Extract the text of a column from a line.
@@ -327,62 +1551,335 @@ class Table:
         start, end = self._fnd_bnds(col_idx, pos_lst, ln)
         return ln[start:end].strip()
 
-    def _num_recs(self) -> None:
+    def _get_typ_col(self, key: str) -> list:
+        """
+        Return the cell values of a column parsed for comparison.
+
+        The values of a column where every non-empty value is a number 
+        are parsed as numbers, and otherwise kept as text. Empty and 
+        missing values are None. Each column is parsed once.
+
+        Args:
+            key: The key of the column.
+        
+        Returns:
+            The parsed values, indexed as the column storage.
+        
+        Raises:
+            KeyError: If the table has no column for the key.
+        """
+        if key not in self._typ_cols:
+            values = [None if value is MISSING or value == "" else value 
+                      for value in self._cols[key]]
+            try:
+                numbers = [value if value is None or 
+                           isinstance(value, (int, float)) else 
+                           (float(value) if any(c in value for c in ".eE") 
+                            else int(value)) 
+                           for value in values]
+            except ValueError:
+                numbers = None
+            self._typ_cols[key] = values if numbers is None else numbers
+        return self._typ_cols[key]
+
+    @staticmethod
+    def _is_msng(value: Any) -> bool:
+        """
+        Return whether a native value is missing.
+
+        Besides None, the NaN and NaT values a DataFrame's arrays hold 
+        for missing values are missing, as they alone are unequal to 
+        themselves, and so is pandas' NA, whose comparisons have no 
+        truth value.
+
+        Args:
+            value: The native value.
+        
+        Returns:
+            True if the value is missing, else False.
         """
-        Add a new column numbering the records.
+        try:
+            return value is None or bool(value != value)
+        except TypeError:
+            return True
 
-        Side-effects:
-            _ds: update dataset with new numbered, right-justified 
-                column.
+    @staticmethod
+    def _json_val(value: Any) -> Any:
         """
-        # Number each record, beginning at 1
-        self._ds = [{"#": i + 1, **record} 
-                    for i, record in enumerate(self._ds)]
+        Convert a native value to one JSON can hold.
 
-        # Include in set of right-justified columns
-        self._add_rj_col_lbl("#")
+        Args:
+            value: The native value, such as a number of a DataFrame's 
+                array.
+        
+        Returns:
+            None for a missing value, an ISO 8601 string for a datetime, 
+            the Python number or boolean for a NumPy one, and the value 
+            itself or its text otherwise.
+        """
+        if Table._is_msng(value): return None
+        if isinstance(value, datetime): return value.isoformat()
+        if isinstance(value, (str, int, float)): return value
+        dtype = getattr(value, "dtype", None)
+        if dtype is not None and dtype.kind in "biuf": return value.item()
+        if dtype is not None and dtype.kind == "M":
+            return value.astype("M8[us]").item().isoformat()
+        return str(value)
+
+    def _lv_tbls(self, source: Callable[[], "Table"], frames: int | None
+                 ) -> Iterator["Table"]:
+        """
+        Yield this table, then the tables of `source`, sized to display.
+
+        Args:
+            source: A function returning the table of the next frame.
+            frames: The number of tables to yield, or None for no limit.
+        
+        Yields:
+            The table of each frame, with its column widths set.
+        """
+        for i in count() if frames is None else range(frames):
+            table = source() if i else self
+            table._set_wds()
+            yield table
+
+    def _mk_vw(self) -> "Table":
+        """
+        Make a view of the table sharing its column storage.
+
+        Returns:
+            A shallow copy of the table with its own width cache and 
+            right-justified columns, copying the column storage before 
+            it is first changed.
+        """
+        view = copy(self)
+        view._shrd = True
+        view._rj_cols = set(self._rj_cols)
+        view._max_wds, view._stl_cols = {}, set(self._cols)
+        return view
 
     def _rd_tbl(self, tbl_str: str) -> None:
         """
         Parse a table from a string input and set is as a dataset.
 
+        Column spans are found once from the whitespace profile of all 
+        lines and each line is sliced at them; when the profile does 
+        not separate the columns, each cell's boundaries are found 
+        instead. Repeated headings are suffixed with their occurrence 
+        number.
+
         Args:
             tbl_str (str): String input representing the table.
 
         Side effects:
-            _ds: Set table as dataset.
+            _cols: Set table columns as dataset.
+            _rows: Set indexes of all records.
             _rec_ct: Set record count.
+            _max_wds: Clear widest values.
+            _stl_cols: Set all columns to be counted.
         """
         # Split the input string into lines
         lines = tbl_str.splitlines()
 
-        if len(lines) > 0:
-            
-            # Get header information
-            headers = lines[0].split()
-            col_pos = self._fnd_col_pos(lines[0], headers)
+        # Get header information
+        hdr_ln = lines[0] if lines else ""
+        headers = hdr_ln.split()
+        col_pos = self._fnd_col_pos(hdr_ln, headers)
+        col_spns = self._fnd_col_spns(lines, headers, col_pos)
 
-            # Parse each subsequent line into a dictionary with header keys
-            self._ds = [{header.upper(): self._get_slc(index, col_pos, line) 
-                         for index, header in enumerate(headers)} 
-                        for line in lines[1:]]
-        
-        # Empty string
-        else: self._ds = []
+        # Slice each subsequent line at the precomputed column spans
+        if col_spns is not None:
+            columns = [[line[start:end].strip() for line in lines[1:]] 
+                       for start, end in col_spns]
+
+        # Fall back on finding the boundaries of each cell
+        else:
+            columns = [[self._get_slc(index, col_pos, line) 
+                        for line in lines[1:]] 
+                       for index in range(len(headers))]
+
+        # Set columns, numbering repeated headings from the second
+        self._cols = {}
+        for header, column in zip(headers, columns):
+            key, count = header.upper(), 1
+            while key in self._cols:
+                count += 1
+                key = f"{header.upper()}_{count}"
+            self._cols[key] = column
     
-        # Update the count of records in the dataset
-        self._rec_ct = len(self._ds)
+        # Index and count the records in the dataset
+        self._rows = range(max(len(lines) - 1, 0))
+        self._rec_ct = len(self._rows)
+        self._max_wds, self._stl_cols = {}, set(self._cols)
+        self._typ_cols = {}
+
+    def _set_rows(self, rows: list[int]) -> None:
+        """
+        Set the records in the table to a subset of its records.
+
+        A column's widest value is recounted only if a record holding a 
+        value of that width is removed.
+
+        Args:
+            rows: The indexes, in column storage, of the records kept.
+        
+        Side effects:
+            _rows: Set indexes of records.
+            _rec_ct: Set record count.
+            _stl_cols: Add columns whose widest value was removed.
+        """
+        kept = set(rows)
+        removed = [row for row in self._rows if row not in kept]
+        for key, column in self._cols.items():
+            if key in self._stl_cols: continue
+            width = self._max_wds[key]
+            if any(column[row] is not MISSING and 
+                   len(str(column[row])) == width for row in removed):
+                self._stl_cols.add(key)
+        self._rows = rows
+        self._rec_ct = len(rows)
+
+    def _set_typs(self, typs: dict[str, str], chk_vals: bool) -> None:
+        """
+        Set the native values of typed columns, keeping the cell text 
+            for display.
+
+        Args:
+            typs: A map of column labels to column types.
+            chk_vals: Whether columns may hold values other than text, 
+                which are then formatted as text for display.
+        
+        Raises:
+            ValueError: If a cell of a typed column cannot be parsed.
+        
+        Side effects:
+            _cols: Replace values other than text with their text.
+            _typs: Set the type of each typed column.
+            _typ_cols: Set native values of typed columns.
+        """
+        typs = self._typs = {key.upper(): typ for key, typ in typs.items()}
+        is_text = lambda value: value is MISSING or isinstance(value, str)
+        for key, column in self._cols.items():
+            parse = COLUMN_TYPES.get(typs.get(key))
+            has_vals = chk_vals and not all(map(is_text, column))
+            if parse is None and not has_vals: continue
+            
+            # Parse text, keeping values other than text as given
+            try:
+                self._typ_cols[key] = [
+                    None if value is MISSING or value == "" 
+                    else parse(value.strip()) 
+                    if parse and isinstance(value, str) else value 
+                    for value in column]
+            except ValueError as err:
+                raise ValueError(f"cannot parse column '{key}' as " + 
+                                 f"'{typs[key]}': {err}") from None
+            if has_vals:
+                self._cols[key] = [value if is_text(value) 
+                                   else self._fmt_val(value) 
+                                   for value in column]
 
     def _set_wds(self) -> None:
         """
         Calculate the column and tables.
 
+        Only columns marked stale are rescanned; the widest values of 
+        the others are kept from the previous display.
+
         Side effects:
+            _max_wds: Recount widest values of stale columns.
+            _stl_cols: Clear.
             _col_wds: Set widths mapped to their columns.
             _tbl_wd: Set width of the table including column padding.
         """
-        self._col_wds = {key: max(len(key), max(len(str(record[key])) 
-                                                for record in self._ds)) 
-                         for key in self._ds[0].keys()}
+        for key in self._stl_cols: self._max_wds[key] = self._get_max_wd(key)
+        self._stl_cols = set()
+        self._col_wds = {key: max(len(key), self._max_wds[key]) 
+                         for key in self._cols}
         self._tbl_wd = (sum(self._col_wds.values()) + 
                         2 * (len(self._col_wds) - 1))
+
+    def _strm_recs(self, recs: Iterator[dict[str, Any]], keep: bool
+                   ) -> Iterator[dict[str, str]]:
+        """
+        Yield the cells of records as they arrive.
+
+        Args:
+            recs: An iterator of records.
+            keep: Whether each record is added to the table.
+        
+        Yields:
+            The text of each record for the columns of the table when 
+            streaming began.
+        """
+        keys = list(self._cols)
+        for rec in recs:
+            if keep: self.append(rec)
+            cells = {key.upper(): value for key, value in rec.items()}
+            yield {key: self._fmt_val(cells.get(key)) for key in keys}
+
+
+def between(key: str, low: Any = None, high: Any = None) -> Predicate:
+    """
+    Create a predicate for records with a value for a key within 
+        inclusive bounds.
+
+    Values are compared as native values, such as the bytes of a 
+    'bytes' column; records lacking a value, and all records of tables 
+    lacking the key, do not satisfy the predicate.
+
+    Args:
+        key: The key for the filtered values.
+        low: The lowest value, or None for no lower bound.
+        high: The highest value, or None for no upper bound.
+    
+    Returns:
+        A predicate for `Table.where`.
+    """
+    def bind(tbl: "Table") -> Callable[[int], bool]:
+        if key.upper() not in tbl._cols: return lambda row: False
+        values = tbl._get_typ_col(key.upper())
+        return lambda row: (not Table._is_msng(values[row]) and 
+                            (low is None or values[row] >= low) and 
+                            (high is None or values[row] <= high))
+    return bind
+
+
+def nonempty(key: str) -> Predicate:
+    """
+    Create a predicate for records with a non-empty value for a key.
+
+    Records lacking the key, and all records of tables lacking the key, 
+    satisfy the predicate.
+
+    Args:
+        key: The key for the filtered values.
+    
+    Returns:
+        A predicate for `Table.where`.
+    """
+    def bind(tbl: "Table") -> Callable[[int], bool]:
+        column = tbl._cols.get(key.upper())
+        if column is None: return lambda row: True
+        return lambda row: column[row] is MISSING or bool(column[row].strip())
+    return bind
+
+
+def startswith(key: str, pfx: str) -> Predicate:
+    """
+    Create a predicate for records with a value for a key beginning 
+        with a prefix.
+
+    Args:
+        key: The key for the filtered values.
+        pfx: The prefix to match values.
+    
+    Returns:
+        A predicate for `Table.where`.
+    """
+    def bind(tbl: "Table") -> Callable[[int], bool]:
+        column = tbl._cols.get(key.upper())
+        if column is None: return lambda row: False
+        return lambda row: (column[row] is not MISSING and 
+                            column[row].startswith(pfx))
+    return bind
@@ -5,8 +5,11 @@ Functions:
     abort(signal, scr_name): Exit the script if the signal is True.
     get_calendar_difference(start, end): Calculate calendar-based date 
         difference.
+    get_calendar_differences(starts, ends): Calculate calendar-based 
+        date differences element-wise over arrays of dates.
     get_caller_info(): Retrieve function name, file, and line number of 
         the caller.
+    parse_size(text): Convert a human-readable size to bytes.
     snake_to_camel(snake_str): Convert a snake_case string to camelCase.
     truncate_string(strng, max_lngth): Truncate a string and append 
         ellipses.
@@ -14,9 +17,31 @@ Functions:
 from datetime import date, datetime
 from dateutil.relativedelta import relativedelta
 from inspect import currentframe
-from pandas import Timestamp
-from typing import Union
+from pandas import Timestamp, to_datetime
+from re import compile, IGNORECASE
+from typing import Any, NamedTuple, Union
 from sys import exit
+import numpy as np
+
+
+# Constants
+SIZE_REGEX = compile(r"\s*(\d+(?:\.\d*)?|\.\d+)\s*([KMGTPEZY]?)(?:i?B)?\s*", 
+                     IGNORECASE)
+SIZE_UNITS = "BKMGTPEZY"
+
+
+class CalendarDifference(NamedTuple):
+    """
+    Element-wise calendar-based differences between arrays of dates.
+
+    Attributes:
+        years (np.ndarray): Whole years of each difference.
+        months (np.ndarray): Remaining whole months of each difference.
+        days (np.ndarray): Remaining whole days of each difference.
+    """
+    years: np.ndarray
+    months: np.ndarray
+    days: np.ndarray
 
 
 def abort(signal: bool, scr_name: str) -> None:
@@ -49,6 +74,48 @@ def get_calendar_difference(start: Union[date, datetime, Timestamp],
     return relativedelta(end, start)
 
 
+def get_calendar_differences(starts: Any, ends: Any) -> CalendarDifference:
+    """
+    Calculate calendar-based differences between arrays of dates.
+
+    This is the array counterpart of `get_calendar_difference`, computed 
+    with NumPy datetime64 arithmetic instead of one `relativedelta` per 
+    pair. Each element matches the `years`, `months`, and `days` of 
+    `relativedelta(end, start)`, including the clamping of days past the 
+    end of shorter months.
+
+    Args:
+        starts (Any): The starting dates, as a scalar or array-like of 
+            dates, datetimes, Timestamps, or datetime64 values.
+        ends (Any): The ending dates, broadcast against `starts`.
+
+    Returns:
+        CalendarDifference: Float arrays of whole years, months, and 
+            days, with NaN where either date is missing.
+    """
+    start, end = np.broadcast_arrays(_to_datetime64(starts), 
+                                     _to_datetime64(ends))
+
+    # Month difference, stepped back if the shifted start passes the end
+    start_month = start.astype("M8[M]")
+    months = (end.astype("M8[M]") - start_month).astype(np.int64)
+    shifted = _add_months(start, months)
+    months -= (end >= start) & (end < shifted)
+    months += (end < start) & (end > shifted)
+    shifted = _add_months(start, months)
+
+    # Remaining whole days, truncated toward zero like `relativedelta`
+    remainder = (end - shifted).astype(np.int64)
+    days = np.sign(remainder) * (np.abs(remainder) // 86_400_000_000)
+    years = np.sign(months) * (np.abs(months) // 12)
+    months = np.sign(months) * (np.abs(months) % 12)
+
+    # Missing dates yield missing differences
+    missing = np.isnat(start) | np.isnat(end)
+    return CalendarDifference(*(np.where(missing, np.nan, part) 
+                                for part in (years, months, days)))
+
+
 def get_caller_info() -> dict[str, str]:
     """
     Retrieves information about the calling frame, including the 
@@ -67,6 +134,68 @@ def get_caller_info() -> dict[str, str]:
             "line": str(caller_frame.f_lineno)}
 
 
+def _add_months(dates: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """
+    Shift datetime64 values by whole months, clamping to month ends.
+
+    Args:
+        dates (np.ndarray): The datetime64[us] values to shift.
+        months (np.ndarray): The number of months to shift each value.
+
+    Returns:
+        np.ndarray: The shifted datetime64[us] values, keeping each time 
+            of day, with days past the end of the target month moved to 
+            its last day.
+    """
+    day = dates.astype("M8[D]")
+    day_index = (day - dates.astype("M8[M]").astype("M8[D]")).astype(np.int64)
+    target = dates.astype("M8[M]") + months
+    month_days = ((target + 1).astype("M8[D]") - 
+                  target.astype("M8[D]")).astype(np.int64)
+    return (target.astype("M8[D]") + np.minimum(day_index, month_days - 1) + 
+            (dates - day))
+
+
+def _to_datetime64(dates: Any) -> np.ndarray:
+    """
+    Convert dates to datetime64[us] values, keeping their shape.
+
+    Args:
+        dates (Any): A scalar or array-like of dates, datetimes, 
+            Timestamps, datetime64 values, or missing values such as 
+            `None` and `pd.NaT`.
+
+    Returns:
+        np.ndarray: The datetime64[us] values, with NaT for missing 
+            dates.
+    """
+    converted = to_datetime(np.ravel(dates))
+    return np.asarray(converted, dtype="M8[us]").reshape(np.shape(dates))
+
+
+def parse_size(text: str) -> int:
+    """
+    Convert a human-readable size, as printed by `lsblk` or `df -h`, 
+    to a number of bytes.
+
+    Unit prefixes are binary (1K = 1024 bytes) with or without a 'B', 
+    'iB', or space (e.g., '931.5G', '512B', '4 KiB').
+
+    Args:
+        text (str): The size to convert.
+
+    Returns:
+        int: The size in bytes, rounded to the nearest byte.
+
+    Raises:
+        ValueError: If the text is not a size.
+    """
+    match = SIZE_REGEX.fullmatch(text)
+    if not match: raise ValueError(f"invalid size: '{text}'")
+    number, unit = match.groups()
+    return round(float(number) * 1024 ** SIZE_UNITS.index(unit.upper() or "B"))
+
+
 def snake_to_allcaps(snake_str: str) -> str:
     words = snake_str.split('_')
     return ' '.join(word.upper() for word in words)
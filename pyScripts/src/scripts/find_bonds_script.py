@@ -7,6 +7,7 @@ from collections import deque
 from itertools import product
 from math import floor
 from scipy.optimize import newton
+import numpy as np
 import pandas as pd
 
 # Local module imports
@@ -68,6 +69,8 @@ HZ_MAP = "Frequency Map"
 CR_SCORE = "Credit Score"
 TA_RTN = "Taxable Return"
 TE_RTN = "Tax Exempt Return"
+CAP_GAINS_RATES = {MATURITY_DATE: "Maturity Capital Gains Rate", 
+                   NEXT_CALL_DATE: "Call Capital Gains Rate"}
 
 
 def compute_accrued_interest(last_coupon_date: pd.Timestamp, 
@@ -83,10 +86,10 @@ def compute_accrued_interest(last_coupon_date: pd.Timestamp,
     return (days / 360) * (coupon_rate / 100) * 1000
 
 
-def compute_return(dates: list[pd.Timestamp], row: pd.Series, tax: bool
-                   ) -> float:
+def compute_return(dates: list[pd.Timestamp], row: pd.Series, tax: bool, 
+                   end_dt: str) -> float:
     if dates:
-        amounts = list_cashflow_amounts(dates, row, tax)
+        amounts = list_cashflow_amounts(dates, row, tax, end_dt)
         cashflows = pd.Series(data=amounts[1:], index=dates[1:])
         xirr = compute_xirr(cashflows)
     else:
@@ -125,14 +128,6 @@ def combine_data(dfs: list[pd.DataFrame]) -> pd.DataFrame:
     return df
 
 
-def get_capital_gains_rate(row: pd.Series, purchase_dt: pd.Timestamp, 
-                           maturity_dt: pd.Timestamp) -> float:
-    hold_period = utl.get_calendar_difference(purchase_dt, maturity_dt).years
-    de_minimus_threshold = 0.0025 * hold_period * 100.
-    is_ordinary_income = row[ASK_PRICE] < 100. - de_minimus_threshold
-    return FED_TAX + VA_TAX if is_ordinary_income else CAP_GAINS_TAX
-
-
 def get_marginal_tax_rate(row: pd.Series) -> float:
     fed_rate = 0. if row[BOND_TYPE] == "MUNICIPAL" else FED_TAX
     st_rate = (0. 
@@ -151,7 +146,8 @@ def evaluate_bonds(row: pd.Series, settlement: pd.Timestamp) -> pd.Series:
 def find_bonds() -> None:
     settlement = pdu.offset_date(pd.Timestamp.today().normalize(), biz_dys=1)
     df = prepare_data()
-    df = df.apply(lambda row: evaluate_bonds(row, settlement), axis=1)
+    df = set_capital_gains_rates(df, settlement)
+    df = pdu.parallel_apply(df, evaluate_bonds, axis=1, args=(settlement,))
     put_data(df)
 
 
@@ -175,19 +171,17 @@ def filter_returns(df: pd.DataFrame, tax_exempt: bool) -> pd.DataFrame:
     return df[acceptable_return]
 
 
-def list_cashflow_amounts(dates: list[pd.Timestamp], row: pd.Series, tax: bool
-                          ) -> list[float]:
+def list_cashflow_amounts(dates: list[pd.Timestamp], row: pd.Series, tax: bool, 
+                          end_dt: str) -> list[float]:
     # Extract Dates
     if len(dates) == 0: return []
     last_coupon = dates[0]
     settlement = dates[1]
     pending_coupons = dates[2:-1] if len(dates) > 3 else []
-    redemption = dates[-1]
 
     # Set Tax Rates
     income_tax = get_marginal_tax_rate(row) if tax else 0.
-    cap_gains = (get_capital_gains_rate(row, settlement, redemption) 
-                 if tax else 0.)
+    cap_gains = row[CAP_GAINS_RATES[end_dt]] if tax else 0.
     
     # Amounts
     purchase_price = row[ASK_PRICE] * 10 + 1
@@ -285,6 +279,18 @@ def read_files() -> dict[str, pd.DataFrame]:
     }
 
 
+def set_capital_gains_rates(df: pd.DataFrame, settlement_dt: pd.Timestamp
+                            ) -> pd.DataFrame:
+    for end_dt, rate_col in CAP_GAINS_RATES.items():
+        hold_period = utl.get_calendar_differences(settlement_dt, 
+                                                   df[end_dt]).years
+        de_minimus_threshold = 0.0025 * hold_period * 100.
+        is_ordinary_income = df[ASK_PRICE] < 100. - de_minimus_threshold
+        df[rate_col] = np.where(is_ordinary_income, FED_TAX + VA_TAX, 
+                                CAP_GAINS_TAX)
+    return df
+
+
 def set_credit_score(df: pd.DataFrame) -> pd.DataFrame:
     moody_map = {k.upper(): v for k, v in k.CREDIT_RATINGS["Moody's"].items()}
     s_p_map = k.CREDIT_RATINGS["S&P"]
@@ -316,7 +322,7 @@ def set_returns(row: pd.Series, settlement_dt: pd.Timestamp) -> pd.Series:
     xirr_types = product(end_dates, tax_options)
     dates_map = {end_date: list_cashflow_dates(end_date, settlement_dt, row) 
                  for end_date in end_dates}
-    returns_map = {(end, tax): compute_return(dates_map[end], row, tax) 
+    returns_map = {(end, tax): compute_return(dates_map[end], row, tax, end) 
                    for end, tax in xirr_types}
     row[TA_RTN] = min_if_not_na(returns_map[(MATURITY_DATE, True)], 
                                 returns_map[(NEXT_CALL_DATE, True)])
@@ -324,7 +330,7 @@ def set_returns(row: pd.Series, settlement_dt: pd.Timestamp) -> pd.Series:
                                 returns_map[(NEXT_CALL_DATE, False)])
     row[TA_RTN] = round_percentage(row[TA_RTN])
     row[TE_RTN] = round_percentage(row[TE_RTN])
-    row.drop(labels=HZ_MAP, inplace=True)
+    row.drop(labels=[HZ_MAP, *CAP_GAINS_RATES.values()], inplace=True)
     return row
 
 
@@ -8,38 +8,96 @@ selecting a disk, and confirming the selection. The user is repeatedly
 prompted to connect and select a disk until a disk is successfully confirmed.
 
 Functions:
-    check_disk(caller): Prompts the user to check disk connections and offers 
-        the option to quit the script.
+    await_response(prompt, disks): Awaits the response to a prompt, or a 
+        change to the connected disks.
+    check_disk(caller, disks): Prompts the user to check disk connections 
+        and offers the option to quit the script, until the disks change.
     confirm_disk(disk): Prompts the user to confirm the selection of a disk.
     get_disks(): Retrieves a list of currently connected disks.
+    report_changes(disks, previous): Reports the disks connected, 
+        disconnected, or changed since the previous listing.
     select_disk(disks): Prompts the user to select a disk from a list.
     get_disk(): Main function to handle the disk selection and confirmation 
         process.
-    main(): Clears the screen and initiates the disk selection process.
+    main(argv): Clears the screen and initiates the disk selection process, 
+        writes the connected disks in a machine-readable format, or 
+        watches them.
 
 Usage:
     Run this script directly to initiate the disk selection process. The script 
     can be integrated into other tools by importing the `get_disk` function.
+    Run with `--format csv`, `jsonl`, or `markdown` to write the connected 
+    disks to standard output instead, for use by other tools, or with 
+    `--watch SECONDS` to monitor them, refreshed in place.
+
+Constants:
+    CHANGE_LABELS (dict): Labels reporting each kind of change to disks.
+    DISK_POLL (float): The seconds between listings of the connected disks 
+        while a prompt is open.
 """
+# Standard library imports
+from argparse import ArgumentParser
+from asyncio import create_task, run, to_thread, wait
+from sys import stdout
+
 # Local module imports
 from modules import commands as cmd
 from modules import utilities as utl
 from modules import Console, ConsolePrompt, Menu, Table
+from modules.table import EXPORT_FORMATS
+
+
+# Constants
+CHANGE_LABELS = {"added": "new device", 
+                 "changed": "changed device", 
+                 "removed": "removed device"}
 
+DISK_POLL = 1.0
 
-def check_disk(caller):
+
+async def await_response(prompt: ConsolePrompt, disks: Table | None
+                         ) -> str | None:
+    """
+    Await the response to a prompt while polling for disk changes.
+
+    Args:
+        prompt: The prompt awaited.
+        disks: The disks listed when prompting, or None to await the 
+            response only.
+
+    Returns:
+        The response, or None if the connected disks changed first.
+    """
+    task = create_task(prompt.acall())
+    while disks is not None and not task.done():
+        await wait({task}, timeout=DISK_POLL)
+        if task.done(): break
+        current = await to_thread(get_disks)
+        if disks.diff(current, key="NAME").count_records():
+            task.cancel()
+            print()
+            return None
+    return await task
+
+
+def check_disk(caller, disks=None):
     """
     Prompt user to check device connections and present option to quit.
 
+    While the prompt is open, the connected disks are listed every 
+    `DISK_POLL` seconds, and the prompt is closed once they change.
+
     Args:
         caller: The calling file name.
+        disks: The disks listed when prompting, or None to wait for a 
+            key only.
 
     Exit:
         The script terminates at user's discretion.
     """
     msg = "Press 'q' to quit, or check disks and press any key to continue..."
     prmpt = ConsolePrompt(msg, expect_keystroke=True)
-    rspns = prmpt.call()
+    rspns = run(await_response(prmpt, disks))
     utl.abort(rspns in {"q", "Q"}, caller)
     
 
@@ -56,8 +114,10 @@ def confirm_disk(disk: str) -> bool:
     prompt = f"Are you sure you want to select the disk '{disk}'? (y/n) "
     output = cmd.list_block_devices(disk, 
                                     columns=["NAME", "TYPE", "FSTYPE", "LABEL", 
-                                             "MOUNTPOINTS"])
-    partitions = Table(title="selected device", table_string=output)
+                                             "MOUNTPOINTS"], 
+                                    as_json=True)
+    partitions = Table.from_json(output, key="blockdevices", flatten=True, 
+                                 title="selected device", validate="none")
     print()
     partitions.put_table()
     disk_confirmation = ConsolePrompt(prompt, expect_keystroke=True, 
@@ -80,6 +140,22 @@ def get_disks() -> Table:
     return disks
 
 
+def report_changes(disks: Table, previous: Table | None) -> None:
+    """
+    Report the disks connected, disconnected, or changed since the 
+    previous listing.
+
+    Args:
+        disks: The current list of disks.
+        previous: The previous list of disks, or None if there is none.
+    """
+    if previous is None: return
+    changes = disks.diff(previous, key="NAME")
+    for i in range(changes.count_records()):
+        change = changes.get_record(i)
+        print(f"{CHANGE_LABELS[change['CHANGE']]}: {change['NAME']}")
+
+
 def select_disk(disks: Table) -> str:
     """
     Prompt the user to select a disk from a list of disks.
@@ -109,13 +185,16 @@ def get_disk() -> str:
     """
     caller_info = utl.get_caller_info()
     Console.put_script_banner(caller_info["function"])
+    previous = None
 
     while True:
         disks = get_disks()
+        report_changes(disks, previous)
+        previous = disks
         count = disks.count_records()
 
         if count == 0:
-            check_disk(caller_info["file"])
+            check_disk(caller_info["file"], disks)
             continue
 
         disk = (disks.get_record(0)["NAME"] 
@@ -130,12 +209,34 @@ def get_disk() -> str:
                                                  validate_bool=True)
             if unmount_confirmation.call():
                 cmd.unmount_disk(disk)
-            check_disk(caller_info["file"])
+            check_disk(caller_info["file"], disks)
 
     return disk
 
 
-def main() -> str:
+def main(argv: list[str] | None = None) -> None:
+    """
+    Select a disk, or write or watch the connected disks.
+
+    Args:
+        argv: The command-line arguments, or None to read `sys.argv`.
+    """
+    parser = ArgumentParser(prog="get-disk", 
+                            description="Select and confirm a connected disk.")
+    parser.add_argument("--format", choices=sorted(EXPORT_FORMATS), 
+                        help="write the connected disks to standard output " + 
+                             "in this format instead of selecting one")
+    parser.add_argument("--watch", type=float, metavar="SECONDS", 
+                        help="show the connected disks, refreshed in place " + 
+                             "at this interval, instead of selecting one")
+    args = parser.parse_args(argv)
+
+    if args.format:
+        get_disks().write(stdout, format=args.format)
+        return
+    if args.watch:
+        get_disks().put_live(get_disks, interval=args.watch)
+        return
     Console.clear_screen()
     print(get_disk())
 
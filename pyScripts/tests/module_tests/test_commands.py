@@ -10,31 +10,38 @@ def rc_mck(mocker):
 
 # Test listBlockDevices
 @pytest.mark.parametrize(
-    "disk, cols, shw_deps, exp_cmnd", 
+    "disk, cols, shw_deps, as_json, exp_cmnd", 
     [
         # Test case 1: Command to list block devices
-        (None, [], True, "lsblk"),
+        (None, [], True, False, "lsblk"),
 
         # Test case 2: Command to list /dev/sda disk and partitions
-        ("sda", [], True, "lsblk /dev/sda"), 
+        ("sda", [], True, False, "lsblk /dev/sda"), 
 
         # Test case 3: Command to print specified output columns
-        (None, ["NAME", "SIZE"], True, "lsblk --output NAME,SIZE"), 
+        (None, ["NAME", "SIZE"], True, False, "lsblk --output NAME,SIZE"), 
 
         # Test case 4: Command to not print slaves
-        (None, [], False, "lsblk --nodeps"), 
+        (None, [], False, False, "lsblk --nodeps"), 
 
         # Test case 5: Command to print with columns and without slaves
-        ("sda", ["NAME", "TYPE"], False, 
-         "lsblk --nodeps --output NAME,TYPE /dev/sda")
+        ("sda", ["NAME", "TYPE"], False, False, 
+         "lsblk --nodeps --output NAME,TYPE /dev/sda"), 
+
+        # Test case 6: Command to print JSON
+        (None, [], True, True, "lsblk --json --bytes"), 
+
+        # Test case 7: Command to print JSON with all options
+        ("sda", ["NAME", "SIZE"], False, True, 
+         "lsblk --nodeps --json --bytes --output NAME,SIZE /dev/sda")
     ]
 )
-def test_list_block_devices(rc_mck, disk, cols, shw_deps, exp_cmnd):
+def test_list_block_devices(rc_mck, disk, cols, shw_deps, as_json, exp_cmnd):
     # Setup
     rc_mck.return_value = "Mock Block Devices List"
 
     # Execute
-    act_out = cmd.list_block_devices(disk, cols, shw_deps)
+    act_out = cmd.list_block_devices(disk, cols, shw_deps, as_json)
 
     # Verify
     rc_mck.assert_called_once_with(exp_cmnd)
@@ -146,16 +153,17 @@ def test_run_command(mocker, cmnd, mock_rtn, capt_out, exp_out, should_raise):
 # Test unmountDisk
 def test_unmount_disk(mocker, rc_mck):
     # Setup runCommand mock
-    mck_lsblk_out = ("PATH       MOUNTPOINT\n"
-                     "/dev/sda1  /mnt/point1\n"
-                     "/dev/sda2  /mnt/point2\n")
+    mck_lsblk_out = ('{"blockdevices": [{"path": "/dev/sda", '
+                     '"mountpoint": null, "children": ['
+                     '{"path": "/dev/sda1", "mountpoint": "/mnt/point1"}, '
+                     '{"path": "/dev/sda2", "mountpoint": "/mnt/point2"}]}]}')
     rc_mck.side_effect = [mck_lsblk_out,  # First call for lsblk
                           None,           # Second call for umount
                           None]           # Third call for umount
     
     # Setup mock Table
     T_pch = mocker.patch("modules.commands.Table")
-    mck_T = T_pch.return_value
+    mck_T = T_pch.from_json.return_value
     mck_T.filter_nonempty.return_value = None
     mck_T.count_records.return_value = 2
     mck_T.get_record.side_effect = [{"PATH": "/dev/sda1", 
@@ -167,7 +175,8 @@ def test_unmount_disk(mocker, rc_mck):
     cmd.unmount_disk("sda")
 
     # Verify runCommand calls
-    rc_mck.assert_any_call("lsblk --output PATH,MOUNTPOINT /dev/sda")
+    rc_mck.assert_any_call("lsblk --json --bytes --output PATH,MOUNTPOINT " + 
+                           "/dev/sda")
     rc_mck.assert_any_call("sudo umount --verbose /dev/sda1", 
                                      capture_output=False)
     rc_mck.assert_any_call("sudo umount --verbose /dev/sda2", 
@@ -175,5 +184,7 @@ def test_unmount_disk(mocker, rc_mck):
     assert rc_mck.call_count == 3
 
     # Verify Table method calls
-    T_pch.assert_called_once_with(table_string=mck_lsblk_out)
+    T_pch.from_json.assert_called_once_with(mck_lsblk_out, 
+                                            key="blockdevices", flatten=True, 
+                                            validate="none")
     mck_T.filter_nonempty.assert_called_once_with("MOUNTPOINT")
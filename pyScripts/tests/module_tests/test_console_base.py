@@ -1,14 +1,144 @@
+import pytest
 from blessed import Terminal
-from modules.console import ConsoleBase
+from io import BytesIO, StringIO
+from modules.console import ConsoleBase, ConsoleOutput
 
 
 def test_console_base_constructor(mocker):
     # Setup
     mck_T = mocker.Mock(spec=Terminal)
     mocker.patch("modules.console.Terminal", return_value=mck_T)
+    mocker.patch.object(ConsoleOutput, "_ssn", None)
+    mocker.patch("modules.console.signal")
 
     # Execute
     CB_inst = ConsoleBase()
 
     # Verify
     assert CB_inst._trm == mck_T
+    assert CB_inst._out is ConsoleOutput.session()
+
+
+# Test ConsoleBase with an output backend
+def test_console_base_output():
+    # Setup
+    output = ConsoleOutput.headless(width=100, height=30)
+
+    # Execute
+    CB_inst = ConsoleBase(output)
+
+    # Verify
+    assert CB_inst._out is output
+    assert CB_inst._trm is output.get_terminal()
+    assert CB_inst._get_wd() == 100
+    assert CB_inst._get_ht() == 30
+
+
+# Test ConsoleBase with an invalid output
+def test_console_base_output_invalid():
+    with pytest.raises(TypeError):
+        ConsoleBase(StringIO())
+
+
+# Test ConsoleOutput constructor with invalid arguments
+@pytest.mark.parametrize(
+    "kwargs, exp_err",
+    [
+        ({"width": "79"}, TypeError),   # Test case 1: Width not an int
+        ({"height": True}, TypeError),  # Test case 2: Height a bool
+        ({"width": 0}, ValueError),     # Test case 3: Width not positive
+        ({"styled": "no"}, TypeError)   # Test case 4: Styled not a bool
+    ]
+)
+def test_console_output_invalid(kwargs, exp_err):
+    with pytest.raises(exp_err):
+        ConsoleOutput(StringIO(), **kwargs)
+
+
+# Test ConsoleOutput styling
+@pytest.mark.parametrize("styled, exp_out", 
+                         [(False, "text"),                 # Test case 1
+                          (True, "\x1b[34mtext\x1b[m")])   # Test case 2
+def test_console_output_styled(styled, exp_out):
+    # Setup
+    output = ConsoleOutput.headless(styled=styled)
+
+    # Execute
+    output.write(output.get_terminal().blue("text"))
+
+    # Verify
+    assert output.get_value() == exp_out
+
+
+# Test ConsoleOutput write
+@pytest.mark.parametrize(
+    "stream, exp_out",
+    [
+        # Test case 1: Text buffer
+        (StringIO(), "║ sda ║\n"),
+
+        # Test case 2: Bytes buffer
+        (BytesIO(), "║ sda ║\n".encode("utf-8"))
+    ]
+)
+def test_console_output_write(stream, exp_out):
+    # Setup
+    output = ConsoleOutput(stream)
+
+    # Execute
+    output.write("║ sda ")
+    output.write("║\n", flush=True)
+
+    # Verify
+    assert output.get_value() == exp_out
+    assert output.get_width() == output.get_terminal().width
+    assert output.get_height() == output.get_terminal().height
+
+
+# Test ConsoleOutput write to standard output
+def test_console_output_stdout(capsys):
+    # Execute
+    ConsoleOutput().write("text", flush=True)
+
+    # Verify
+    assert capsys.readouterr().out == "text"
+    with pytest.raises(TypeError):
+        ConsoleOutput().get_value()
+
+
+# Test ConsoleOutput session shared by console classes
+def test_console_output_session(mocker):
+    # Setup
+    mocker.patch.object(ConsoleOutput, "_ssn", None)
+    mck_sig = mocker.patch("modules.console.signal")
+
+    # Execute
+    bases = [ConsoleBase(), ConsoleBase()]
+
+    # Verify
+    assert bases[0]._out is bases[1]._out is ConsoleOutput.session()
+    assert bases[0]._trm is bases[1]._trm
+    mck_sig.assert_called_once()
+
+
+# Test ConsoleOutput size refreshed on resize
+def test_console_output_resize(mocker):
+    # Setup
+    mck_T = mocker.Mock(spec=Terminal, height=24, width=80)
+    mocker.patch("modules.console.Terminal", return_value=mck_T)
+    prev = mocker.Mock()
+    mocker.patch("modules.console.getsignal", return_value=prev)
+    mck_sig = mocker.patch("modules.console.signal")
+    output = ConsoleOutput()
+    output._hndl_rsz()
+    handler = mck_sig.call_args.args[1]
+
+    # Execute and verify cached size
+    assert output.get_width() == 80
+    mck_T.width = 120
+    assert output.get_width() == 80
+
+    # Execute and verify size after resize
+    handler(28, None)
+    assert (output.get_height(), output.get_width()) == (24, 120)
+    prev.assert_called_once_with(28, None)
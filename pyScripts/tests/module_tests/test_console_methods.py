@@ -33,7 +33,7 @@ def test_clear_screen(mck_T, mck_CB, pnt_mck):
 
 def test_put_script_banner(mck_T, mck_CB, pnt_mck):
     # Setup
-    mck_T.width = 36
+    mck_CB.return_value._get_wd.return_value = 36
     mck_T.reverse = lambda text: f"<reverse>{text}</reverse>"
     exp_pnt_arg = "<reverse>Running mockScript...               </reverse>"
 
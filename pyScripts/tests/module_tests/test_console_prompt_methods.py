@@ -1,6 +1,7 @@
+import asyncio
 import pytest
 from blessed import keyboard, Terminal
-from modules import ConsolePrompt
+from modules import ConsoleOutput, ConsolePrompt
 
 
 @pytest.fixture
@@ -35,6 +36,70 @@ def pa_mck(mocker, CP_inst):
     return mocker.patch.object(CP_inst, "_put_alrt")
 
 
+# Test acall
+@pytest.mark.parametrize(
+    "keystroke, keys, exp_out",
+    [
+        # Test case 1: Keystroke after polls
+        (True, ["", "", "a"], "a"), 
+
+        # Test case 2: String after polls
+        (False, ["a", "", "b", "\n"], "ab"), 
+
+        # Test case 3: Timed out
+        (True, ["", ""], "default")
+    ]
+)
+def test_acall(mocker, CP_inst, cb_mck, hc_mck, keystroke, keys, exp_out):
+    # Setup
+    mocker.patch("modules.console.PROMPT_POLL", 0.001)
+    cb_mck.return_value.__exit__.return_value = False
+    hc_mck.return_value.__exit__.return_value = False
+    CP_inst._exp_kst = keystroke
+    key_iter = iter([keyboard.Keystroke(key) for key in keys])
+    CP_inst._trm.inkey.side_effect = lambda **kwargs: next(
+        key_iter, keyboard.Keystroke(""))
+    CP_inst._trm.yellow = CP_inst._trm.green = lambda x: x
+    ticks = []
+
+    async def run():
+        async def tick():
+            while True:
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+        ticker = asyncio.create_task(tick())
+        result = await CP_inst.acall(timeout=0.05, default="default")
+        ticker.cancel()
+        return result
+
+    # Execute
+    result = asyncio.run(run())
+
+    # Verify
+    assert result == exp_out
+    assert len(ticks) >= keys.count("")
+    CP_inst._trm.inkey.assert_called_with(timeout=0)
+    assert CP_inst._e_ct == {"yes/no": 0, "NaN": 0, "OOR": 0, "OOL": 0}
+
+
+# Test acall until valid
+def test_acall_valid(mocker):
+    # Setup
+    CP_inst = ConsolePrompt("Mock prompt")
+    gr_mck = mocker.patch.object(CP_inst, "_aget_resp")
+    vr_mck = mocker.patch.object(CP_inst, "_val_resp", 
+                                 side_effect=[False, True])
+    CP_inst._vld_resp = "mocked response"
+
+    # Execute
+    act_out = asyncio.run(CP_inst.acall())
+
+    # Verify
+    assert gr_mck.await_count == 2
+    assert vr_mck.call_count == 2
+    assert act_out == "mocked response"
+
+
 # Test call
 def test_call(mocker):
     # Setup instance and method and attribue mocks
@@ -175,7 +240,7 @@ def test_get_resp(mocker, CP_inst, keystroke, leave_cur):
 )
 def test_pnt_msg(CP_inst, width, padding, message, is_inline, capfd):
     # Setup display width
-    CP_inst._trm.width = width
+    CP_inst._out = ConsoleOutput(width=width)
 
     # Execute and capture
     CP_inst._pnt_msg(message, fmt_alloc=0, kp_cur_inline=is_inline)
@@ -198,8 +263,8 @@ def test_put_alrt(CP_inst, capfd):
     CP_inst._put_alrt("Alert message", 1)
     out, err = capfd.readouterr()
 
-    # Verify capture
-    assert out == "[red]Alert message[/red]\n"
+    # Verify capture, after clearing the prompt line
+    assert out == "\033[F\033[K[red]Alert message[/red]\n"
     assert err == ""
 
 
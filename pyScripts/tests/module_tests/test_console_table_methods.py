@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import call
-from blessed import Terminal
-from modules import ConsoleTable, Table
+from blessed import keyboard, Terminal
+from modules import ConsoleOutput, ConsoleTable, Table
 
 
 ROW_ENDS = {"top": ("<blue>╔</blue>", "<blue>╗</blue>", ""), 
@@ -59,6 +59,8 @@ def mck_Tb(mocker):
     mck.get_rjust_columns.return_value = {"COL B"}
     mck.get_column_widths.return_value = {"COL A": 5, "COL B": 5}
     mck.get_table_width.return_value = 12
+    mck.get_wrap.return_value = False
+    mck.get_row_style.return_value = None
     return mck
 
 @pytest.fixture
@@ -67,6 +69,19 @@ def CT_inst(mck_Tb, mck_Tm):
     inst._trm = mck_Tm
     inst._col_wds = mck_Tb.get_column_widths.return_value
     inst._tbl_wd = mck_Tb.get_table_width.return_value
+    inst._mrg_sz = 0
+    inst._set_tmpls()
+    return inst
+
+
+@pytest.fixture
+def pgr_inst():
+    tbl = Table(table_data=[{"Name": f"sd{i}", "Size": f"{i}G"} 
+                            for i in range(50)], title="disks")
+    tbl._set_wds()
+    inst = ConsoleTable(tbl, ConsoleOutput.headless(width=40, height=10))
+    inst._set_dims()
+    inst._set_tmpls()
     return inst
 
 
@@ -76,6 +91,7 @@ def test_display(mocker, mck_Tb, record_count):
     # Setup
     CT_inst = ConsoleTable(mck_Tb)
     mocker.patch.object(CT_inst, "_set_dims")
+    mocker.patch.object(CT_inst, "_set_tmpls")
     mocker.patch.object(CT_inst, "_drw_tbl")
     mocker.patch.object(CT_inst._data, "count_records", return_value=record_count)
 
@@ -84,10 +100,213 @@ def test_display(mocker, mck_Tb, record_count):
 
     # Verify
     CT_inst._set_dims.assert_called_once()
+    CT_inst._set_tmpls.assert_called_once()
     CT_inst._data.count_records.assert_called_once()
     CT_inst._drw_tbl.assert_called_once_with(record_count)
 
 
+# Test live
+@pytest.mark.parametrize(
+    "keys, exp_count",
+    [
+        (["", "", ""], 3),     # Test case 1: Tables exhausted
+        (["", "q", ""], 2),    # Test case 2: Quit
+        (["KEY_ESCAPE"], 1)    # Test case 3: Quit with Escape
+    ]
+)
+def test_live(mocker, pgr_inst, keys, exp_count):
+    # Setup
+    tables = [mocker.Mock(spec=Table) for _ in range(3)]
+    drawn = []
+    mocker.patch.object(pgr_inst, "_rndr_frm", 
+                        side_effect=lambda: [str(len(drawn))])
+    mocker.patch.object(pgr_inst, "_drw_dlt", 
+                        side_effect=lambda prev, lines: drawn.append(
+                            (prev, lines, pgr_inst._data)))
+    mocker.patch.object(pgr_inst._trm, "inkey", side_effect=[
+        keyboard.Keystroke(name=key) if key.startswith("KEY_") 
+        else keyboard.Keystroke(key) for key in keys])
+
+    # Execute
+    result = pgr_inst.live(iter(tables), interval=0)
+
+    # Verify
+    assert result == exp_count
+    assert drawn == [([str(i - 1)] if i else [], [str(i)], tables[i]) 
+                     for i in range(exp_count)]
+
+
+# Test page
+@pytest.mark.parametrize(
+    "keys, exp_tops",
+    [
+        # Test case 1: Scroll by line, clamped at the first record
+        (["KEY_DOWN", "j", "k", "KEY_UP", "KEY_UP"], [0, 1, 2, 1, 0, 0]), 
+
+        # Test case 2: Scroll by page, then to the last and first records
+        (["KEY_PGDOWN", " ", "b", "G", "g"], [0, 4, 8, 4, 46, 0]), 
+
+        # Test case 3: Find the next match of the last search
+        (["/", "n", "n", "x"], [0, 5, 15, 25, 25])
+    ]
+)
+def test_page(mocker, pgr_inst, keys, exp_tops):
+    # Setup
+    tops = []
+    mocker.patch.object(pgr_inst, "_drw_pg", 
+                        side_effect=lambda top, *args: tops.append(top) or 4)
+    mocker.patch.object(pgr_inst, "_get_key", side_effect=[*keys, "q"])
+    mocker.patch.object(pgr_inst, "_read_pg_ln", return_value=("5", 5))
+
+    # Execute
+    pgr_inst.page()
+
+    # Verify
+    assert tops == exp_tops
+
+
+# Test page jumping to a record
+@pytest.mark.parametrize("entry, exp_top", [("7", 6),     # Test case 1
+                                            ("99", 49),   # Test case 2
+                                            ("x", 0),     # Test case 3
+                                            (None, 0)])   # Test case 4
+def test_page_jump(mocker, pgr_inst, entry, exp_top):
+    # Setup
+    tops = []
+    mocker.patch.object(pgr_inst, "_drw_pg", 
+                        side_effect=lambda top, *args: tops.append(top) or 4)
+    mocker.patch.object(pgr_inst, "_get_key", side_effect=[":", "q"])
+    mocker.patch.object(pgr_inst, "_read_pg_ln", return_value=(entry, 0))
+
+    # Execute
+    pgr_inst.page()
+
+    # Verify
+    pgr_inst._read_pg_ln.assert_called_once_with(0, ":")
+    assert tops == [0, exp_top]
+
+
+# Test redisplay
+@pytest.mark.parametrize("line_count, exp_out", [(5, True), (24, False)])
+def test_redisplay(mocker, CT_inst, line_count, exp_out, capfd):
+    # Setup
+    CT_inst._out = ConsoleOutput(height=24)
+    CT_inst._trm.move_up = mocker.Mock(side_effect=lambda n: f"<up {n}>")
+    CT_inst._trm.clear_eos = "<clear>"
+    mocker.patch.object(CT_inst, "display")
+
+    # Execute
+    result = CT_inst.redisplay(line_count)
+    out, err = capfd.readouterr()
+
+    # Verify
+    assert result == exp_out
+    assert out == (f"<up {line_count}><clear>" if exp_out else "")
+    assert CT_inst.display.call_count == int(exp_out)
+
+
+# Test stream
+@pytest.mark.parametrize("row_count", [0, 1, 9])
+def test_stream(mocker, CT_inst, row_count):
+    # Setup
+    mocker.patch.object(CT_inst, "_set_dims")
+    mocker.patch.object(CT_inst, "_set_tmpls")
+    mocker.patch.object(CT_inst, "_drw_rw", return_value=2)
+    mocker.patch.object(CT_inst, "_flsh")
+    rows = [{"COL A": str(i), "COL B": ""} for i in range(row_count)]
+
+    # Execute
+    result = CT_inst.stream(iter(rows))
+
+    # Verify
+    CT_inst._set_dims.assert_called_once()
+    exp_calls = [call("top"), 
+                 call("title"), 
+                 call("inner"), 
+                 call("headings"), 
+                 *[call("record", cont=row) for row in rows], 
+                 call("bottom")]
+    assert CT_inst._drw_rw.call_args_list == exp_calls
+    assert CT_inst._flsh.call_count == row_count + 2
+    assert result == 2 * len(exp_calls)
+
+
+# Test drawDelta
+@pytest.mark.parametrize(
+    "prev, lines, exp_out",
+    [
+        # Test case 1: First frame
+        ([], ["a", "b"], "<0>a<eol><1>b<eol>"), 
+
+        # Test case 2: One line changed
+        (["a", "b", "c"], ["a", "x", "c"], "<1>x<eol>"), 
+
+        # Test case 3: Frame grown
+        (["a"], ["a", "b"], "<1>b<eol>"), 
+
+        # Test case 4: Frame shrunk
+        (["a", "b", "c"], ["a"], "<1><eos>"), 
+
+        # Test case 5: No change
+        (["a"], ["a"], "")
+    ]
+)
+def test_drw_dlt(mocker, CT_inst, prev, lines, exp_out, capfd):
+    # Setup
+    CT_inst._trm.move_yx = mocker.Mock(side_effect=lambda y, x: f"<{y}>")
+    CT_inst._trm.clear_eol = "<eol>"
+    CT_inst._trm.clear_eos = "<eos>"
+
+    # Execute
+    CT_inst._drw_dlt(prev, lines)
+    out, err = capfd.readouterr()
+
+    # Verify
+    assert out == exp_out
+    assert CT_inst._buf == []
+
+
+# Test drawPage
+@pytest.mark.parametrize(
+    "top, status, exp_shown, exp_status",
+    [
+        # Test case 1: First page
+        (0, None, 4, "1-4 of 50  ↑↓ PgUp PgDn Home End  :ro..."), 
+
+        # Test case 2: Last records
+        (48, None, 2, "49-50 of 50  ↑↓ PgUp PgDn Home End  :..."), 
+
+        # Test case 3: Status given
+        (10, "/sd1", 4, "/sd1")
+    ]
+)
+def test_drw_pg(pgr_inst, top, status, exp_shown, exp_status):
+    # Execute
+    result = pgr_inst._drw_pg(top, status)
+    lines = pgr_inst._out.get_value().split("\n")
+
+    # Verify
+    assert result == exp_shown
+    assert lines[4:4 + exp_shown] == [f"║ {f'sd{i}':<4}  {f'{i}G':<4} ║" 
+                                      for i in range(top, top + exp_shown)]
+    assert lines[-1] == exp_status.ljust(40)
+    assert pgr_inst._buf == []
+
+
+# Test drawPage with records too tall for the page
+def test_drw_pg_wrap(pgr_inst):
+    # Setup
+    pgr_inst._wrp = True
+    pgr_inst._col_wds = {"NAME": 2, "SIZE": 4}
+
+    # Execute
+    result = pgr_inst._drw_pg(0)
+
+    # Verify
+    assert result == 2
+    assert len(pgr_inst._out.get_value().split("\n")) == 10
+
+
 # Test drawRow
 @pytest.mark.parametrize(
     "row_type, ends_in, raw_in, proc_in, record_idx, is_line_type, exp_out",
@@ -160,35 +379,52 @@ def test_drw_rw(mocker, CT_inst, mck_Tb, row_type, ends_in, raw_in, proc_in,
     mocker.patch.object(CT_inst, "_get_rw_ends", return_value=ends_in)
     mocker.patch.object(CT_inst, "_get_rw_cntnt", return_value=raw_in)
     mocker.patch.object(CT_inst, "_proc_rw_cntnt", return_value=proc_in)
-    
-    # Setup attribute and method argument
-    CT_inst._mrg_sz = 0
-    rjust_col = (mck_Tb.get_rjust_columns.return_value 
-                 if row_type == "record" else {})
+    CT_inst._set_tmpls()
 
     # Execute
-    CT_inst._drw_rw(row_type, record_idx)
+    result = CT_inst._drw_rw(row_type, record_idx)
     out, err = capfd.readouterr()
 
     # Verify method calls
-    if row_type == "record":
-        CT_inst._data.get_rjust_columns.assert_called_once()
-    CT_inst._get_rw_ends.assert_called_once_with(row_type, is_line_type)
+    CT_inst._get_rw_ends.assert_any_call(row_type, is_line_type)
     if row_type in ["title", "headings", "record"]:
         CT_inst._get_rw_cntnt.assert_called_once_with(row_type, record_idx)
-        CT_inst._proc_rw_cntnt.assert_called_once_with(row_type, raw_in, 
-                                                       rjust_col)
+        CT_inst._proc_rw_cntnt.assert_called_once_with(row_type, raw_in)
     
-    # Verify output    
-    assert out == exp_out
+    # Verify row buffered, not yet written
+    assert CT_inst._buf == [exp_out]
+    assert out == ""
     assert err == ""
+    assert result == 1
+
+
+# Test drawRow with a styled record
+def test_drw_rw_style(mocker, CT_inst, mck_Tb, capfd):
+    # Setup
+    mck_Tb.get_row_style.return_value = "green"
+    CT_inst._trm.green = mocker.Mock(side_effect=lambda x: f"<green>{x}" + 
+                                                           "</green>")
+
+    # Execute
+    CT_inst._drw_rw("record", 0)
+    CT_inst._flsh()
+    out, err = capfd.readouterr()
+
+    # Verify
+    mck_Tb.get_row_style.assert_called_once_with(0)
+    assert out == ("<blue>║</blue> <green>abc  </green>  " + 
+                   "<green>  123</green> <blue>║</blue>\n")
 
 
 # Test drawTable
 @pytest.mark.parametrize("record_count", [0, 1, 9])
 def test_drw_tbl(mocker, CT_inst, record_count):
     # Setup
-    mocker.patch.object(CT_inst, "_drw_rw")
+    mocker.patch("modules.console.RENDER_CHUNK", 8)
+    mocker.patch.object(CT_inst, "_drw_rw", 
+                        side_effect=lambda *args: CT_inst._buf.append(""))
+    mocker.patch.object(CT_inst, "_flsh", 
+                        side_effect=lambda: CT_inst._buf.clear())
 
     # Execute
     CT_inst._drw_tbl(record_count)
@@ -202,6 +438,35 @@ def test_drw_tbl(mocker, CT_inst, record_count):
                  call("bottom")]
     CT_inst._drw_rw.assert_has_calls(exp_calls)
     assert CT_inst._drw_rw.call_count == len(exp_calls)
+    assert CT_inst._flsh.call_count == (2 if record_count == 9 else 1)
+
+
+# Test flush
+def test_flsh(CT_inst, capfd):
+    # Setup
+    CT_inst._buf.extend(["row 1\n", "row 2\n"])
+
+    # Execute
+    CT_inst._flsh()
+    out, err = capfd.readouterr()
+
+    # Verify
+    assert out == "row 1\nrow 2\n"
+    assert CT_inst._buf == []
+
+
+# Test findRecord
+@pytest.mark.parametrize(
+    "query, start, exp_out",
+    [
+        ("SD4", 0, 4),     # Test case 1: Case-insensitive match
+        ("4", 5, 14),      # Test case 2: Match after start
+        ("sd1", 45, 1),    # Test case 3: Wrapped around
+        ("sdz", 0, None)   # Test case 4: No match
+    ]
+)
+def test_fnd_rec(pgr_inst, query, start, exp_out):
+    assert pgr_inst._fnd_rec(query, start) == exp_out
 
 
 # Test getRowContent
@@ -278,15 +543,64 @@ def test_proc_rw_cntnt(mck_Tb, CT_inst, row_type, exp_out):
             content = mck_Tb.get_headings.return_value
         case "record":
             content = mck_Tb.get_record.return_value
-    rjust_col = mck_Tb.get_rjust_columns.return_value
     
     # Execute
-    act_out = CT_inst._proc_rw_cntnt(row_type, content, rjust_col)
+    act_out = CT_inst._proc_rw_cntnt(row_type, content)
 
     # Verify
     assert act_out == exp_out
 
 
+# Test readPageLine
+@pytest.mark.parametrize(
+    "srch, keys, exp_out, exp_statuses, exp_tops",
+    [
+        # Test case 1: Record number entered, with a backspace
+        (False, ["1", "2", "KEY_BACKSPACE", "3", "KEY_ENTER"], ("13", 2), 
+         [":", ":1", ":12", ":1", ":13"], [2, 2, 2, 2, 2]), 
+
+        # Test case 2: Search moving to the match as typed
+        (True, ["s", "d", "3", "0", "KEY_ENTER"], ("sd30", 30), 
+         ["/", "/s", "/sd", "/sd3", "/sd30"], [2, 2, 2, 3, 30]), 
+
+        # Test case 3: Search cancelled
+        (True, ["s", "d", "4", "KEY_ESCAPE"], (None, 2), 
+         ["/", "/s", "/sd", "/sd4"], [2, 2, 2, 4])
+    ]
+)
+def test_read_pg_ln(mocker, pgr_inst, srch, keys, exp_out, exp_statuses, 
+                    exp_tops):
+    # Setup
+    mocker.patch.object(pgr_inst, "_drw_pg")
+    mocker.patch.object(pgr_inst, "_get_key", side_effect=keys)
+
+    # Execute
+    result = pgr_inst._read_pg_ln(2, exp_statuses[0], srch=srch)
+
+    # Verify
+    assert result == exp_out
+    assert pgr_inst._drw_pg.call_args_list == [
+        call(top, status) for top, status in zip(exp_tops, exp_statuses)]
+
+
+# Test renderFrame
+@pytest.mark.parametrize("height, exp_count", [(10, 10),    # Test case 1
+                                               (99, 55)])   # Test case 2
+def test_rndr_frm(pgr_inst, height, exp_count):
+    # Setup
+    pgr_inst._out = ConsoleOutput(width=40, height=height)
+    pgr_inst._buf.append("pending")
+
+    # Execute
+    result = pgr_inst._rndr_frm()
+
+    # Verify
+    assert len(result) == exp_count
+    assert result[:2] == ["╔════════════╗", "║   DISKS    ║"]
+    assert result[4] == "║ sd0   0G   ║"
+    assert pgr_inst._buf == ["pending"]
+
+
 # Test setDimensions
 @pytest.mark.parametrize(
     "term_wd, tbl_wds, col_wds, dply_wd", 
@@ -300,7 +614,7 @@ def test_proc_rw_cntnt(mck_Tb, CT_inst, row_type, exp_out):
 def test_set_dims(mck_Tm, mck_Tb, CT_inst, term_wd, tbl_wds, col_wds, 
                   dply_wd):
     # Setup
-    mck_Tm.width = term_wd
+    CT_inst._out = ConsoleOutput(width=term_wd)
     mck_Tb.get_table_width.side_effect = tbl_wds
     mck_Tb.get_column_widths.return_value = col_wds
 
@@ -319,3 +633,71 @@ def test_set_dims(mck_Tm, mck_Tb, CT_inst, term_wd, tbl_wds, col_wds,
     assert CT_inst._mrg_sz == (term_wd - dply_wd) // 2
     assert CT_inst._tbl_wd == tbl_wds[-1]
     assert CT_inst._col_wds == col_wds
+
+
+# Test setDimensions and getRowContent of numbered records
+def test_set_dims_numbered(mck_Tb, CT_inst):
+    # Setup
+    CT_inst._out = ConsoleOutput(width=79)
+    CT_inst._num = True
+    mck_Tb.count_records.return_value = 12
+    mck_Tb.get_table_width.side_effect = [80, 71]
+
+    # Execute
+    CT_inst._set_dims()
+    CT_inst._set_tmpls()
+
+    # Verify
+    mck_Tb.resize_columns.assert_called_once_with(71)
+    assert CT_inst._tbl_wd == 75
+    assert CT_inst._col_wds == {"#": 2, "COL A": 5, "COL B": 5}
+    assert CT_inst._tmpls["#"] == "{:>2}"
+    assert CT_inst._get_rw_cntnt("headings") == {
+        "#": "#", **ROW_CONTENT["raw"]["hdg"]}
+    assert CT_inst._get_rw_cntnt("record", 4) == {
+        "#": 5, **ROW_CONTENT["raw"]["rec"]}
+
+
+# Test setTemplates
+def test_set_tmpls(CT_inst):
+    # Setup
+    CT_inst._mrg_sz = 2
+
+    # Execute
+    CT_inst._set_tmpls()
+
+    # Verify
+    assert CT_inst._mrg == "  "
+    assert CT_inst._ends["top"] == ROW_ENDS["top"]
+    assert CT_inst._ends["record"] == ROW_ENDS["txt"]
+    assert CT_inst._fills == {"top": ROW_CONTENT["prc"]["top"], 
+                              "inner": ROW_CONTENT["prc"]["inr"], 
+                              "bottom": ROW_CONTENT["prc"]["btm"]}
+    assert CT_inst._tmpls == {"COL A": "{:<5}", "COL B": "{:>5}"}
+    assert CT_inst._wrp is False
+
+
+# Test wrapRow
+@pytest.mark.parametrize(
+    "content, exp_out",
+    [
+        # Test case 1: Content fits
+        (
+            {"COL A": "abc", "COL B": "123"}, 
+            [{"COL A": "abc", "COL B": "123"}]
+        ), 
+        # Test case 2: Content wrapped onto more lines
+        (
+            {"COL A": "ab cd efghijk", "COL B": ""}, 
+            [{"COL A": "ab cd", "COL B": ""}, 
+             {"COL A": "efghi", "COL B": ""}, 
+             {"COL A": "jk", "COL B": ""}]
+        )
+    ]
+)
+def test_wrp_rw(CT_inst, content, exp_out):
+    # Execute
+    act_out = CT_inst._wrp_rw(content)
+
+    # Verify
+    assert act_out == exp_out
@@ -0,0 +1,216 @@
+import pytest
+import bz2
+import gzip
+import lzma
+import pandas as pd
+from io import BytesIO
+from modules import pd_utils as pdu
+
+
+CSV_TEXT = ("a,b\n1,2\n3,4\n"
+            "\n \n"
+            "Disclaimer text\n"
+            "\n"
+            "x,y\r\n5,6\r\n\r\n")
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    file_path = tmp_path / "sections.csv"
+    file_path.write_bytes(CSV_TEXT.encode("utf-8"))
+    return str(file_path)
+
+
+@pytest.fixture(params=["plain", "bz2", "gzip", "xz", "magic", "path"])
+def any_csv_path(request, tmp_path):
+    data = CSV_TEXT.encode("utf-8")
+    match request.param:
+        case "plain": file_name, data = "sections.csv", data
+        case "bz2": file_name, data = "sections.csv.bz2", bz2.compress(data)
+        case "gzip": file_name, data = "sections.csv.gz", gzip.compress(data)
+        case "xz": file_name, data = "sections.csv.xz", lzma.compress(data)
+        case "magic": file_name, data = "sections.dat", gzip.compress(data)
+        case "path": file_name, data = "sections.csv.gz", gzip.compress(data)
+    file_path = tmp_path / file_name
+    file_path.write_bytes(data)
+    return file_path if request.param == "path" else str(file_path)
+
+
+# Test detectCompression
+@pytest.mark.parametrize(
+    "file_name, content, exp_out",
+    [
+        ("a.csv", b"a,b\n", None),             # Test case 1: Plain text
+        ("a.csv.gz", b"", "gzip"),             # Test case 2: Extension
+        ("a.CSV.ZST", b"", "zstd"),            # Test case 3: Upper case
+        ("a.csv", b"\x1f\x8b\x08", "gzip"),    # Test case 4: gzip magic
+        ("a.csv", b"\xfd7zXZ\x00", "xz"),      # Test case 5: xz magic
+        ("a", b"BZh91AY", "bz2")               # Test case 6: bzip2 magic
+    ]
+)
+def test_detect_compression(tmp_path, file_name, content, exp_out):
+    # Setup
+    file_path = tmp_path / file_name
+    file_path.write_bytes(content)
+
+    # Execute
+    act_out = pdu._detect_compression(str(file_path))
+
+    # Verify
+    assert act_out == exp_out
+
+
+# Test findSections
+@pytest.mark.parametrize(
+    "buffer, exp_ranges",
+    [
+        # Test case 1: Single section without trailing newline
+        (b"a,b\n1,2", [(0, 7)]),
+
+        # Test case 2: Sections split by a blank line
+        (b"a\n1\n\nb\n2\n", [(0, 4), (5, 9)]),
+
+        # Test case 3: Whitespace-only and repeated blank lines
+        (b"a\n1\n \t\n\r\nb\n", [(0, 4), (9, 11)]),
+
+        # Test case 4: Leading and trailing blank lines
+        (b"\n\na\n\n\n", [(2, 4)]),
+
+        # Test case 5: Empty buffer
+        (b"", [])
+    ]
+)
+def test_find_sections(buffer, exp_ranges):
+    # Execute
+    act_ranges = list(pdu._find_sections(buffer))
+
+    # Verify
+    assert act_ranges == exp_ranges
+
+
+# Test streamSections
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 64])
+def test_stream_sections(chunk_size):
+    # Setup
+    stream = BytesIO(CSV_TEXT.encode("utf-8"))
+
+    # Execute
+    sections = [section.read() 
+                for section in pdu._StreamSections(stream, chunk_size)]
+
+    # Verify
+    assert sections == [b"a,b\n1,2\n3,4\n", b"Disclaimer text\n", 
+                        b"x,y\r\n5,6\r\n"]
+
+
+# Test iterCsvSections with chunks
+def test_iter_csv_sections_chunked(any_csv_path):
+    # Execute
+    chunks = [[chunk.shape for chunk in reader] 
+              for reader in pdu.iter_csv_sections(any_csv_path, chunksize=1)]
+
+    # Verify
+    assert chunks == [[(1, 2), (1, 2)], [(0, 1)], [(1, 2)]]
+
+
+# Test readCsvSections
+def test_read_csv_sections(any_csv_path):
+    # Execute
+    sections = pdu.read_csv_sections(any_csv_path, names=["bonds"])
+
+    # Verify
+    assert list(sections) == ["bonds", 1, 2]
+    pd.testing.assert_frame_equal(sections["bonds"],
+                                  pd.DataFrame({"a": [1, 3], "b": [2, 4]}))
+    assert list(sections[1].columns) == ["Disclaimer text"]
+    pd.testing.assert_frame_equal(sections[2],
+                                  pd.DataFrame({"x": [5], "y": [6]}))
+
+
+# Test readCsvUntilBlankLine
+def test_read_csv_until_blank_line(any_csv_path):
+    # Execute
+    df = pdu.read_csv_until_blank_line(any_csv_path)
+
+    # Verify
+    pd.testing.assert_frame_equal(df, pd.DataFrame({"a": [1, 3], "b": [2, 4]}))
+
+
+# Test parallelApply
+@pytest.mark.parametrize(
+    "axis, func, workers, chunk_rows, pooled",
+    [
+        # Test case 1: Row-wise across several chunks
+        (1, sum, 2, 3, True),
+
+        # Test case 2: Chunk-wise across several chunks
+        (None, pd.DataFrame.abs, 2, 3, True),
+
+        # Test case 3: Frame fits in a single chunk
+        (1, sum, 2, 10, False),
+
+        # Test case 4: Single worker
+        (1, sum, 1, 3, False)
+    ]
+)
+def test_parallel_apply(mocker, axis, func, workers, chunk_rows, pooled):
+    # Setup
+    df = pd.DataFrame({"a": range(-5, 5), "b": range(10)})
+    exp_out = df.apply(func, axis=axis) if axis else func(df)
+    pool_spy = mocker.spy(pdu, "ProcessPoolExecutor")
+
+    # Execute
+    act_out = pdu.parallel_apply(df, func, axis=axis, workers=workers, 
+                                 chunk_rows=chunk_rows)
+
+    # Verify
+    assert pool_spy.called == pooled
+    if axis: pd.testing.assert_series_equal(act_out, exp_out)
+    else: pd.testing.assert_frame_equal(act_out, exp_out)
+
+
+# Test parallelApply with invalid arguments
+@pytest.mark.parametrize("axis, chunk_rows", [(0, 10), (1, 0)])
+def test_parallel_apply_invalid(axis, chunk_rows):
+    # Execute and verify
+    with pytest.raises(ValueError):
+        pdu.parallel_apply(pd.DataFrame(), sum, axis=axis, 
+                           chunk_rows=chunk_rows)
+
+
+# Test profileFrame and compactFrame
+def test_profile_and_compact_frame():
+    # Setup
+    df = pd.DataFrame({"repeated": ["a", "b", "a", "a"], 
+                       "unique": ["w", "x", "y", "z"], 
+                       "small_int": [1, 2, 300, 4], 
+                       "large_int": [1, 2, 2**40, 3], 
+                       "exact_float": [1.5, 2.25, None, 3.], 
+                       "inexact_float": [1.1, 2.2, 3.3, 4.4], 
+                       "integral_float": [1., 2., None, 5.], 
+                       "huge_float": [1e20, 2e20, 3e20, 4e20], 
+                       "huge_exact_float": [2.**70, 2.**71, 2.**72, 2.**73]})
+
+    # Execute
+    profile = pdu.profile_frame(df)
+    compact = pdu.compact_frame(df, profile)
+
+    # Verify profile
+    assert list(profile.index) == list(df.columns)
+    assert profile.loc["small_int", "dtype"] == "int64"
+    assert profile.loc["exact_float", "null_fraction"] == 0.25
+    assert profile.loc["repeated", "cardinality"] == 2
+    assert profile["recommended"].dropna().to_dict() == {
+        "repeated": "category", "small_int": "int16", 
+        "exact_float": "float32", "integral_float": "Int8", 
+        "huge_exact_float": "float32"}
+    assert (profile["memory"] == df.memory_usage(deep=True, index=False)).all()
+
+    # Verify compacted frame
+    assert compact["repeated"].dtype == "category"
+    assert compact["small_int"].dtype == "int16"
+    assert compact["integral_float"].dtype == "Int8"
+    assert compact["inexact_float"].dtype == "float64"
+    assert compact["huge_float"].dtype == "float64"
+    assert compact["huge_exact_float"].dtype == "float32"
+    pd.testing.assert_frame_equal(compact.astype(df.dtypes), df)
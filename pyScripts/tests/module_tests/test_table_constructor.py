@@ -1,4 +1,7 @@
 import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime
 from modules import Table
 
 
@@ -6,7 +9,7 @@ from modules import Table
     "table_data, table_string, title, rjust_columns, exception",
     [
         # Test series 1: TypeError if 'table_data' is not 
-        #     `list[dict[str, str]]` or `None`
+        #     `list[dict[str, str | int | float | datetime]]` or `None`
         (None, "", None, None, None), 
         (bool(), None, None, None, TypeError), 
         (bytearray(), None, None, None, TypeError), 
@@ -136,3 +139,209 @@ def test_constructor(table_data, table_string, title, rjust_columns,
     else:
         T_inst = Table(table_data, table_string, title, rjust_columns)
         assert T_inst._rec_ct == 0
+
+
+# Test fromRecords
+@pytest.mark.parametrize(
+    "records, flatten, exp_records",
+    [
+        # Test case 1: Values of any type
+        (
+            [{"name": "sda", "size": 500107862016, "rm": False, 
+              "label": None, "mountpoints": [None]}], 
+            False, 
+            [{"NAME": "sda", "SIZE": "500107862016", "RM": "0", "LABEL": "", 
+              "MOUNTPOINTS": ""}]
+        ), 
+        # Test case 2: Children omitted
+        (
+            [{"name": "sda", "children": [{"name": "sda1"}]}], 
+            False, 
+            [{"NAME": "sda"}]
+        ), 
+        # Test case 3: Children flattened depth first
+        (
+            [{"name": "sda", "children": [
+                {"name": "sda1", "mountpoints": ["/", "/mnt/My Files"]}, 
+                {"name": "sda2", "children": [{"name": "vg-root"}]}]}, 
+             {"name": "sdb"}], 
+            True, 
+            [{"NAME": "sda"}, 
+             {"NAME": "sda1", "MOUNTPOINTS": "/,/mnt/My Files"}, 
+             {"NAME": "sda2"}, {"NAME": "vg-root"}, {"NAME": "sdb"}]
+        ), 
+        # Test case 4: No records
+        ([], True, [])
+    ]
+)
+def test_from_records(records, flatten, exp_records):
+    # Execute
+    T_inst = Table.from_records(records, flatten=flatten, title="devices")
+
+    # Verify
+    assert T_inst.get_title() == "DEVICES"
+    assert [dict(T_inst.get_record(i)) 
+            for i in range(T_inst.count_records())] == exp_records
+
+
+# Test fromJson
+@pytest.mark.parametrize(
+    "json_str, key",
+    [
+        # Test case 1: Array of records
+        ('[{"name": "sda", "size": 1024}]', None), 
+
+        # Test case 2: Array under a top-level key
+        ('{"blockdevices": [{"name": "sda", "size": 1024}]}', "blockdevices")
+    ]
+)
+def test_from_json(json_str, key):
+    # Execute
+    T_inst = Table.from_json(json_str, key=key, rjust_columns="size")
+
+    # Verify
+    assert dict(T_inst.get_record(0)) == {"NAME": "sda", "SIZE": "1024"}
+    assert T_inst.get_rjust_columns() == {"SIZE"}
+
+
+# Test columnTypes
+@pytest.mark.parametrize(
+    "table_data, table_string, column_types, key, exp_text, exp_values",
+    [
+        # Test case 1: Sizes parsed from text
+        (
+            None, "NAME SIZE\nsda 931.5G\nsdb\n", {"size": "bytes"}, "SIZE", 
+            ["931.5G", ""], [1000190509056, None]
+        ), 
+        # Test case 2: Dates parsed from records
+        (
+            [{"D": "2024-01-02"}, {"D": "2023-05-06"}], None, 
+            {"d": "datetime"}, "D", 
+            ["2024-01-02", "2023-05-06"], 
+            [datetime(2024, 1, 2), datetime(2023, 5, 6)]
+        ), 
+        # Test case 3: Native values kept with their text
+        (
+            [{"N": 1.5}, {"N": "2.25"}, {"N": datetime(2024, 1, 2)}], 
+            None, None, "N", 
+            ["1.5", "2.25", "2024-01-02 00:00:00"], 
+            [1.5, "2.25", datetime(2024, 1, 2)]
+        ), 
+        # Test case 4: Untyped columns parsed when compared
+        (None, "N\n10\n9\n", None, "N", ["10", "9"], [10, 9])
+    ]
+)
+def test_column_types(table_data, table_string, column_types, key, exp_text, 
+                      exp_values):
+    # Execute
+    T_inst = Table(table_data, table_string, column_types=column_types)
+
+    # Verify
+    assert [T_inst.get_record(i)[key] 
+            for i in range(T_inst.count_records())] == exp_text
+    assert T_inst.get_column(key) == exp_values
+
+
+# Test columnTypes validation
+@pytest.mark.parametrize(
+    "column_types, exception",
+    [
+        # Test case 1: Not a dictionary
+        (["int"], TypeError), 
+
+        # Test case 2: Type not a string
+        ({"N": int}, TypeError), 
+
+        # Test case 3: Unsupported type
+        ({"N": "complex"}, ValueError), 
+
+        # Test case 4: Text not of the type
+        ({"N": "float"}, ValueError)
+    ]
+)
+def test_column_types_invalid(column_types, exception):
+    # Execute and verify
+    with pytest.raises(exception):
+        Table(table_string="N\nabc\n", column_types=column_types)
+
+
+# Test validate
+@pytest.mark.parametrize(
+    "validate, bad_index, exception",
+    [
+        # Test case 1: Full validation finds any bad record
+        ("full", 7, TypeError), 
+
+        # Test case 2: Sample validation finds a sampled bad record
+        ("sample", 150, TypeError), 
+
+        # Test case 3: Sample validation skips an unsampled bad record
+        ("sample", 7, None), 
+
+        # Test case 4: No validation skips every record
+        ("none", 0, None), 
+
+        # Test case 5: Unsupported mode
+        ("some", 0, ValueError)
+    ]
+)
+def test_validate(validate, bad_index, exception):
+    # Setup
+    table_data = [{"N": str(i)} for i in range(300)]
+    table_data[bad_index] = {"N": [bad_index]}
+
+    # Execute and verify
+    if exception:
+        with pytest.raises(exception):
+            Table(table_data=table_data, validate=validate)
+    else:
+        T_inst = Table(table_data=table_data, validate=validate)
+        assert T_inst.count_records() == 300
+
+
+# Test fromDataframe
+@pytest.mark.parametrize("index", [False, True])
+def test_from_dataframe(index):
+    # Setup
+    df = pd.DataFrame({"Name": ["sda", None], "size": [1.5, np.nan], 
+                       "count": pd.array([2, None], dtype="Int64"), 
+                       "when": pd.to_datetime(["2024-01-02", None])}, 
+                      index=pd.Index([7, 8], name="id"))
+
+    # Execute
+    T_inst = Table.from_dataframe(df, index=index, title="frame")
+
+    # Verify columns and records
+    assert list(T_inst.get_headings()) == ((["ID"] if index else []) + 
+                                           ["NAME", "SIZE", "COUNT", "WHEN"])
+    assert T_inst.count_records() == 2
+    assert {key: T_inst.get_record(0)[key] 
+            for key in ["NAME", "SIZE", "COUNT", "WHEN"]} == {
+        "NAME": "sda", "SIZE": "1.5", "COUNT": "2", 
+        "WHEN": "2024-01-02 00:00:00"}
+    assert {key: T_inst.get_record(1)[key] 
+            for key in ["NAME", "SIZE", "COUNT", "WHEN"]} == {
+        "NAME": "", "SIZE": "", "COUNT": "", "WHEN": ""}
+    
+    # Verify shared arrays and attributes
+    assert np.shares_memory(T_inst._typ_cols["SIZE"], df["size"].to_numpy())
+    assert T_inst.get_column("COUNT") == [2, None]
+    assert T_inst.get_title() == "FRAME"
+    assert T_inst.get_rjust_columns() == ({"ID", "SIZE", "COUNT"} if index 
+                                          else {"SIZE", "COUNT"})
+
+
+# Test fromDataframe formats cells on access
+def test_from_dataframe_lazy(mocker):
+    # Setup
+    T_inst = Table.from_dataframe(pd.DataFrame({"a": np.arange(1000)}))
+    fmt = mocker.Mock(side_effect=str)
+    T_inst._cols["A"]._fmt = fmt
+
+    # Execute
+    preview = T_inst.head(3)
+    preview._set_wds()
+
+    # Verify
+    assert preview.get_column_widths() == {"A": 1}
+    assert fmt.call_count == 3
@@ -1,6 +1,7 @@
 import pytest
 from functools import partial
 from modules import Table
+from modules.table import MISSING
 
 
 # Tests parameters for findBoundaries and getSlice
@@ -35,7 +36,7 @@ PARAMS = [
 def mck_T(mocker):
     mck = mocker.Mock(spec=Table)
     for name in ["_add_rj_col_lbl", "_cap_keys", "_fnd_bnds", "_fnd_col_pos", 
-                 "_get_slc", "_rd_tbl"]:
+                 "_fnd_col_spns", "_get_slc", "_rd_tbl"]:
         method = getattr(mck, name)
         method.side_effect = partial(getattr(Table, name), mck)
     return mck
@@ -73,40 +74,47 @@ def test_add_rj_col_lbl(mck_T, initial_set, label_in, exp_labels):
 
 
 # Test capitalizeKeys
-@pytest.mark.parametrize("data_input, exp_dataset, exp_count",
+@pytest.mark.parametrize("data_input, exp_columns, exp_count",
     [
         # Test case 1: Simple case with one dictionary
         (
             [{"key1": "value1", "key2": "value2"}],
-            [{"KEY1": "value1", "KEY2": "value2"}],
+            {"KEY1": ["value1"], "KEY2": ["value2"]},
             1
         ), 
         # Test case 2: Multiple dictionaries with mixed keys
         (
             [{"key1": "value1"}, {"Key2": "value2"}],
-            [{"KEY1": "value1"}, {"KEY2": "value2"}],
+            {"KEY1": ["value1", MISSING], "KEY2": [MISSING, "value2"]},
             2
         ), 
         # Test case 3: Empty list
-        ([], [], 0),
+        ([], {}, 0),
 
         # Test case 4: Empty dictionaries
-        ([{}], [{}], 1), 
+        ([{}], {}, 1), 
 
         # Test case 5: Special characters and numbers in keys
         (
             [{"k3y!": "v@lue", "123": "456"}],
-            [{"K3Y!": "v@lue", "123": "456"}],
+            {"K3Y!": ["v@lue"], "123": ["456"]},
             1
+        ), 
+        # Test case 6: Keys differing only in case
+        (
+            [{"key": "lower"}, {"KEY": "upper"}],
+            {"KEY": ["lower", "upper"]},
+            2
         )
     ]
 )
-def test_cap_keys(mck_T, data_input, exp_dataset, exp_count):
+def test_cap_keys(mck_T, data_input, exp_columns, exp_count):
     # Execute
     mck_T._cap_keys(data_input)
 
     # Verify
-    assert mck_T._ds == exp_dataset
+    assert mck_T._cols == exp_columns
+    assert list(mck_T._rows) == list(range(exp_count))
     assert mck_T._rec_ct == exp_count
 
 
@@ -139,7 +147,10 @@ def test_fnd_bnds(mck_T, col_idx, pos_list, line, exp_boundaries, _):
         ("Column1 Column2 Column3", [], []),
 
         # Test case 5: Duplicate keys
-        ("A B A C", ["A", "C"], [0, 6])
+        ("A B A C", ["A", "C"], [0, 6]), 
+
+        # Test case 6: Repeated keys
+        ("A B A C", ["A", "B", "A"], [0, 2, 4])
     ]
 )
 def test_fnd_col_pos(mck_T, header_ln, keys, exp_out):
@@ -150,6 +161,44 @@ def test_fnd_col_pos(mck_T, header_ln, keys, exp_out):
     assert act_out == exp_out
 
 
+# Test findColumnSpans
+@pytest.mark.parametrize(
+    "lines, exp_spans",
+    [
+        # Test case 1: Columns separated by gutters
+        (["Name Age", "John 25", "Jane 30"], [(0, 4), (5, None)]),
+
+        # Test case 2: Value wider than its heading
+        (["Name      Age", "Methusela 969"], [(0, 9), (10, None)]),
+
+        # Test case 3: Right-justified column
+        (["NAME SIZE TYPE", "sda    1T disk"], [(0, 4), (5, 9), (10, None)]),
+
+        # Test case 4: Ragged last column with inner spaces
+        (["ID PATH", "1  /My Files", "2"], [(0, 2), (3, None)]),
+
+        # Test case 5: Value spanning two headings
+        (["A  B", "xxxxxx"], None),
+
+        # Test case 6: Value between headings
+        (["A     B", "   x"], None),
+
+        # Test case 7: No headings
+        ([""], [])
+    ]
+)
+def test_fnd_col_spns(mck_T, lines, exp_spans):
+    # Setup
+    keys = lines[0].split()
+    positions = mck_T._fnd_col_pos(lines[0], keys)
+
+    # Execute
+    act_spans = mck_T._fnd_col_spns(lines, keys, positions)
+
+    # Verify
+    assert act_spans == exp_spans
+
+
 # Test getSlice
 @pytest.mark.parametrize("col_idx, pos_list, line, _, exp_slice", PARAMS)
 def test_get_slice(mck_T, col_idx, pos_list, line, _, exp_slice):
@@ -162,36 +211,58 @@ def test_get_slice(mck_T, col_idx, pos_list, line, _, exp_slice):
 
 # Test readTable
 @pytest.mark.parametrize(
-    "table_string, exp_dataset, exp_count",
+    "table_string, exp_columns, exp_count",
     [
         # Test case 1: Simple table with two columns
         (
             "Name Age\nJohn 25\nJane 30\n", 
-            [{'NAME': 'John', 'AGE': '25'}, {'NAME': 'Jane', 'AGE': '30'}], 
+            {'NAME': ['John', 'Jane'], 'AGE': ['25', '30']}, 
             2
         ), 
         # Test case 2: Table with multiple columns and different lengths of data
         (
             "Name Age Location\nJohn 25 USA\nJane 30 Canada\n", 
-            [{'NAME': 'John', 'AGE': '25', 'LOCATION': 'USA'}, 
-             {'NAME': 'Jane', 'AGE': '30', 'LOCATION': 'Canada'}], 
+            {'NAME': ['John', 'Jane'], 'AGE': ['25', '30'], 
+             'LOCATION': ['USA', 'Canada']}, 
             2
         ), 
         # Test case 3: Empty table
-        ("Name Age\n", [], 0),
+        ("Name Age\n", {'NAME': [], 'AGE': []}, 0),
     
         # Test case 4: Table with extra spaces
         (
             "Name    Age\nJohn   25\nJane    30\n", 
-            [{'NAME': 'John', 'AGE': '25'}, {'NAME': 'Jane', 'AGE': '30'}], 
+            {'NAME': ['John', 'Jane'], 'AGE': ['25', '30']}, 
             2
-        )
+        ), 
+
+        # Test case 5: Empty string
+        ("", {}, 0), 
+
+        # Test case 6: Ragged last column with inner spaces
+        (
+            "NAME   SIZE MOUNTPOINT\nsda    1.8T\n└─sda1 1.8T /media/My Files\n", 
+            {'NAME': ['sda', '└─sda1'], 'SIZE': ['1.8T', '1.8T'], 
+             'MOUNTPOINT': ['', '/media/My Files']}, 
+            2
+        ), 
+
+        # Test case 7: Repeated headings
+        (
+            "ID NAME ID\n1  a    2\n", 
+            {'ID': ['1'], 'NAME': ['a'], 'ID_2': ['2']}, 
+            1
+        ), 
+
+        # Test case 8: Columns not separated by a gutter
+        ("A     B\n   x  y\n", {'A': ['x'], 'B': ['y']}, 1)
     ]
 )
-def test_read_table(mck_T, table_string, exp_dataset, exp_count):
+def test_read_table(mck_T, table_string, exp_columns, exp_count):
     # Execute
     mck_T._rd_tbl(table_string)
     
     # Verify
-    assert mck_T._ds == exp_dataset
+    assert mck_T._cols == exp_columns
+    assert list(mck_T._rows) == list(range(exp_count))
     assert mck_T._rec_ct == exp_count
@@ -1,5 +1,10 @@
 import pytest
+from io import StringIO
+from json import dumps, loads
+import numpy as np
+import pandas as pd
 from modules import Table
+from modules.table import between, nonempty, startswith
 
 
 @pytest.fixture
@@ -18,6 +23,10 @@ def T_wth_wds(T_inst):
     return T_inst
 
 
+def list_records(tbl):
+    return [tbl.get_record(i) for i in range(tbl.count_records())]
+
+
 """Modify Table Methods"""
 # Test filterNonempty
 @pytest.mark.parametrize(
@@ -53,7 +62,7 @@ def test_filter_nonempty(T_inst, filter_key, exp_dataset, exp_count):
     T_inst.filter_nonempty(filter_key)
 
     # Verify
-    assert T_inst._ds == exp_dataset
+    assert list_records(T_inst) == exp_dataset
     assert T_inst._rec_ct == exp_count
 
 
@@ -90,10 +99,484 @@ def test_filter_startswith(T_inst, filter_key, value_prefix, exp_dataset,
     T_inst.filter_startswith(filter_key, value_prefix)
 
     # Verify
-    assert T_inst._ds == exp_dataset
+    assert list_records(T_inst) == exp_dataset
     assert T_inst._rec_ct == exp_count
 
 
+# Test where
+@pytest.mark.parametrize(
+    "predicates, exp_dataset",
+    [
+        # Test case 1: Single predicate
+        (
+            [nonempty("First")], 
+            [{"FIRST": "abc", "SECOND": "123"}, 
+             {"FIRST": "xyz", "SECOND": "789"}]
+        ), 
+        # Test case 2: Chained predicates
+        (
+            [nonempty("First"), startswith("Second", "7")], 
+            [{"FIRST": "xyz", "SECOND": "789"}]
+        ), 
+        # Test case 3: Key absent
+        ([nonempty("Third"), startswith("Third", "")], []), 
+
+        # Test case 4: No record satisfying all predicates
+        ([startswith("First", "a"), startswith("Second", "4")], [])
+    ]
+)
+def test_where(mocker, T_inst, predicates, exp_dataset):
+    # Setup
+    original = list_records(T_inst)
+    spies = [mocker.Mock(side_effect=pred) for pred in predicates]
+
+    # Execute
+    view = T_inst
+    for spy in spies: view = view.where(spy)
+    unevaluated = all(not spy.called for spy in spies)
+    act_dataset = list_records(view)
+
+    # Verify
+    assert unevaluated
+    assert all(spy.call_count == 1 for spy in spies)
+    assert act_dataset == exp_dataset
+    assert view.count_records() == len(exp_dataset)
+    assert view._cols is T_inst._cols
+    assert list_records(T_inst) == original
+
+
+# Test where on a view
+def test_where_branches(T_inst):
+    # Setup
+    nonempty_view = T_inst.where(nonempty("First"))
+    nonempty_view.count_records()
+
+    # Execute
+    a_view = nonempty_view.where(startswith("First", "a"))
+    x_view = nonempty_view.where(startswith("First", "x"))
+
+    # Verify
+    assert [rec["FIRST"] for rec in list_records(a_view)] == ["abc"]
+    assert [rec["FIRST"] for rec in list_records(x_view)] == ["xyz"]
+    assert nonempty_view.count_records() == 2
+    with pytest.raises(AttributeError):
+        nonempty_view._missing_attribute
+
+
+# Test append
+@pytest.mark.parametrize(
+    "record, exp_record, exp_max_wds",
+    [
+        # Test case 1: Record of the table's columns
+        (
+            {"First": "uvwxyz", "Second": "0"}, 
+            {"FIRST": "uvwxyz", "SECOND": "0"}, 
+            {"FIRST": 6, "SECOND": 3}
+        ), 
+        # Test case 2: Record lacking a column
+        ({"Second": 10}, {"SECOND": "10"}, {"FIRST": 3, "SECOND": 3}), 
+
+        # Test case 3: Record with a new column
+        (
+            {"First": "a", "Third": "new"}, 
+            {"FIRST": "a", "THIRD": "new"}, 
+            {"FIRST": 3, "SECOND": 3, "THIRD": 3}
+        )
+    ]
+)
+def test_append(T_inst, record, exp_record, exp_max_wds):
+    # Setup
+    T_inst._set_wds()
+
+    # Execute
+    T_inst.append(record)
+
+    # Verify
+    assert T_inst.count_records() == 4
+    assert T_inst.get_record(3) == exp_record
+    assert T_inst._max_wds == exp_max_wds
+    assert T_inst._stl_cols == set()
+    assert T_inst.get_record(0) == {"FIRST": "abc", "SECOND": "123"}
+
+
+# Test append of native and typed values
+def test_append_values():
+    # Setup
+    T_inst = Table(table_string="N  S\n1  1K\n2  2K\n", 
+                   column_types={"S": "bytes"})
+    assert T_inst.get_column("N") == [1, 2]
+
+    # Execute
+    T_inst.append({"N": 3.5, "S": "1M"})
+    T_inst.append({"N": "x"})
+
+    # Verify
+    assert T_inst.get_column("S") == [1024, 2048, 1048576, None]
+    assert T_inst.get_column("N") == ["1", "2", "3.5", "x"]
+    with pytest.raises(ValueError):
+        T_inst.append({"S": "big"})
+    with pytest.raises(TypeError):
+        T_inst.append({"N": [4]})
+    assert T_inst.count_records() == 4
+
+
+# Test append to a view
+def test_append_view(T_inst):
+    # Setup
+    view = T_inst.where(nonempty("First"))
+
+    # Execute
+    view.append({"First": "new", "Third": "3"})
+
+    # Verify
+    assert [rec["FIRST"] for rec in list_records(view)] == ["abc", "xyz", 
+                                                           "new"]
+    assert list_records(T_inst) == [{"FIRST": "abc", "SECOND": "123"}, 
+                                    {"FIRST": "", "SECOND": "456"}, 
+                                    {"FIRST": "xyz", "SECOND": "789"}]
+    assert "THIRD" not in T_inst.get_headings()
+
+
+# Test appends to a view interleaved with appends to its table
+def test_append_view_interleaved(T_inst):
+    # Setup
+    view = T_inst.where(nonempty("First"))
+
+    # Execute
+    view.append({"First": "v1", "Third": "x"})
+    T_inst.append({"First": "t1"})
+    view.append({"First": "v2", "Third": "y"})
+
+    # Verify
+    assert list_records(view) == [{"FIRST": "abc", "SECOND": "123"}, 
+                                  {"FIRST": "xyz", "SECOND": "789"}, 
+                                  {"FIRST": "v1", "THIRD": "x"}, 
+                                  {"FIRST": "v2", "THIRD": "y"}]
+    assert [rec["FIRST"] for rec in list_records(T_inst)] == [
+        "abc", "", "xyz", "t1"]
+
+
+# Test extend
+def test_extend():
+    # Setup
+    T_inst = Table(table_data=[])
+
+    # Execute
+    T_inst.extend({"Name": f"sd{c}"} for c in "abc")
+
+    # Verify
+    assert T_inst.count_records() == 3
+    assert T_inst.get_headings() == {"NAME": "NAME"}
+    assert T_inst.get_record(2) == {"NAME": "sdc"}
+
+
+# Test rendering after an append adding a column
+def test_append_render():
+    # Setup
+    T_inst = Table(table_data=[{"Name": "sda", "Size": "1G"}], title="disks")
+
+    # Execute
+    T_inst.append({"Name": "sdb", "Size": "2G", "Vendor": "ACME"})
+    result = T_inst.render()
+
+    # Verify
+    assert result.splitlines()[3:6] == ["║ NAME  SIZE  VENDOR ║", 
+                                        "║ sda   1G           ║", 
+                                        "║ sdb   2G    ACME   ║"]
+
+
+# Test diff
+@pytest.mark.parametrize(
+    "unchanged, exp_dataset, exp_styles",
+    [
+        # Test case 1: Changes only
+        (
+            False, 
+            [{"CHANGE": "changed", "FIRST": "", "SECOND": "654"}, 
+             {"CHANGE": "added", "FIRST": "xyz", "SECOND": "789"}, 
+             {"CHANGE": "removed", "FIRST": "def", "SECOND": "000", 
+              "THIRD": "x"}], 
+            ["yellow", "green", "red"]
+        ), 
+        # Test case 2: Unchanged records included
+        (
+            True, 
+            [{"CHANGE": "", "FIRST": "abc", "SECOND": "123"}, 
+             {"CHANGE": "changed", "FIRST": "", "SECOND": "654"}, 
+             {"CHANGE": "added", "FIRST": "xyz", "SECOND": "789"}, 
+             {"CHANGE": "removed", "FIRST": "def", "SECOND": "000", 
+              "THIRD": "x"}], 
+            [None, "yellow", "green", "red"]
+        )
+    ]
+)
+def test_diff(T_inst, unchanged, exp_dataset, exp_styles):
+    # Setup
+    T_inst._cols["SECOND"][1] = "654"
+    previous = Table(table_data=[{"First": "abc", "Second": "123"}, 
+                                 {"First": "def", "Second": "000", 
+                                  "Third": "x"}, 
+                                 {"First": "", "Second": "456"}])
+
+    # Execute
+    changes = T_inst.diff(previous, key="First", unchanged=unchanged)
+
+    # Verify
+    assert list_records(changes) == exp_dataset
+    assert [changes.get_row_style(i) 
+            for i in range(changes.count_records())] == exp_styles
+    assert changes.get_title() == "MOCK TABLE"
+    assert changes.get_rjust_columns() == {"SECOND"}
+
+
+# Test diff errors
+@pytest.mark.parametrize(
+    "other, key, exception",
+    [
+        # Test case 1: Not a table
+        ([{"FIRST": "abc"}], "First", TypeError), 
+
+        # Test case 2: Key column missing
+        (Table(table_data=[{"First": "abc"}]), "Second", KeyError)
+    ]
+)
+def test_diff_invalid(T_inst, other, key, exception):
+    # Execute and verify
+    with pytest.raises(exception):
+        T_inst.diff(other, key=key)
+
+
+# Test rendering a diff of tables with different columns
+def test_diff_render():
+    # Setup
+    T_inst = Table(table_data=[{"Name": "sda", "Size": "1G"}, 
+                               {"Name": "sdb", "Size": "2G"}], 
+                   title="disks")
+    previous = Table(table_data=[{"Name": "sda", "Size": "1G", 
+                                  "Model": "X1"}, 
+                                 {"Name": "sdc", "Size": "4G", 
+                                  "Model": "Y2"}])
+
+    # Execute
+    result = T_inst.diff(previous).render()
+
+    # Verify
+    assert result.splitlines()[3:7] == ["║  CHANGE  NAME  SIZE  MODEL ║", 
+                                        "║ changed  sda   1G          ║", 
+                                        "║ added    sdb   2G          ║", 
+                                        "║ removed  sdc   4G    Y2    ║"]
+
+
+@pytest.fixture
+def T_devs():
+    tbl_data = [{"Name": "sda", "Size": "500", "Fstype": "ext4"}, 
+                {"Name": "sda1", "Size": "200", "Fstype": "ext4"}, 
+                {"Name": "sda2", "Size": "1000", "Fstype": ""}, 
+                {"Name": "sdb", "Size": "75.5"}]
+    return Table(table_data=tbl_data, title="Devices")
+
+
+# Test sortBy
+@pytest.mark.parametrize(
+    "keys, reverse, exp_names",
+    [
+        # Test case 1: Numeric column
+        (["Size"], False, ["sdb", "sda1", "sda", "sda2"]), 
+
+        # Test case 2: Numeric column in descending order
+        (["Size"], True, ["sda2", "sda", "sda1", "sdb"]), 
+
+        # Test case 3: Text column with missing values last
+        (["Fstype", "Name"], True, ["sda1", "sda", "sdb", "sda2"]), 
+
+        # Test case 4: Text column
+        (["Name"], True, ["sdb", "sda2", "sda1", "sda"])
+    ]
+)
+def test_sort_by(T_devs, keys, reverse, exp_names):
+    # Execute
+    view = T_devs.sort_by(*keys, reverse=reverse)
+
+    # Verify
+    assert [rec["NAME"] for rec in list_records(view)] == exp_names
+    assert [rec["NAME"] for rec in list_records(T_devs)] == [
+        "sda", "sda1", "sda2", "sdb"]
+
+
+# Test groupBy
+def test_group_by(T_devs):
+    # Execute
+    groups = T_devs.group_by("Fstype", COUNT=("Name", "count"), 
+                             TOTAL=("Size", "sum"), 
+                             LARGEST=("Size", "max"))
+
+    # Verify
+    assert list_records(groups) == [
+        {"FSTYPE": "ext4", "COUNT": "2", "TOTAL": "700", "LARGEST": "500"}, 
+        {"FSTYPE": "", "COUNT": "2", "TOTAL": "1075.5", "LARGEST": "1000"}]
+    assert groups.get_title() == "DEVICES"
+    assert groups.get_rjust_columns() == {"COUNT", "TOTAL", "LARGEST"}
+
+
+# Test aggregate
+@pytest.mark.parametrize(
+    "key, func, exp_out, exception",
+    [
+        # Test case 1: Count non-empty values
+        ("Fstype", "count", 2, None), 
+
+        # Test case 2: Sum numeric values
+        ("Size", "sum", 1775.5, None), 
+
+        # Test case 3: Minimum numeric value
+        ("Size", "min", 75.5, None), 
+
+        # Test case 4: Maximum text value
+        ("Name", "max", "sdb", None), 
+
+        # Test case 5: Sum text values
+        ("Name", "sum", None, TypeError), 
+
+        # Test case 6: Unsupported function
+        ("Size", "mean", None, ValueError), 
+
+        # Test case 7: Absent column
+        ("Model", "count", None, KeyError)
+    ]
+)
+def test_aggregate(T_devs, key, func, exp_out, exception):
+    # Execute with exception
+    if exception:
+        with pytest.raises(exception):
+            T_devs.aggregate(key, func)
+    
+    # Execute without exception
+    else:
+        assert T_devs.aggregate(key, func) == exp_out
+
+
+# Test where with between
+@pytest.mark.parametrize(
+    "low, high, exp_names",
+    [
+        # Test case 1: Lower bound
+        (500, None, ["sda", "sda2"]), 
+
+        # Test case 2: Upper bound
+        (None, 200, ["sda1", "sdb"]), 
+
+        # Test case 3: Both bounds
+        (100, 500, ["sda", "sda1"])
+    ]
+)
+def test_where_between(T_devs, low, high, exp_names):
+    # Execute
+    view = T_devs.where(between("Size", low, high))
+
+    # Verify
+    assert [rec["NAME"] for rec in list_records(view)] == exp_names
+
+
+# Test getTypedColumn
+def test_get_typ_col(T_devs):
+    # Execute
+    first = T_devs._get_typ_col("SIZE")
+    view = T_devs.sort_by("Size")
+
+    # Verify
+    assert first == [500, 200, 1000, 75.5]
+    assert T_devs._get_typ_col("FSTYPE") == ["ext4", "ext4", None, None]
+    assert view._get_typ_col("SIZE") is first
+
+
+# Test head
+@pytest.mark.parametrize("count, exp_names", 
+                         [(2, ["sda", "sda1"]), (9, ["sda", "sda1", "sda2", 
+                                                     "sdb"]), (0, [])])
+def test_head(T_devs, count, exp_names):
+    # Execute
+    view = T_devs.sort_by("Name").head(count)
+
+    # Verify
+    assert [rec["NAME"] for rec in list_records(view)] == exp_names
+    assert T_devs.count_records() == 4
+
+
+# Test head of a where view, chained with where
+def test_head_where(T_devs):
+    # Execute
+    view = (T_devs.where(startswith("Name", "sd")).head(3)
+            .where(nonempty("Fstype")))
+
+    # Verify
+    assert [rec["NAME"] for rec in list_records(view)] == ["sda", "sda1"]
+    assert T_devs.count_records() == 4
+
+
+# Test toDataframe
+def test_to_dataframe(T_devs):
+    # Execute
+    df = T_devs.to_dataframe()
+
+    # Verify
+    pd.testing.assert_frame_equal(df, pd.DataFrame({
+        "NAME": ["sda", "sda1", "sda2", "sdb"], 
+        "SIZE": ["500", "200", "1000", "75.5"], 
+        "FSTYPE": ["ext4", "ext4", "", None]}))
+
+
+# Test toDataframe from a DataFrame
+@pytest.mark.parametrize("reorder", [False, True])
+def test_to_dataframe_shared(reorder):
+    # Setup
+    df = pd.DataFrame({"a": [3.5, 1.5, 2.5], "b": ["x", "y", "z"]})
+    T_inst = Table.from_dataframe(df)
+    if reorder: T_inst = T_inst.sort_by("a")
+
+    # Execute
+    out = T_inst.to_dataframe()
+
+    # Verify
+    assert out["A"].tolist() == ([1.5, 2.5, 3.5] if reorder 
+                                 else [3.5, 1.5, 2.5])
+    assert out["B"].tolist() == (["y", "z", "x"] if reorder 
+                                 else ["x", "y", "z"])
+    assert np.shares_memory(out["A"].to_numpy(), 
+                            df["a"].to_numpy()) != reorder
+
+
+# Test a table from a DataFrame with missing values
+def test_dataframe_missing():
+    # Setup
+    df = pd.DataFrame({"a": ["v", "w", "x", "y", "z"], 
+                       "b": [1.5, np.nan, 2, 3, 4], 
+                       "c": pd.to_datetime(["2024-01-02", None, 
+                                            "2024-01-01", None, None]), 
+                       "d": pd.Series([1.5, pd.NA, 2, pd.NA, 1], 
+                                      dtype=object)})
+    T_inst = Table.from_dataframe(df, title="returns")
+
+    # Execute and verify aggregates
+    assert T_inst.aggregate("B", "count") == 4
+    assert T_inst.aggregate("B", "sum") == 10.5
+    assert T_inst.aggregate("C", "count") == 2
+    assert T_inst.aggregate("D", "sum") == 4.5
+
+    # Execute and verify sorting, with missing values last
+    assert T_inst.sort_by("B", reverse=True).get_column("A") == [
+        "z", "y", "x", "v", "w"]
+    assert T_inst.sort_by("C").get_column("A")[:2] == ["x", "v"]
+    assert T_inst.sort_by("D").get_column("A") == ["z", "v", "x", "w", "y"]
+
+    # Execute and verify values and filters
+    assert T_inst.get_column("B")[1] is None
+    assert T_inst.where(between("B", 0, 10)).count_records() == 4
+    assert T_inst.get_column("D")[1] is None
+    assert [T_inst.get_record(i)["D"] for i in range(5)] == [
+        "1.5", "", "2", "", "1"]
+    assert "<NA>" not in T_inst.render()
+
+
 # Test resizeColumns
 @pytest.mark.parametrize(
     "width_limit, exp_col_wds, exp_tbl_wd",
@@ -123,21 +606,93 @@ def test_resize_columns(T_wth_wds, width_limit, exp_col_wds, exp_tbl_wd):
     assert T_wth_wds._tbl_wd == exp_tbl_wd
 
 
+# Test resizeColumns with width policy
+@pytest.mark.parametrize(
+    "policy, width_limit, exp_col_wds, exp_tbl_wd",
+    [
+        # Test case 1: Column minimum
+        ({"minimums": {"second": 5}}, 9, {"FIRST": 2, "SECOND": 5}, 9), 
+
+        # Test case 2: Higher priority column narrowed last
+        ({"priorities": {"first": 1}}, 9, {"FIRST": 5, "SECOND": 2}, 9), 
+
+        # Test case 3: Higher priority column narrowed once others are 
+        #     at their minimums
+        ({"priorities": {"first": 1}}, 4, {"FIRST": 1, "SECOND": 1}, 4), 
+
+        # Test case 4: Column never truncated
+        ({"no_truncate": "first"}, 9, {"FIRST": 5, "SECOND": 2}, 9), 
+
+        # Test case 5: Heading minimums exceed the limit
+        ({"heading_minimums": True}, 9, {"FIRST": 5, "SECOND": 6}, 13), 
+
+        # Test case 6: Table within the limit
+        ({}, 20, {"FIRST": 5, "SECOND": 6}, 13)
+    ]
+)
+def test_resize_columns_policy(T_wth_wds, policy, width_limit, exp_col_wds, 
+                               exp_tbl_wd):
+    # Setup
+    T_wth_wds.set_width_policy(**policy)
+
+    # Execute
+    T_wth_wds.resize_columns(width_limit)
+
+    # Verify
+    assert T_wth_wds._col_wds == exp_col_wds
+    assert T_wth_wds._tbl_wd == exp_tbl_wd
+
+
+# Test setWidthPolicy
+@pytest.mark.parametrize(
+    "policy, exception",
+    [
+        # Test case 1: All options set
+        ({"minimums": {"a": 1}, "priorities": {"b": 2}, 
+          "no_truncate": ["c"], "heading_minimums": True, "wrap": True}, 
+         None), 
+
+        # Test case 2: Invalid minimums
+        ({"minimums": {"a": "1"}}, TypeError), 
+
+        # Test case 3: Invalid priorities
+        ({"priorities": ["b"]}, TypeError), 
+
+        # Test case 4: Invalid columns never truncated
+        ({"no_truncate": 1}, TypeError)
+    ]
+)
+def test_set_width_policy(T_inst, policy, exception):
+    # Execute with exception
+    if exception:
+        with pytest.raises(exception):
+            T_inst.set_width_policy(**policy)
+    
+    # Execute without exception
+    else:
+        T_inst.set_width_policy(**policy)
+
+        # Verify
+        assert T_inst._min_wds == {"A": 1, "FIRST": 5, "SECOND": 6}
+        assert T_inst._prio == {"B": 2}
+        assert T_inst._nt_cols == {"C"}
+        assert T_inst.get_wrap() is True
+
+
 """Display Table Methods"""
 # Test putTable
 @pytest.mark.parametrize(
-    "menu_flag, record_number",
+    "menu_flag",
     [
         # Test case 1: Table is a menu
-        (True, 3),
+        True,
 
         # Test case 2: Table is not a menu
-        # (False, "")
+        False
     ]
 )
-def test_put_table(mocker, T_wth_wds, menu_flag, record_number):
+def test_put_table(mocker, T_wth_wds, menu_flag):
     # Setup patches
-    mocker.patch.object(T_wth_wds, "_num_recs", return_value=record_number)
     mocker.patch.object(T_wth_wds, "_set_wds")
     mck_CT = mocker.patch("modules.table.ConsoleTable")
     mocker.patch.object(mck_CT.return_value, "display")
@@ -146,13 +701,168 @@ def test_put_table(mocker, T_wth_wds, menu_flag, record_number):
     T_wth_wds.put_table(menu_flag)
 
     # Verify calls
-    if menu_flag:
-        T_wth_wds._num_recs.assert_called_once()
     T_wth_wds._set_wds.assert_called_once()
-    mck_CT.assert_called_once_with(T_wth_wds)
+    mck_CT.assert_called_once_with(T_wth_wds, None, numbered=menu_flag)
     mck_CT.return_value.display.assert_called_once()
 
 
+# Test putTable paging
+def test_put_table_page(mocker, T_wth_wds):
+    # Setup
+    mck_CT = mocker.patch("modules.table.ConsoleTable")
+
+    # Execute
+    T_wth_wds.put_table(page=True)
+
+    # Verify
+    mck_CT.assert_called_once_with(T_wth_wds, None, numbered=False)
+    mck_CT.return_value.page.assert_called_once()
+    mck_CT.return_value.display.assert_not_called()
+
+
+# Test putLive
+@pytest.mark.parametrize("frames, exp_count", [(1, 1),      # Test case 1
+                                               (3, 3),      # Test case 2
+                                               (None, 5)])  # Test case 3
+def test_put_live(mocker, T_inst, frames, exp_count):
+    # Setup
+    mck_CT = mocker.patch("modules.table.ConsoleTable")
+    sources = [Table(table_data=[{"Name": f"sd{i}"}]) for i in range(9)]
+    source = mocker.Mock(side_effect=sources)
+    tables = []
+    mck_CT.return_value.live.side_effect = lambda t, i: tables.extend(
+        next(t) for _ in range(exp_count))
+
+    # Execute
+    T_inst.put_live(source, interval=0.5, frames=frames)
+
+    # Verify
+    mck_CT.assert_called_once_with(T_inst, None)
+    assert mck_CT.return_value.live.call_args.args[1] == 0.5
+    assert tables == [T_inst, *sources[:exp_count - 1]]
+    assert source.call_count == exp_count - 1
+    assert all(table.get_column_widths() == {"NAME": 4} 
+               for table in tables[1:])
+
+
+# Test putStream
+@pytest.mark.parametrize(
+    "keep, records, exp_rows, exp_count, exp_redisplay",
+    [
+        # Test case 1: Records kept at their provisional widths
+        (
+            True, 
+            [{"First": "a", "Second": "1"}], 
+            [{"FIRST": "a", "SECOND": "1"}], 
+            4, 
+            False
+        ), 
+        # Test case 2: Records kept, widening a column
+        (
+            True, 
+            [{"First": "abcdefg"}, {"Second": 2, "Third": "3"}], 
+            [{"FIRST": "abcdefg", "SECOND": ""}, 
+             {"FIRST": "", "SECOND": "2"}], 
+            5, 
+            True
+        ), 
+        # Test case 3: Records dropped once drawn
+        (
+            False, 
+            [{"First": "abcdefg"}], 
+            [{"FIRST": "abcdefg", "SECOND": ""}], 
+            3, 
+            False
+        )
+    ]
+)
+def test_put_stream(mocker, T_inst, keep, records, exp_rows, exp_count, 
+                    exp_redisplay):
+    # Setup
+    mck_CT = mocker.patch("modules.table.ConsoleTable")
+    rows = []
+    mck_CT.return_value.stream.side_effect = lambda r: len(rows.extend(r) 
+                                                         or rows) + 5
+
+    # Execute
+    T_inst.put_stream(iter(records), keep=keep)
+
+    # Verify
+    mck_CT.assert_called_once_with(T_inst, None)
+    assert rows == exp_rows
+    assert T_inst.count_records() == exp_count
+    if exp_redisplay:
+        mck_CT.return_value.redisplay.assert_called_once_with(
+            len(records) + 5)
+    else:
+        mck_CT.return_value.redisplay.assert_not_called()
+
+
+# Test putStream to a table without columns
+def test_put_stream_columns(mocker):
+    # Setup
+    mck_CT = mocker.patch("modules.table.ConsoleTable")
+    T_inst = Table(table_data=[])
+    T_inst.set_width_policy(minimums={"Name": 8})
+    widths = []
+    mck_CT.return_value.stream.side_effect = lambda r: len(
+        widths.append(dict(T_inst.get_column_widths())) or list(r))
+
+    # Execute
+    T_inst.put_stream([{"Name": "sda", "Size": "1G"}])
+
+    # Verify
+    assert T_inst.get_headings() == {"NAME": "NAME", "SIZE": "SIZE"}
+    assert T_inst.get_record(0) == {"NAME": "sda", "SIZE": "1G"}
+    assert widths == [{"NAME": 8, "SIZE": 4}]
+    assert T_inst.get_column_widths() == {"NAME": 4, "SIZE": 4}
+    mck_CT.return_value.redisplay.assert_not_called()
+
+
+# Test render
+@pytest.mark.parametrize(
+    "width, is_menu, exp_out",
+    [
+        # Test case 1: Table centered in a wide console
+        (
+            83, 
+            False, 
+            "  ╔════════════╗\n"
+            "  ║   DISKS    ║\n"
+            "  ╟────────────╢\n"
+            "  ║ NAME  SIZE ║\n"
+            "  ║ sda     1G ║\n"
+            "  ║ sdb    20G ║\n"
+            "  ╚════════════╝\n"
+        ), 
+        # Test case 2: Menu table
+        (
+            79, 
+            True, 
+            "╔═══════════════╗\n"
+            "║     DISKS     ║\n"
+            "╟───────────────╢\n"
+            "║ #  NAME  SIZE ║\n"
+            "║ 1  sda     1G ║\n"
+            "║ 2  sdb    20G ║\n"
+            "╚═══════════════╝\n"
+        )
+    ]
+)
+def test_render(width, is_menu, exp_out):
+    # Setup
+    T_inst = Table(table_data=[{"Name": "sda", "Size": "1G"}, 
+                               {"Name": "sdb", "Size": "20G"}], 
+                   title="disks", rjust_columns="SIZE")
+
+    # Execute
+    result = T_inst.render(width, is_menu=is_menu)
+
+    # Verify
+    assert result == exp_out
+    assert T_inst.render(width, styled=True, is_menu=is_menu) != exp_out
+
+
 # Test setWidths
 def test_set_wds(T_inst):
     # Execute
@@ -163,16 +873,157 @@ def test_set_wds(T_inst):
     assert T_inst._tbl_wd == 13
 
 
-# Test numberRecords
-def test_num_recs(T_inst):
+# Test setWidths after filters
+@pytest.mark.parametrize(
+    "filter_name, filter_args, exp_stale, exp_col_wds",
+    [
+        # Test case 1: Widest values kept
+        ("filter_nonempty", ["First"], set(), {"FIRST": 6, "SECOND": 6}), 
+
+        # Test case 2: Widest value of one column removed
+        (
+            "filter_startswith", ["Second", "12"], {"FIRST"}, 
+            {"FIRST": 5, "SECOND": 6}
+        ), 
+        # Test case 3: All records removed
+        (
+            "filter_startswith", ["First", "q"], {"FIRST", "SECOND"}, 
+            {"FIRST": 5, "SECOND": 6}
+        )
+    ]
+)
+def test_set_wds_incremental(mocker, T_inst, filter_name, filter_args, 
+                             exp_stale, exp_col_wds):
+    # Setup
+    T_inst._cols["FIRST"][2] = "uvwxyz"
+    T_inst._cols["SECOND"][0] = "12345"
+    T_inst._set_wds()
+    spy = mocker.spy(T_inst, "_get_max_wd")
+
     # Execute
-    T_inst._num_recs()
+    getattr(T_inst, filter_name)(*filter_args)
+    act_stale = set(T_inst._stl_cols)
+    T_inst._set_wds()
+    T_inst._set_wds()
 
     # Verify
-    assert T_inst._ds == [{"#": 1, "FIRST": "abc", "SECOND": "123"}, 
-                          {"#": 2, "FIRST": "", "SECOND": "456"}, 
-                          {"#": 3, "FIRST": "xyz", "SECOND": "789"}]
-    assert T_inst._rj_cols == {"#", "SECOND"}
+    assert act_stale == exp_stale
+    assert spy.call_count == len(exp_stale)
+    assert T_inst._col_wds == exp_col_wds
+
+
+# Test render of a menu leaves the table unnumbered
+def test_render_menu_unnumbered(T_inst):
+    # Setup
+    columns = T_inst._cols
+    T_inst.filter_nonempty("First")
+    stream = StringIO()
+
+    # Execute
+    menu = T_inst.render(is_menu=True)
+    T_inst.render(is_menu=True)
+    result = T_inst.render()
+    T_inst.write(stream, format="csv")
+
+    # Verify
+    assert menu.splitlines()[3:6] == ["║ #  FIRST  SECOND ║", 
+                                      "║ 1  abc       123 ║", 
+                                      "║ 2  xyz       789 ║"]
+    assert "#" not in result
+    assert list(T_inst.get_headings()) == ["FIRST", "SECOND"]
+    assert list_records(T_inst) == [{"FIRST": "abc", "SECOND": "123"}, 
+                                    {"FIRST": "xyz", "SECOND": "789"}]
+    assert stream.getvalue().splitlines()[0] == "FIRST,SECOND"
+    assert T_inst._rj_cols == {"SECOND"}
+    assert T_inst._cols is columns and list(columns) == ["FIRST", "SECOND"]
+
+
+"""Export Table Methods"""
+# Test write
+@pytest.mark.parametrize(
+    "format, exp_out",
+    [
+        # Test case 1: CSV
+        ("csv", 'FIRST,SECOND\nabc,123\n,456\n"x,z",789\n'), 
+
+        # Test case 2: JSON Lines
+        (
+            "jsonl", 
+            '{"FIRST": "abc", "SECOND": 123}\n' + 
+            '{"FIRST": null, "SECOND": 456}\n' + 
+            '{"FIRST": "x,z", "SECOND": 789}\n'
+        ), 
+
+        # Test case 3: Markdown
+        (
+            "markdown", 
+            "| FIRST | SECOND |\n| --- | ---: |\n| abc | 123 |\n" + 
+            "|  | 456 |\n| x,z | 789 |\n"
+        )
+    ]
+)
+def test_write(T_inst, tmp_path, format, exp_out):
+    # Setup
+    T_inst._cols["FIRST"][2] = "x,z"
+    path = tmp_path / f"table.{format}"
+
+    # Execute
+    T_inst.write(path, format=format)
+
+    # Verify
+    assert path.read_text(encoding="utf-8") == exp_out
+
+
+# Test write by chunks
+def test_write_chunks(mocker, T_inst):
+    # Setup
+    mocker.patch("modules.table.EXPORT_CHUNK", 2)
+    stream = mocker.Mock()
+    T_inst._cols["FIRST"][2] = "x|z"
+
+    # Execute
+    T_inst.write(stream, format="markdown")
+
+    # Verify
+    assert stream.write.call_args_list == [
+        mocker.call("| FIRST | SECOND |\n| --- | ---: |\n" + 
+                    "| abc | 123 |\n|  | 456 |\n"), 
+        mocker.call("| x\\|z | 789 |\n")]
+
+
+# Test write of native values as JSON Lines
+def test_write_jsonl_native():
+    # Setup
+    df = pd.DataFrame({"a": [1, 2], "b": [1.5, np.nan], "c": ["x", None], 
+                       "d": pd.to_datetime(["2024-01-02", None])})
+    T_inst = Table.from_dataframe(df)
+    records = [{"A": 1, "B": 1.5, "C": "x"}, {"A": 2, "C": None}]
+    stream = StringIO()
+
+    # Execute
+    T_inst.write(stream, format="jsonl")
+    Table.from_json(dumps(records)).write(stream, format="jsonl")
+
+    # Verify
+    lines = [loads(line) for line in stream.getvalue().splitlines()]
+    assert lines[:2] == [{"A": 1, "B": 1.5, "C": "x", 
+                          "D": "2024-01-02T00:00:00"}, 
+                         {"A": 2, "B": None, "C": None, "D": None}]
+    assert lines[2:] == records
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(lines[:2]).drop(columns="D").rename(columns=str.lower), 
+        df.drop(columns="d"))
+
+
+# Test write with an unsupported format
+def test_write_invalid(mocker, T_inst):
+    # Setup
+    stream = mocker.Mock()
+
+    # Execute and verify
+    with pytest.raises(ValueError):
+        T_inst.write(stream, format="xml")
+    stream.write.assert_not_called()
 
 
 """Getter Methods"""
@@ -1,4 +1,7 @@
 import pytest
+import numpy as np
+import pandas as pd
+from dateutil.relativedelta import relativedelta
 from modules import utilities as utl
 
 
@@ -23,6 +26,61 @@ def test_abort(mocker, signal):
         mck_ext.assert_not_called()
 
 
+# Test getCalendarDifferences
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        ("2024-01-15", "2029-07-20"),           # Test case 1: Whole parts
+        ("2024-01-31", "2024-02-29"),           # Test case 2: Month end
+        ("2023-02-28", "2024-02-29"),           # Test case 3: Leap day
+        ("2024-03-31", "2024-02-29"),           # Test case 4: Negative
+        ("2024-05-20", "2024-05-10"),           # Test case 5: Days only
+        ("2024-01-01 12:00", "2025-01-01 06:00")  # Test case 6: Time of day
+    ]
+)
+def test_get_calendar_differences(start, end):
+    # Setup
+    exp_out = relativedelta(pd.Timestamp(end), pd.Timestamp(start))
+
+    # Execute
+    act_out = utl.get_calendar_differences([np.datetime64(start)], 
+                                           [np.datetime64(end)])
+
+    # Verify
+    assert (act_out.years[0], act_out.months[0], act_out.days[0]) == (
+        exp_out.years, exp_out.months, exp_out.days)
+
+
+# Test getCalendarDifferences with broadcasting and missing dates
+def test_get_calendar_differences_columns():
+    # Setup
+    start = pd.Timestamp("2025-10-20")
+    ends = pd.Series(pd.to_datetime(["2030-06-15", None, "2026-10-20"]))
+
+    # Execute
+    act_out = utl.get_calendar_differences(start, ends)
+
+    # Verify
+    np.testing.assert_array_equal(act_out.years, [4., np.nan, 1.])
+    np.testing.assert_array_equal(act_out.months, [7., np.nan, 0.])
+    np.testing.assert_array_equal(act_out.days, [26., np.nan, 0.])
+
+
+# Test getCalendarDifferences with missing dates in lists and scalars
+def test_get_calendar_differences_nat():
+    # Setup
+    starts = [pd.Timestamp("2024-01-31"), pd.NaT, None]
+
+    # Execute
+    act_out = utl.get_calendar_differences(starts, "2024-02-29")
+    nat_out = utl.get_calendar_differences(starts, pd.NaT)
+
+    # Verify
+    np.testing.assert_array_equal(act_out.months, [1., np.nan, np.nan])
+    np.testing.assert_array_equal(act_out.days, [0., np.nan, np.nan])
+    assert np.isnan(nat_out.years).all()
+
+
 # Test getCallerInfo
 @pytest.mark.parametrize(
     "call_level, expected_function",
@@ -63,6 +121,30 @@ def test_get_caller_info(call_level, expected_function):
         assert result["line"] == str(call_line)
 
 
+# Test parseSize
+@pytest.mark.parametrize(
+    "text, exp_out",
+    [
+        ("512B", 512),                      # Test case 1: Bytes
+        ("931.5G", 1000190509056),          # Test case 2: lsblk size
+        ("4 KiB", 4096),                    # Test case 3: Binary unit
+        ("1.5gb", 1610612736),              # Test case 4: Lower case
+        ("12", 12),                         # Test case 5: No unit
+        ("G", None),                        # Test case 6: No number
+        ("1.5X", None)                      # Test case 7: Invalid unit
+    ]
+)
+def test_parse_size(text, exp_out):
+    # Execute with exception
+    if exp_out is None:
+        with pytest.raises(ValueError):
+            utl.parse_size(text)
+    
+    # Execute without exception
+    else:
+        assert utl.parse_size(text) == exp_out
+
+
 # Test snakeToCamel
 @pytest.mark.parametrize("str_in, exp_out", [("get_disk", "getDisk")])
 def test_snake_to_camel(str_in, exp_out):
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import scripts.get_disk_script as gd
 from modules import Table
@@ -29,6 +30,62 @@ def T_fxtrs(mocker):
     return {"patch": ptch, "instance": inst, "mock": mck}
 
 
+# Test awaitResponse
+@pytest.mark.parametrize(
+    "with_disks, names, exp_out",
+    [
+        # Test case 1: No disks to poll
+        (False, ["sda"], "a"), 
+
+        # Test case 2: Disks unchanged until the response
+        (True, ["sda"], "a"), 
+
+        # Test case 3: Disk connected before the response
+        (True, ["sda", "sdb"], None)
+    ]
+)
+def test_await_response(mocker, with_disks, names, exp_out):
+    # Setup
+    mocker.patch("scripts.get_disk_script.DISK_POLL", 0.01)
+    disks = Table(table_data=[{"NAME": "sda"}]) if with_disks else None
+    gd_mck = mocker.patch("scripts.get_disk_script.get_disks", 
+                          side_effect=lambda: Table(table_data=[
+                              {"NAME": name} for name in names]))
+    prompt = mocker.Mock()
+
+    async def acall():
+        await asyncio.sleep(0.05)
+        return "a"
+    prompt.acall = acall
+
+    # Execute
+    result = asyncio.run(gd.await_response(prompt, disks))
+
+    # Verify
+    assert result == exp_out
+    assert gd_mck.called == with_disks
+
+
+# Test checkDisk
+@pytest.mark.parametrize("response, exp_abort", [("q", True),    # Test case 1
+                                                 ("Q", True),    # Test case 2
+                                                 ("a", False),   # Test case 3
+                                                 (None, False)]) # Test case 4
+def test_check_disk(mocker, CP_fxtrs, response, exp_abort):
+    # Setup
+    ar_mck = mocker.patch("scripts.get_disk_script.await_response", 
+                          new=mocker.AsyncMock(return_value=response))
+    abort_mck = mocker.patch("scripts.get_disk_script.utl.abort")
+    disks = Table(table_data=[{"NAME": "sda"}])
+
+    # Execute
+    gd.check_disk("caller", disks)
+
+    # Verify
+    ar_mck.assert_awaited_once_with(CP_fxtrs["instance"], disks)
+    abort_mck.assert_called_once_with(exp_abort, "caller")
+
+
 # Test confirmDisk
 @pytest.mark.parametrize("user_response", [True, False])
 def test_confirm_disk(lsblk_mck, T_fxtrs, CP_fxtrs, user_response):
@@ -43,12 +100,14 @@ def test_confirm_disk(lsblk_mck, T_fxtrs, CP_fxtrs, user_response):
     # Verify lsblk call
     lsblk_mck.assert_called_once_with("sda", columns=["NAME", "TYPE", 
                                                       "FSTYPE", "LABEL", 
-                                                      "MOUNTPOINTS"])
+                                                      "MOUNTPOINTS"], 
+                                      as_json=True)
     
     # Verify Table calls
-    T_fxtrs["patch"].assert_called_once_with(title="selected device", 
-                                             table_string=tbl_str)
-    T_fxtrs["instance"].put_table.assert_called_once()
+    T_fxtrs["patch"].from_json.assert_called_once_with(
+        tbl_str, key="blockdevices", flatten=True, title="selected device", 
+        validate="none")
+    T_fxtrs["patch"].from_json.return_value.put_table.assert_called_once()
     
     # Verify ConsolePrompt calls
     CP_fxtrs["patch"].assert_called_once_with(prompt, expect_keystroke=True, 
@@ -78,6 +137,33 @@ def test_get_disks(lsblk_mck, T_fxtrs):
     assert result == T_fxtrs["instance"]
 
 
+# Test reportChanges
+@pytest.mark.parametrize(
+    "previous_names, exp_out",
+    [
+        # Test case 1: No previous listing
+        (None, ""), 
+
+        # Test case 2: No change
+        (["sda", "sdb"], ""), 
+
+        # Test case 3: Disk connected and disk disconnected
+        (["sda", "sdc"], "new device: sdb\nremoved device: sdc\n")
+    ]
+)
+def test_report_changes(previous_names, exp_out, capsys):
+    # Setup
+    disks = Table(table_data=[{"NAME": "sda"}, {"NAME": "sdb"}])
+    previous = (Table(table_data=[{"NAME": name} for name in previous_names]) 
+                if previous_names else None)
+
+    # Execute
+    gd.report_changes(disks, previous)
+
+    # Verify
+    assert capsys.readouterr().out == exp_out
+
+
 # Test selectDisk
 def test_select_disk(M_fxtrs, T_fxtrs):
     # Setup
@@ -112,6 +198,9 @@ def test_get_disk(mocker, T_fxtrs, CP_fxtrs):
                                                  2]  # Iter 3: 2 disks
     T_fxtrs["mock"].get_record.return_value = {"NAME": "sda1"}  # Iter 2
 
+    # Setup reportChanges mock
+    rc_mck = mocker.patch("scripts.get_disk_script.report_changes")
+
     # Setup selectDisk mock
     sd_mck = mocker.patch("scripts.get_disk_script.select_disk")
     sd_mck.return_value = "sda2"  # Iter 3
@@ -124,10 +213,11 @@ def test_get_disk(mocker, T_fxtrs, CP_fxtrs):
     # Setup unmountDisk mock
     ud_mck = mocker.patch("scripts.get_disk_script.cmd.unmount_disk")
 
+    # Setup checkDisk mock
+    ck_mck = mocker.patch("scripts.get_disk_script.check_disk")
+
     # Setup ConsolePrompt mock
-    CP_fxtrs["instance"].call.side_effect = [None,  # Iter 1: No disk
-                                             True,  # Iter 2: Unmount
-                                             True]  # Iter 2: Check disk
+    CP_fxtrs["instance"].call.side_effect = [True]  # Iter 2: Unmount
     
     # Execute
     result = gd.get_disk()
@@ -135,6 +225,9 @@ def test_get_disk(mocker, T_fxtrs, CP_fxtrs):
     # Verify first iteration call
     mck_con.put_script_banner.called_once_with(cf_mck)
     
+    # Verify disks checked in the first and second iterations
+    ck_mck.assert_has_calls([mocker.call(mocker.ANY, T_fxtrs["mock"])] * 2)
+
     # Verify second iteration calls
     cd_mck.assert_any_call("sda1")
     ud_mck.assert_called_once_with("sda1")
@@ -143,8 +236,52 @@ def test_get_disk(mocker, T_fxtrs, CP_fxtrs):
     sd_mck.assert_called_once_with(T_fxtrs["mock"])
     cd_mck.assert_any_call("sda2")
 
+    # Verify change reports against the previous listing
+    rc_mck.assert_has_calls([mocker.call(T_fxtrs["mock"], None), 
+                             mocker.call(T_fxtrs["mock"], T_fxtrs["mock"]), 
+                             mocker.call(T_fxtrs["mock"], T_fxtrs["mock"])])
+
     # Verify call counts and result
     assert gd_mck.call_count == 3
-    assert CP_fxtrs["patch"].call_count == 3
+    assert CP_fxtrs["patch"].call_count == 1
     assert cd_mck.call_count == 2
     assert result == "sda2"
+
+
+# Test main
+@pytest.mark.parametrize("argv", [[],                     # Test case 1
+                                  ["--format", "jsonl"],  # Test case 2
+                                  ["--watch", "0.5"]])    # Test case 3
+def test_main(mocker, argv):
+    # Setup
+    mck_con = mocker.patch("scripts.get_disk_script.Console")
+    gd_mck = mocker.patch("scripts.get_disk_script.get_disk")
+    gds_mck = mocker.patch("scripts.get_disk_script.get_disks")
+
+    # Execute
+    gd.main(argv)
+
+    # Verify
+    if "--format" in argv:
+        gds_mck.return_value.write.assert_called_once_with(gd.stdout, 
+                                                           format="jsonl")
+        gd_mck.assert_not_called()
+    elif "--watch" in argv:
+        gds_mck.return_value.put_live.assert_called_once_with(gds_mck, 
+                                                              interval=0.5)
+        gd_mck.assert_not_called()
+    else:
+        mck_con.clear_screen.assert_called_once()
+        gd_mck.assert_called_once()
+        gds_mck.assert_not_called()
+
+
+# Test main with an unsupported format
+def test_main_invalid_format(mocker):
+    # Setup
+    gds_mck = mocker.patch("scripts.get_disk_script.get_disks")
+
+    # Execute and verify
+    with pytest.raises(SystemExit):
+        gd.main(["--format", "xml"])
+    gds_mck.assert_not_called()